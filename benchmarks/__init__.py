@@ -0,0 +1 @@
+"""Benchmarks of hot paths. Run as module: `python -m benchmarks.<name>`."""
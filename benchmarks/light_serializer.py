@@ -0,0 +1,77 @@
+"""Compares `BACnetObj.to_http_str()` with `LightSerializer` on 10k objects.
+
+Usage: `python -m benchmarks.light_serializer [--objects 10000] [--changed 0.1]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+
+from visiobas_gateway.schemas import BACnetObj, ObjType, StatusFlags
+from visiobas_gateway.serializer import LightSerializer
+
+_DISABLED_FLAGS = StatusFlags(flags=0b1011)
+
+
+def _make_objs(quantity: int) -> list[BACnetObj]:
+    types = (ObjType.ANALOG_INPUT, ObjType.ANALOG_OUTPUT, ObjType.BINARY_INPUT)
+    return [
+        BACnetObj(
+            **{
+                "75": i,
+                "79": types[i % len(types)],
+                "846": 1,
+                "77": f"Site:Block/Obj{i}",
+                "371": json.dumps({"template": "", "alias": "", "replace": {}}),
+                "85": random.random() * 100,
+                "87": [None] * 8 + [40.5] + [None] * 7,
+                "103": "no-fault-detected",
+                "111": [False, False, False, False],
+            }
+        )
+        for i in range(quantity)
+    ]
+
+
+def _join(objs: list[BACnetObj]) -> bytes:
+    return "".join(
+        obj.to_http_str(obj=obj, disabled_flags=_DISABLED_FLAGS) for obj in objs
+    ).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument(
+        "--changed", type=float, default=0.1, help="Share of changed objects."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    objs = _make_objs(quantity=args.objects)
+    serializer = LightSerializer(disabled_flags=_DISABLED_FLAGS)
+    assert serializer.serialize(objs=objs) == _join(objs=objs)
+
+    changed = objs[: int(len(objs) * args.changed)]
+
+    def _change() -> None:
+        for obj in changed:
+            obj.present_value = random.random() * 100
+
+    cases = {
+        "join to_http_str": lambda: _join(objs=objs),
+        "serializer, unchanged": lambda: serializer.serialize(objs=objs),
+        "serializer, changed": lambda: (_change(), serializer.serialize(objs=objs)),
+        "join to_http_str, changed": lambda: (_change(), _join(objs=objs)),
+    }
+    print(f"{args.objects} objects, {args.changed:.0%} changed per round")
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:>28}: {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measures throughput of QoS 1 publishes against local broker stand-in.
+
+Compares sequential publishes (window 1) with pipelined ones. Broker stand-in
+acknowledges each message after `--ack-delay` seconds, which simulates round trip to
+real broker.
+
+Usage: `python -m benchmarks.mqtt_publish [--messages 10000] [--ack-delay 0.001]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from visiobas_gateway.clients import mqtt_protocol as proto
+from visiobas_gateway.clients.mqtt import MQTTClient
+from visiobas_gateway.schemas.settings import MQTTSettings
+
+
+class BrokerStandIn:
+    """Accepts connection, acknowledges QoS 1 publishes after delay."""
+
+    def __init__(self, ack_delay: float):
+        self._ack_delay = ack_delay
+        self.received = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        await proto.read_packet(reader)  # CONNECT
+        writer.write(b"\x20\x02\x00\x00")
+        while True:
+            try:
+                packet = await proto.read_packet(reader)
+            except asyncio.IncompleteReadError:
+                return None
+            if packet.type is proto.PacketType.PUBLISH:
+                self.received += 1
+                message = proto.parse_publish(packet=packet)
+                if message.packet_id is not None:
+                    loop.call_later(
+                        self._ack_delay,
+                        writer.write,
+                        proto.ack(proto.PacketType.PUBACK, message.packet_id),
+                    )
+            elif packet.type is proto.PacketType.PINGREQ:
+                writer.write(proto.PINGRESP)
+            elif packet.type is proto.PacketType.DISCONNECT:
+                return None
+
+
+async def _publish(port: int, messages: int, window: int) -> float:
+    settings = MQTTSettings(
+        url=f"mqtt://127.0.0.1:{port}",
+        qos=1,
+        retain=False,
+    )
+    client = MQTTClient(gateway=None, settings=settings)  # type: ignore
+    await client.start()
+    await client.wait_connect(timeout=5)
+
+    semaphore = asyncio.Semaphore(window)
+    payload = b"846 75 0 22.5 0"
+
+    async def _publish_one(topic: str) -> None:
+        async with semaphore:
+            await client.publish(topic=topic, payload=payload, qos=1)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[_publish_one(topic=f"Site/Dev/AI{i}") for i in range(messages)])
+    elapsed = time.perf_counter() - started
+
+    await client.stop()
+    return elapsed
+
+
+async def _main(messages: int, ack_delay: float, windows: list[int]) -> None:
+    broker = BrokerStandIn(ack_delay=ack_delay)
+    server = await asyncio.start_server(broker.handle, host="127.0.0.1", port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    print(f"{messages} QoS 1 messages, broker ack delay {ack_delay * 1000:.1f} ms")
+    for window in windows:
+        # Sequential publishes are limited by ack delay, so fewer messages are sent.
+        quantity = messages if window > 1 else min(messages, 1000)
+        elapsed = await _publish(port=port, messages=quantity, window=window)
+        print(f"window {window:>5}: {quantity / elapsed:10.0f} msg/s")
+
+    await asyncio.sleep(0.1)  # Lets broker stand-in handle last disconnection.
+    server.close()
+    await server.wait_closed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument(
+        "--ack-delay", type=float, default=0.001, help="Seconds before PUBACK."
+    )
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 32, 256])
+    args = parser.parse_args()
+    asyncio.run(
+        _main(messages=args.messages, ack_delay=args.ack_delay, windows=args.windows)
+    )
+
+
+if __name__ == "__main__":
+    main()
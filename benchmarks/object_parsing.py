@@ -0,0 +1,72 @@
+"""Compares parsing of downloaded objects by full schema with `ObjectParser`.
+
+Usage: `python -m benchmarks.object_parsing [--sizes 1000 10000 50000]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable
+
+from visiobas_gateway.parser import ObjectParser
+from visiobas_gateway.schemas import BACnetObj
+
+_PROPERTY_LISTS = [
+    json.dumps({"template": "", "alias": "", "replace": {}, "pollPeriod": period})
+    for period in (5, 10, 30, 60, 90)
+]
+_TYPES = ("analog-input", "analog-output", "binary-input", "binary-value")
+
+
+def _make_payload(quantity: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "75": i,
+            "77": f"Site:Block/Obj{i}",
+            "79": _TYPES[i % len(_TYPES)],
+            "846": 1,
+            "371": random.choice(_PROPERTY_LISTS),
+            "85": random.random() * 100,
+            "87": None,
+            "103": "no-fault-detected",
+            "106": 0.1,
+            "111": [False, False, False, False],
+            "timestamp": "2011-11-11 11:11:11",
+        }
+        for i in range(quantity)
+    ]
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t_0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t_0)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        payload = _make_payload(quantity=size)
+        strict = _measure(lambda: [BACnetObj(**data) for data in payload], args.repeat)
+        # New parser for each run: includes compilation of plans and cold caches.
+        fast = _measure(
+            lambda: ObjectParser(cls=BACnetObj).parse_many(payload=payload), args.repeat
+        )
+        print(
+            f"{size:>7} objects: full schema {strict * 1000:9.1f} ms, "
+            f"fast path {fast * 1000:9.1f} ms, x{strict / fast:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
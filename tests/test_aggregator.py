@@ -0,0 +1,72 @@
+import pytest
+
+from visiobas_gateway.aggregator import ObjAggregate, ObjAggregator
+
+
+class TestObjAggregate:
+    def test_add_happy(self, bacnet_obj_factory):
+        bacnet_obj = bacnet_obj_factory()
+        aggregate = ObjAggregate(obj=bacnet_obj)
+
+        for value in (2, 6, 1):
+            bacnet_obj.verified_present_value = value
+            aggregate.add(obj=bacnet_obj)
+
+        assert aggregate.obj is not bacnet_obj
+        assert aggregate.obj.verified_present_value == 1
+        assert aggregate.count == 3
+        assert aggregate.numeric_count == 3
+        assert aggregate.min == 1
+        assert aggregate.max == 6
+        assert aggregate.mean == pytest.approx(3)
+
+    def test_add_copies_obj(self, bacnet_obj_factory):
+        bacnet_obj = bacnet_obj_factory(verified_present_value=10)
+        bacnet_obj.present_value = 10
+        aggregate = ObjAggregate(obj=bacnet_obj)
+        aggregate.add(obj=bacnet_obj)
+
+        bacnet_obj.set_property(value=ValueError("Polling"))
+        bacnet_obj.status_flags.flags = 0b0010
+
+        assert aggregate.obj.present_value == 10
+        assert aggregate.obj.status_flags.flags == 0b0000
+
+    def test_add_null(self, bacnet_obj_factory):
+        bacnet_obj = bacnet_obj_factory(verified_present_value="null")
+        aggregate = ObjAggregate(obj=bacnet_obj)
+        aggregate.add(obj=bacnet_obj)
+
+        assert aggregate.count == 1
+        assert aggregate.numeric_count == 0
+        assert aggregate.min is None
+        assert aggregate.max is None
+        assert aggregate.mean is None
+
+    def test_to_mqtt_str(self, bacnet_obj_factory):
+        bacnet_obj = bacnet_obj_factory(**{"75": 1}, verified_present_value="null")
+        aggregate = ObjAggregate(obj=bacnet_obj)
+        aggregate.add(obj=bacnet_obj)
+
+        assert aggregate.to_mqtt_str() == "846 1 0 1 null null null"
+
+
+class TestObjAggregator:
+    def test_add_flush(self, bacnet_obj_factory):
+        aggregator = ObjAggregator()
+        obj_1 = bacnet_obj_factory(**{"75": 1}, verified_present_value=10)
+        obj_2 = bacnet_obj_factory(**{"75": 2}, verified_present_value=20)
+
+        aggregator.add(objs=[obj_1, obj_2])
+        aggregator.add(objs=[obj_1])
+        assert len(aggregator) == 2
+
+        aggregates = {
+            aggregate.obj.object_id: aggregate for aggregate in aggregator.flush()
+        }
+        assert aggregates[1].count == 2
+        assert aggregates[2].count == 1
+        assert aggregates[2].mean == 20
+
+        assert len(aggregator) == 0
+        assert aggregator.flush() == []
@@ -0,0 +1,330 @@
+from types import SimpleNamespace
+
+import pytest
+
+from visiobas_gateway.api.jsonrpc.methods import (
+    RPC_METHODS,
+    dispatch,
+    dispatch_batch,
+    get_device,
+    get_values,
+    write_set_points,
+)
+from visiobas_gateway.api.jsonrpc.schemas import (
+    JsonRPCGetDeviceParams,
+    JsonRPCGetValuesParams,
+    JsonRPCSetPointsParams,
+)
+from visiobas_gateway.schemas import ObjType
+
+_PARAMS = {
+    "device_id": "846",
+    "object_type": "1",
+    "object_id": "75",
+    "property": "85",
+    "priority": "8",
+    "value": "22.22",
+}
+
+
+class TestDispatch:
+    async def test_result(self, mocker):
+        write_set_point = mocker.AsyncMock(return_value={"success": True})
+        mocker.patch.dict(RPC_METHODS, {"writeSetPoint": write_set_point})
+        gateway = SimpleNamespace(cluster=None)
+
+        response = await dispatch(
+            gateway=gateway,
+            request={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "writeSetPoint",
+                "params": _PARAMS,
+            },
+        )
+
+        assert response == {"jsonrpc": "2.0", "id": 1, "result": {"success": True}}
+        assert write_set_point.call_args.args[0] is gateway
+        assert write_set_point.call_args.args[1].device_id == 846
+
+    async def test_routed_to_cluster(self, mocker):
+        cluster = SimpleNamespace(call=mocker.AsyncMock(return_value={"success": True}))
+
+        await dispatch(
+            gateway=SimpleNamespace(cluster=cluster),
+            request={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "writeSetPoint",
+                "params": _PARAMS,
+            },
+        )
+
+        cluster.call.assert_awaited_once_with(
+            device_id=846, method="writeSetPoint", params=_PARAMS
+        )
+
+    async def test_notification(self, mocker):
+        mocker.patch.dict(
+            RPC_METHODS, {"writeSetPoint": mocker.AsyncMock(return_value={"success": True})}
+        )
+
+        response = await dispatch(
+            gateway=SimpleNamespace(cluster=None),
+            request={"jsonrpc": "2.0", "method": "writeSetPoint", "params": _PARAMS},
+        )
+
+        assert response is None
+
+    async def test_errors(self):
+        gateway = SimpleNamespace(cluster=None, get_device=lambda dev_id: None)
+
+        not_found = await dispatch(
+            gateway=gateway, request={"jsonrpc": "2.0", "id": 1, "method": "ptz"}
+        )
+        positional = await dispatch(
+            gateway=gateway,
+            request={"jsonrpc": "2.0", "id": 2, "method": "writeSetPoint", "params": [1]},
+        )
+        failed = await dispatch(
+            gateway=gateway,
+            request={
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "writeSetPoint",
+                "params": _PARAMS,
+            },
+        )
+
+        assert not_found["error"]["code"] == -32601
+        assert positional["error"]["code"] == -32602
+        assert failed == {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "error": {"code": -32000, "message": "Device 846 not found."},
+        }
+
+
+def _batch_params(*writes):
+    return JsonRPCSetPointsParams(writes=[{**_PARAMS, **write} for write in writes])
+
+
+@pytest.fixture
+def polling_device(mocker):
+    """Device, which objects have value `22.22` after write."""
+
+    async def write_many_with_check(requests):
+        return [
+            ValueError("Failed") if request.value < 0 else (request.obj, None)
+            for request in requests
+        ]
+
+    device = SimpleNamespace(
+        write_many_with_check=mocker.AsyncMock(side_effect=write_many_with_check)
+    )
+    mocker.patch(
+        "visiobas_gateway.api.jsonrpc.methods.get_obj",
+        side_effect=lambda obj_id, obj_type_id, device: SimpleNamespace(
+            object_id=obj_id, object_type=ObjType(obj_type_id), present_value=22.22
+        ),
+    )
+    return device
+
+
+class TestWriteSetPoints:
+    async def test_grouped_by_device(self, mocker, polling_device):
+        def get_polling_device(gateway, device_id):
+            if device_id == 846:
+                return polling_device
+            raise Exception(f"Device {device_id} not found.")
+
+        mocker.patch(
+            "visiobas_gateway.api.jsonrpc.methods.get_polling_device",
+            side_effect=get_polling_device,
+        )
+        gateway = SimpleNamespace(
+            cluster=None,
+            _scheduler=SimpleNamespace(spawn=mocker.AsyncMock()),
+            send_objects=mocker.Mock(),
+        )
+
+        response = await write_set_points(
+            gateway=gateway,
+            params=_batch_params(
+                {},
+                {"device_id": "847"},
+                {"object_id": "76", "value": "1"},
+                {"object_id": "77", "value": "-1"},
+            ),
+        )
+
+        assert response["success"] is False
+        assert response["results"][0] == {"success": True}
+        assert response["results"][1] == {"success": False, "msg": "Device 847 not found."}
+        assert response["results"][2]["debug"] == {"written_value": 1, "read_value": 22.22}
+        assert response["results"][3] == {"success": False, "msg": "Failed"}
+
+        polling_device.write_many_with_check.assert_awaited_once()
+        gateway._scheduler.spawn.assert_awaited_once()
+        written_objs = gateway.send_objects.call_args.kwargs["objs"]
+        assert [obj.object_id for obj in written_objs] == [75, 76]
+
+    async def test_routed_to_cluster(self, mocker):
+        cluster = SimpleNamespace(
+            call=mocker.AsyncMock(return_value={"results": [{"success": True}] * 2})
+        )
+
+        response = await write_set_points(
+            gateway=SimpleNamespace(cluster=cluster),
+            params=_batch_params({}, {"object_id": "76"}),
+        )
+
+        assert response == {"success": True, "results": [{"success": True}] * 2}
+        cluster.call.assert_awaited_once()
+        writes = cluster.call.call_args.kwargs["params"]["writes"]
+        assert writes[1] == {
+            "device_id": 846,
+            "object_type": 1,
+            "object_id": 76,
+            "property": 85,
+            "priority": 8,
+            "value": 22.22,
+        }
+
+
+class TestDispatchBatch:
+    async def test_writes_grouped(self, mocker):
+        write_set_points_ = mocker.patch(
+            "visiobas_gateway.api.jsonrpc.methods.write_set_points",
+            return_value={"success": True, "results": [{"success": True}] * 2},
+        )
+        write = {"jsonrpc": "2.0", "method": "writeSetPoint", "params": _PARAMS}
+
+        responses = await dispatch_batch(
+            gateway=SimpleNamespace(cluster=None),
+            requests=[
+                {**write, "id": 1},
+                {"jsonrpc": "2.0", "id": 2, "method": "ptz"},
+                write,
+                1,
+            ],
+        )
+
+        assert len(write_set_points_.call_args.kwargs["params"].writes) == 2
+        assert responses == [
+            {"jsonrpc": "2.0", "id": 1, "result": {"success": True}},
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "error": {"code": -32601, "message": "Method 'ptz' not found"},
+            },
+            {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "Invalid Request"},
+            },
+        ]
+
+    async def test_empty(self):
+        response = await dispatch_batch(gateway=SimpleNamespace(cluster=None), requests=[])
+
+        assert response["error"]["code"] == -32600
+
+
+@pytest.fixture
+def cached_device(bacnet_obj_factory, mocker):
+    """Device with objects `(0, 1)`, `(0, 2)`. Objects are re-read by `read_fresh`."""
+    objs = {
+        (obj.object_id, obj.object_type.value): obj
+        for obj in (
+            bacnet_obj_factory(**{"75": 1, "79": "analog-input"}),
+            bacnet_obj_factory(**{"75": 2, "79": "analog-input"}),
+        )
+    }
+    for obj in objs.values():
+        obj.verified_present_value = 1.5
+        obj.updated = None
+
+    device = SimpleNamespace(
+        id=846,
+        object_groups={60: objs},
+        get_object=lambda object_id, object_type_id: objs.get((object_id, object_type_id)),
+        read_fresh=mocker.AsyncMock(side_effect=lambda obj, max_age: obj),
+    )
+    mocker.patch(
+        "visiobas_gateway.api.jsonrpc.methods.get_polling_device",
+        side_effect=lambda gateway, device_id: device,
+    )
+    return device
+
+
+class TestGetValues:
+    async def test_cached(self, cached_device):
+        response = await get_values(
+            gateway=SimpleNamespace(cluster=None),
+            params=JsonRPCGetValuesParams(
+                objects=[
+                    {"device_id": 846, "object_type": 0, "object_id": 2},
+                    {"device_id": 846, "object_type": "analog-input", "object_id": 3},
+                ]
+            ),
+        )
+
+        assert response["values"] == [
+            {
+                "device_id": 846,
+                "object_type": 0,
+                "object_id": 2,
+                "value": 1.5,
+                "status_flags": 0,
+                "reliability": 0,
+                "age": None,
+            },
+            {
+                "device_id": 846,
+                "object_type": 0,
+                "object_id": 3,
+                "error": "Object (0, 3) not found in device 846.",
+            },
+        ]
+        cached_device.read_fresh.assert_not_called()
+
+    async def test_max_age(self, cached_device):
+        await get_values(
+            gateway=SimpleNamespace(cluster=None),
+            params=JsonRPCGetValuesParams(
+                objects=[{"device_id": 846, "object_type": 0, "object_id": 1}], maxAge=5
+            ),
+        )
+
+        cached_device.read_fresh.assert_awaited_once()
+        assert cached_device.read_fresh.call_args.kwargs["max_age"] == 5
+
+    async def test_routed_to_cluster(self, mocker):
+        cluster = SimpleNamespace(call=mocker.AsyncMock(return_value={"values": [{}]}))
+
+        await get_values(
+            gateway=SimpleNamespace(cluster=cluster),
+            params=JsonRPCGetValuesParams(
+                objects=[{"device_id": 846, "object_type": 0, "object_id": 1}], maxAge=5
+            ),
+        )
+
+        cluster.call.assert_awaited_once_with(
+            device_id=846,
+            method="getValues",
+            params={
+                "objects": [{"device_id": 846, "object_type": 0, "object_id": 1}],
+                "maxAge": 5,
+            },
+        )
+
+
+async def test_get_device(cached_device):
+    response = await get_device(
+        gateway=SimpleNamespace(cluster=None),
+        params=JsonRPCGetDeviceParams(device_id=846),
+    )
+
+    assert response["device_id"] == 846
+    assert [value["object_id"] for value in response["values"]] == [1, 2]
@@ -0,0 +1,70 @@
+from visiobas_gateway.api.stream import StreamHub
+from visiobas_gateway.utils.telemetry_codec import TelemetryRecord
+
+
+def _record(obj_id, value):
+    return TelemetryRecord(
+        object_id=obj_id, object_type=0, value=value, status_flags=0, timestamp=0.0
+    )
+
+
+class TestStreamSubscriber:
+    async def test_coalesced_and_filtered(self):
+        hub = StreamHub(max_pending=10)
+        subscriber = hub.add()
+        subscriber.subscribe(devices=[846], objects=[(847, 0, 1)])
+
+        hub.put(device_id=846, records=[_record(1, 1.0), _record(2, 2.0)])
+        hub.put(device_id=846, records=[_record(1, 1.5)])
+        hub.put(device_id=847, records=[_record(1, 3.0), _record(2, 4.0)])
+
+        assert await subscriber.get() == [
+            (846, _record(2, 2.0)),
+            (846, _record(1, 1.5)),
+            (847, _record(1, 3.0)),
+        ]
+        assert subscriber.coalesced == 1
+
+    async def test_oldest_dropped(self):
+        hub = StreamHub(max_pending=2)
+        subscriber = hub.add()
+        subscriber.subscribe(devices=[846], objects=[])
+
+        hub.put(device_id=846, records=[_record(i, float(i)) for i in range(3)])
+
+        assert [record.object_id for _, record in await subscriber.get()] == [1, 2]
+        assert subscriber.dropped == 1
+
+    def test_removed(self):
+        hub = StreamHub(max_pending=2)
+        subscriber = hub.add()
+        subscriber.subscribe(devices=[846], objects=[])
+
+        hub.remove(subscriber=subscriber)
+        hub.put(device_id=846, records=[_record(1, 1.0)])
+
+        assert len(hub) == 0
+        assert subscriber.depth == 0
+
+
+class TestStreamHub:
+    async def test_only_changes_streamed(self):
+        hub = StreamHub(max_pending=10)
+        subscriber = hub.add()
+        subscriber.subscribe(devices=[846], objects=[])
+
+        hub.put(device_id=846, records=[_record(1, 1.0), _record(2, 2.0)])
+        await subscriber.get()
+        hub.put(device_id=846, records=[_record(1, 1.0), _record(2, 2.5)])
+
+        assert await subscriber.get() == [(846, _record(2, 2.5))]
+
+    async def test_last_values_on_subscribe(self):
+        hub = StreamHub(max_pending=10)
+        hub.put(device_id=846, records=[_record(1, 1.0)])
+        hub.put(device_id=847, records=[_record(1, 3.0)])
+        subscriber = hub.add()
+
+        hub.subscribe(subscriber=subscriber, devices=[846], objects=[])
+
+        assert await subscriber.get() == [(846, _record(1, 1.0))]
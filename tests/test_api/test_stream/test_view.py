@@ -0,0 +1,71 @@
+import asyncio
+
+from aiohttp.web import Application
+
+from visiobas_gateway.api.stream import StreamHub, StreamView
+from visiobas_gateway.utils.telemetry_codec import TelemetryRecord
+
+
+async def test_stream(aiohttp_client):
+    hub = StreamHub(max_pending=10)
+    app = Application()
+    app["streams"] = hub
+    app.router.add_route("*", StreamView.URL_PATH, StreamView)
+    client = await aiohttp_client(app)
+
+    async with client.ws_connect(StreamView.URL_PATH) as ws:
+        await ws.send_json({"subscribe": {"objects": [[846, 0, 1]]}})
+        assert await ws.receive_json() == {
+            "subscribed": {"devices": [], "objects": [[846, 0, 1]]}
+        }
+        hub.put(
+            device_id=846,
+            records=[
+                TelemetryRecord(
+                    object_id=1, object_type=0, value=1.5, status_flags=0, timestamp=1.0
+                )
+            ],
+        )
+        assert await ws.receive_json() == {"values": [[846, 1, 0, 1.5, 0, 1.0]]}
+
+        await ws.send_json({"ptz": {}})
+        assert "error" in await ws.receive_json()
+
+    for _ in range(100):
+        if not len(hub):
+            break
+        await asyncio.sleep(0.01)
+    assert len(hub) == 0
+
+
+async def test_unknown_codec(aiohttp_client):
+    app = Application()
+    app["streams"] = StreamHub(max_pending=10)
+    app.router.add_route("*", StreamView.URL_PATH, StreamView)
+    client = await aiohttp_client(app)
+
+    response = await client.get(StreamView.URL_PATH, params={"codec": "xml"})
+
+    assert response.status == 400
+
+
+async def test_send_failure_closes_connection(mocker):
+    hub = StreamHub(max_pending=10)
+    subscriber = hub.add()
+    subscriber.subscribe(devices=[846], objects=[])
+    hub.put(
+        device_id=846,
+        records=[
+            TelemetryRecord(
+                object_id=1, object_type=0, value=1.5, status_flags=0, timestamp=1.0
+            )
+        ],
+    )
+    ws = mocker.Mock(
+        send_str=mocker.AsyncMock(side_effect=RuntimeError("Transport closed")),
+        close=mocker.AsyncMock(),
+    )
+
+    await StreamView._send(ws=ws, subscriber=subscriber, codec="json")
+
+    ws.close.assert_awaited_once()
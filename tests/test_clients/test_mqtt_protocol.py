@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from visiobas_gateway.clients import mqtt_protocol as proto
+
+
+async def _read(data: bytes) -> proto.Packet:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return await proto.read_packet(reader)
+
+
+@pytest.mark.parametrize(
+    "qos,packet_id,payload",
+    [(0, None, b"1 75 0 22.5 0"), (1, 10, b"x" * 200), (2, 65535, b"")],
+)
+async def test_publish_roundtrip(qos, packet_id, payload):
+    data = proto.publish(
+        topic="Site/Dev/AI1", payload=payload, qos=qos, retain=True, packet_id=packet_id
+    )
+    packet = await _read(data)
+
+    assert packet.type is proto.PacketType.PUBLISH
+    assert proto.parse_publish(packet=packet) == proto.Message(
+        topic="Site/Dev/AI1", payload=payload, qos=qos, retain=True, packet_id=packet_id
+    )
+
+
+async def test_remaining_length():
+    data = proto.publish(topic="t", payload=b"x" * 20_000, qos=0, retain=False)
+    assert data[1:4] == b"\xa3\x9c\x01"
+
+    packet = await _read(data)
+    assert len(packet.body) == 20_003
+
+
+def test_connect():
+    data = proto.connect(client_id="gtw", keepalive=60, username="user", password="pass")
+
+    assert data[0] == 0x10
+    assert data[2:12] == b"\x00\x04MQTT\x04\xc2\x00\x3c"
+    assert data.endswith(b"\x00\x04user\x00\x04pass")
+
+
+def test_qos_requires_packet_id():
+    with pytest.raises(ValueError):
+        proto.publish(topic="t", payload=b"", qos=1, retain=False)
+
+
+async def test_ack():
+    packet = await _read(proto.ack(proto.PacketType.PUBREL, 258))
+
+    assert packet.flags == 0x02
+    assert proto.ack_id(packet=packet) == 258
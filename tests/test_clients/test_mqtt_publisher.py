@@ -0,0 +1,115 @@
+import asyncio
+
+from visiobas_gateway.aggregator import ObjAggregate
+from visiobas_gateway.clients.mqtt_publisher import MQTTPublisher
+from visiobas_gateway.schemas.mqtt import Codec
+from visiobas_gateway.utils.telemetry_codec import TelemetryRecord, decode
+
+
+class TestMQTTPublisher:
+    @staticmethod
+    def _create_publisher(**kwargs) -> tuple[MQTTPublisher, list, asyncio.Event]:
+        published = []
+        acked = asyncio.Event()
+
+        async def publish(topic: str, payload: str, qos: int, retain: bool) -> None:
+            published.append((topic, payload, qos, retain))
+            await acked.wait()
+
+        kwargs = {"qos": 1, "retain": True, "window": 2, "max_pending": 10, **kwargs}
+        return MQTTPublisher(publish=publish, **kwargs), published, acked
+
+    def test_messages_per_object(self, bacnet_obj_factory):
+        publisher, _, _ = self._create_publisher()
+        obj = bacnet_obj_factory(**{"85": 1.5})
+
+        assert publisher.messages(objs=[obj]) == {"Name/Name/Name/Name": obj.to_mqtt_str()}
+
+    def test_messages_per_device(self, bacnet_obj_factory):
+        publisher, _, _ = self._create_publisher(device_topic="devices/{device_id}")
+        objs = [
+            bacnet_obj_factory(**{"75": 1, "77": "Site:Dev.AI1"}),
+            bacnet_obj_factory(**{"75": 2, "77": "Site:Dev.AI2"}),
+        ]
+
+        assert publisher.messages(objs=objs) == {
+            "devices/846": "\n".join(obj.to_mqtt_str() for obj in objs)
+        }
+
+    def test_messages_stats(self, bacnet_obj_factory):
+        publisher, _, _ = self._create_publisher(device_topic="devices/{device_id}")
+        obj = bacnet_obj_factory(**{"75": 1}, verified_present_value=2.5)
+        aggregate = ObjAggregate(obj=obj)
+        aggregate.add(obj=obj)
+
+        assert publisher.messages(objs=[obj], aggregates=[aggregate]) == {
+            "devices/846": obj.to_mqtt_str(),
+            "devices/846/stats": "846 1 0 1 2.5 2.5 2.5",
+        }
+
+    async def test_window(self, bacnet_obj_factory):
+        publisher, published, acked = self._create_publisher()
+        publisher.start()
+        publisher.put(
+            objs=[
+                bacnet_obj_factory(**{"75": i, "77": f"Site:Dev.AI{i}"}) for i in range(3)
+            ]
+        )
+
+        await asyncio.sleep(0.01)
+        assert [topic for topic, *_ in published] == ["Site/Dev/AI0", "Site/Dev/AI1"]
+        assert published[0][2:] == (1, True)
+        assert publisher.stats["in_flight"] == 2
+        assert publisher.depth == 1
+        assert publisher.window_waits == 1
+
+        acked.set()
+        await asyncio.sleep(0.01)
+        assert len(published) == 3
+        assert publisher.published == 3
+        assert publisher.window_wait_time > 0
+        await publisher.close()
+
+    def test_drop_oldest_and_coalesce(self, bacnet_obj_factory):
+        publisher, _, _ = self._create_publisher(max_pending=2)
+
+        publisher.put(objs=[bacnet_obj_factory(**{"75": 1, "77": "Site:Dev.AI1"})])
+        publisher.put(objs=[bacnet_obj_factory(**{"75": 1, "77": "Site:Dev.AI1"})])
+        publisher.put(objs=[bacnet_obj_factory(**{"75": 2, "77": "Site:Dev.AI2"})])
+        publisher.put(objs=[bacnet_obj_factory(**{"75": 3, "77": "Site:Dev.AI3"})])
+
+        assert publisher.coalesced == 1
+        assert publisher.dropped == 1
+        assert list(publisher._pending) == ["Site/Dev/AI2", "Site/Dev/AI3"]
+
+    async def test_failed_publish_releases_window(self, bacnet_obj_factory):
+        async def publish(topic: str, payload: str, qos: int, retain: bool) -> None:
+            raise ConnectionError("not connected")
+
+        publisher = MQTTPublisher(
+            publish=publish, qos=0, retain=False, window=1, max_pending=10
+        )
+        publisher.start()
+        publisher.put(
+            objs=[
+                bacnet_obj_factory(**{"75": i, "77": f"Site:Dev.AI{i}"}) for i in range(3)
+            ]
+        )
+
+        await asyncio.sleep(0.01)
+        assert publisher.failed == 3
+        assert publisher.depth == 0
+        await publisher.close()
+
+    def test_messages_binary_codec(self, bacnet_obj_factory):
+        publisher, _, _ = self._create_publisher(
+            device_topic="devices/{device_id}", codec=Codec.CBOR
+        )
+        obj = bacnet_obj_factory(**{"85": 1.5})
+
+        messages = publisher.messages(objs=[obj])
+
+        assert list(messages) == ["devices/846/cbor"]
+        assert decode(payload=messages["devices/846/cbor"], codec=Codec.CBOR) == [
+            TelemetryRecord.from_obj(obj=obj)
+        ]
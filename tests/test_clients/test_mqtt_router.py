@@ -0,0 +1,64 @@
+import pytest
+
+from visiobas_gateway.clients.mqtt_router import TopicRouter, validate_filter
+
+
+async def _handler_a(message):
+    pass
+
+
+async def _handler_b(message):
+    pass
+
+
+class TestTopicRouter:
+    @pytest.mark.parametrize(
+        "topic_filter,topic,matched",
+        [
+            ("site/dev/ai1", "site/dev/ai1", True),
+            ("site/dev/ai1", "site/dev/ai2", False),
+            ("site/+/ai1", "site/dev/ai1", True),
+            ("site/+", "site/dev/ai1", False),
+            ("site/#", "site/dev/ai1", True),
+            ("site/#", "site", True),
+            ("#", "site/dev", True),
+            ("+/+", "/dev", True),
+            ("#", "$SYS/broker", False),
+            ("+/broker", "$SYS/broker", False),
+            ("$SYS/#", "$SYS/broker", True),
+        ],
+    )
+    def test_match(self, topic_filter, topic, matched):
+        router = TopicRouter()
+        router.add(topic_filter=topic_filter, handler=_handler_a)
+
+        assert router.match(topic=topic) == ([_handler_a] if matched else [])
+
+    def test_match_several(self):
+        router = TopicRouter()
+        router.add(topic_filter="site/+/ai1", handler=_handler_a)
+        router.add(topic_filter="site/#", handler=_handler_b)
+        router.add(topic_filter="site/dev/ai1", handler=_handler_b)
+
+        assert sorted(
+            router.match(topic="site/dev/ai1"), key=lambda handler: handler.__name__
+        ) == [_handler_a, _handler_b, _handler_b]
+
+    def test_remove(self):
+        router = TopicRouter()
+        router.add(topic_filter="site/+/ai1", handler=_handler_a)
+        router.add(topic_filter="site/+/ai1", handler=_handler_b)
+
+        router.remove(topic_filter="site/+/ai1", handler=_handler_a)
+        assert router.match(topic="site/dev/ai1") == [_handler_b]
+        assert router.filters == ["site/+/ai1"]
+
+        router.remove(topic_filter="site/+/ai1")
+        assert router.match(topic="site/dev/ai1") == []
+        assert len(router) == 0
+        assert router._root.children == {}
+
+    @pytest.mark.parametrize("topic_filter", ["site/#/ai1", "site/dev#", "site/+dev"])
+    def test_invalid_filter(self, topic_filter):
+        with pytest.raises(ValueError):
+            validate_filter(topic_filter=topic_filter)
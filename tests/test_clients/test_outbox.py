@@ -0,0 +1,69 @@
+from visiobas_gateway.clients.outbox import Outbox, group_records
+
+
+class TestOutbox:
+    def test_append_read_happy(self, tmp_path):
+        outbox = Outbox(directory=tmp_path, segment_size=1024, max_size=4096)
+        outbox.append(dev_id=1, data=b"1 0 1 0;")
+        outbox.append(dev_id=2, data=b"2 0 2 0;")
+
+        segment, records = outbox.read_oldest()
+        assert records == [(1, b"1 0 1 0;"), (2, b"2 0 2 0;")]
+
+        outbox.mark_delivered(segment=segment, quantity=2)
+        assert outbox.read_oldest() is None
+        assert len(outbox) == 0
+        assert outbox.size == 0
+
+    def test_partial_delivery(self, tmp_path):
+        outbox = Outbox(directory=tmp_path, segment_size=1024, max_size=4096)
+        for i in range(3):
+            outbox.append(dev_id=i, data=b"data")
+
+        segment, _ = outbox.read_oldest()
+        outbox.mark_delivered(segment=segment, quantity=1)
+
+        segment_2, records = outbox.read_oldest()
+        assert segment_2 == segment
+        assert [dev_id for dev_id, _ in records] == [1, 2]
+
+    def test_mark_delivered_not_reads_segment(self, tmp_path, mocker):
+        outbox = Outbox(directory=tmp_path, segment_size=1024, max_size=4096)
+        outbox.append(dev_id=1, data=b"data")
+        segment, _ = outbox.read_oldest()
+
+        read_records = mocker.spy(Outbox, "_read_records")
+        outbox.mark_delivered(segment=segment, quantity=1)
+
+        read_records.assert_not_called()
+        assert len(outbox) == 0
+
+    def test_rotate_and_drop_oldest(self, tmp_path):
+        outbox = Outbox(directory=tmp_path, segment_size=20, max_size=50)
+        for i in range(6):
+            outbox.append(dev_id=i, data=b"0123456789")  # 18 bytes per record
+
+        assert outbox.size <= 50
+        assert outbox.dropped == 4
+        _, records = outbox.read_oldest()
+        assert records == [(4, b"0123456789"), (5, b"0123456789")]
+
+    def test_restore_from_disk(self, tmp_path):
+        outbox = Outbox(directory=tmp_path, segment_size=1024, max_size=4096)
+        outbox.append(dev_id=1, data=b"data")
+        outbox.close()
+
+        restored_outbox = Outbox(directory=tmp_path, segment_size=1024, max_size=4096)
+        assert len(restored_outbox) == 1
+        _, records = restored_outbox.read_oldest()
+        assert records == [(1, b"data")]
+
+
+def test_group_records():
+    records = [(1, b"a;"), (1, b"b;"), (2, b"c;"), (1, b"d;"), (1, b"e;"), (1, b"f;")]
+    assert list(group_records(records=records, max_size=4)) == [
+        (1, b"a;b;", 2),
+        (2, b"c;", 1),
+        (1, b"d;e;", 2),
+        (1, b"f;", 1),
+    ]
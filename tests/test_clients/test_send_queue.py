@@ -0,0 +1,47 @@
+import asyncio
+
+from visiobas_gateway.clients.send_queue import SendQueue
+
+
+class TestSendQueue:
+    @staticmethod
+    def _create_queue(linger: float, batch_size: int) -> tuple[SendQueue, list]:
+        sent = []
+
+        async def send(dev_id: int, data: bytes) -> None:
+            sent.append((dev_id, data))
+
+        return SendQueue(send=send, linger=linger, batch_size=batch_size), sent
+
+    async def test_coalesce_latest(self):
+        queue, sent = self._create_queue(linger=0.01, batch_size=1024)
+
+        queue.put(dev_id=1, fragments={(1, 0): b"1 0 1 0;", (2, 0): b"2 0 2 0;"})
+        queue.put(dev_id=1, fragments={(1, 0): b"1 0 11 0;"})
+        queue.put(dev_id=2, fragments={(1, 0): b"1 0 3 0;"})
+        assert queue.depth == 3
+
+        await asyncio.sleep(0.05)
+        assert sorted(sent) == [(1, b"1 0 11 0;2 0 2 0;"), (2, b"1 0 3 0;")]
+        assert queue.depth == 0
+        assert queue.batches_sent == 2
+        assert queue.objects_sent == 3
+        assert queue.objects_coalesced == 1
+
+    async def test_batch_size_reached(self):
+        queue, sent = self._create_queue(linger=60, batch_size=10)
+
+        queue.put(dev_id=1, fragments={(1, 0): b"1 0 1 0;"})
+        await asyncio.sleep(0)
+        assert sent == []
+
+        queue.put(dev_id=1, fragments={(2, 0): b"2 0 2 0;"})
+        await asyncio.sleep(0)
+        assert sent == [(1, b"1 0 1 0;2 0 2 0;")]
+
+    async def test_close_sends_pending(self):
+        queue, sent = self._create_queue(linger=60, batch_size=1024)
+
+        queue.put(dev_id=1, fragments={(1, 0): b"1 0 1 0;"})
+        await queue.close()
+        assert sent == [(1, b"1 0 1 0;")]
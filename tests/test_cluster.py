@@ -0,0 +1,127 @@
+import asyncio
+from ipaddress import IPv4Address
+from types import SimpleNamespace
+
+import pytest
+
+from visiobas_gateway.cluster import ClusterSupervisor, ClusterWorker, partition_devices
+from visiobas_gateway.utils.telemetry_codec import TelemetryRecord
+
+
+def test_partition_devices():
+    interfaces = {
+        1: (IPv4Address("10.0.0.1"), 502),
+        2: (IPv4Address("10.0.0.1"), 502),
+        3: (IPv4Address("10.0.0.1"), 502),
+        4: "/dev/ttyS0",
+        5: "/dev/ttyS0",
+        6: (IPv4Address("10.0.0.2"), 47808),
+    }
+
+    partitions = partition_devices(interfaces=interfaces, workers=2)
+
+    assert partitions == [[1, 2, 3], [4, 5, 6]]
+    assert partition_devices(interfaces=interfaces, workers=8) == [[1, 2, 3], [4, 5], [6]]
+
+
+async def test_worker_link(tmp_path):
+    sent = []
+    streamed = []
+    supervisor_gateway = SimpleNamespace(
+        http_client=SimpleNamespace(
+            send_queue=SimpleNamespace(put=lambda dev_id, fragments: sent.append(dev_id))
+        ),
+        api=SimpleNamespace(
+            streams=SimpleNamespace(
+                put=lambda device_id, records: streamed.append((device_id, records))
+            )
+        ),
+    )
+    supervisor = ClusterSupervisor(
+        gateway=supervisor_gateway,
+        workers=1,
+        socket_path=tmp_path / "ipc.sock",
+        target=print,
+        rpc_timeout=1,
+    )
+    supervisor._owners = {10: 0}
+    server = await asyncio.start_unix_server(
+        supervisor._handle_worker, path=str(tmp_path / "ipc.sock")
+    )
+
+    async def _stop():
+        pass
+
+    worker_gateway = SimpleNamespace(
+        cluster=None, get_device=lambda dev_id: None, stop=_stop
+    )
+    worker = ClusterWorker(
+        gateway=worker_gateway, index=0, socket_path=str(tmp_path / "ipc.sock")
+    )
+    await worker.connect()
+    record = TelemetryRecord(
+        object_id=1, object_type=0, value=22.5, status_flags=0, timestamp=0.0
+    )
+    await worker.send(dev_id=10, fragments={(1, 0): b"1 0 22.5 0;"}, records=[record])
+    for _ in range(100):
+        if sent and 0 in supervisor._links:
+            break
+        await asyncio.sleep(0.01)
+    assert sent == [10]
+    assert streamed == [(10, [record])]
+
+    params = {
+        "device_id": "10",
+        "object_type": "1",
+        "object_id": "75",
+        "property": "85",
+        "priority": "8",
+        "value": "22.22",
+    }
+    with pytest.raises(Exception, match="Device 10 not found."):
+        await supervisor.call(device_id=10, method="writeSetPoint", params=params)
+    with pytest.raises(Exception, match="Device 11 not found."):
+        await supervisor.call(device_id=11, method="writeSetPoint", params=params)
+
+    await worker.close()
+    server.close()
+    await server.wait_closed()
+
+
+async def test_stop_terminates_hung_workers(tmp_path, mocker):
+    async def _add_job(target, *args):
+        return target(*args)
+
+    supervisor = ClusterSupervisor(
+        gateway=SimpleNamespace(async_add_job=_add_job),
+        workers=2,
+        socket_path=tmp_path / "ipc.sock",
+        target=print,
+    )
+    stopped = mocker.Mock(is_alive=mocker.Mock(return_value=False))
+    hung = mocker.Mock(is_alive=mocker.Mock(return_value=True))
+    supervisor._processes = {0: stopped, 1: hung}
+
+    await supervisor.stop()
+
+    stopped.join.assert_called_once()
+    stopped.terminate.assert_not_called()
+    hung.terminate.assert_called_once()
+
+
+async def test_resolve_interfaces_skips_failed_downloads(tmp_path, mocker):
+    results = {1: asyncio.CancelledError(), 2: ValueError("Failed"), 3: {}}
+    supervisor = ClusterSupervisor(
+        gateway=SimpleNamespace(
+            _download_device_data=mocker.AsyncMock(
+                side_effect=lambda device_id: results[device_id]
+            )
+        ),
+        workers=2,
+        socket_path=tmp_path / "ipc.sock",
+        target=print,
+    )
+
+    interfaces = await supervisor._resolve_interfaces(device_ids=[1, 2, 3])
+
+    assert interfaces == {dev_id: ("device", dev_id) for dev_id in (1, 2, 3)}
@@ -0,0 +1,307 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from visiobas_gateway.devices import BasePollingDevice, WriteRequest
+from visiobas_gateway.devices._interface import Interface
+
+
+class _Device(BasePollingDevice):
+    """Polling device stand-in. Fails writes of negative values. Written value is read
+    after `lag` reads.
+    """
+
+    def __init__(self, device_obj, objs):
+        super().__init__(
+            device_obj=device_obj,
+            gateway=SimpleNamespace(verifier=SimpleNamespace(verify=lambda obj: obj)),
+        )
+        self.object_groups = {
+            60: {(obj.object_id, obj.object_type.value): obj for obj in objs}
+        }
+        self._interface = SimpleNamespace(polling_event=asyncio.Event())
+        self.writes = []
+        self.reads = []
+        self.lag = 0
+        self._written = {}
+
+    @property
+    def interface(self):
+        return self._interface
+
+    @staticmethod
+    def interface_key(device_obj):
+        return None
+
+    @staticmethod
+    async def is_reachable(device_obj, checker):
+        return True
+
+    async def create_client(self, device_obj):
+        return None
+
+    async def connect_client(self, client):
+        return True
+
+    async def _disconnect_client(self, client):
+        return None
+
+    @property
+    def is_client_connected(self):
+        return True
+
+    async def read(self, obj, wait=False, **kwargs):
+        key = (obj.object_id, obj.object_type.value)
+        self.reads.append(key)
+        if key in self._written:
+            value, lag = self._written[key]
+            if lag:
+                self._written[key] = value, lag - 1
+            else:
+                obj.present_value = value
+        return obj
+
+    async def write(self, value, obj, wait=False, **kwargs):
+        if value < 0:
+            raise ValueError("Negative")
+        self.writes.append((obj.object_id, value))
+        self._written[(obj.object_id, obj.object_type.value)] = value, self.lag
+
+
+@pytest.fixture
+def device(serial_device_obj_factory, bacnet_obj_factory):
+    return _Device(
+        device_obj=serial_device_obj_factory(),
+        objs=[
+            bacnet_obj_factory(**{"75": 1, "79": "analog-output"}),
+            bacnet_obj_factory(**{"75": 1, "79": "analog-input"}),
+            bacnet_obj_factory(**{"75": 2, "79": "analog-value"}),
+        ],
+    )
+
+
+class TestWriteManyWithCheck:
+    async def test_one_read_back(self, device):
+        output_obj = device.get_object(object_id=1, object_type_id=1)
+        value_obj = device.get_object(object_id=2, object_type_id=2)
+
+        results = await device.write_many_with_check(
+            requests=[
+                WriteRequest(value=1, obj=output_obj),
+                WriteRequest(value=2, obj=value_obj),
+                WriteRequest(value=3, obj=output_obj),
+            ]
+        )
+
+        assert device.writes == [(1, 3), (2, 2)]  # The first write is replaced.
+        assert sorted(device.reads) == [(1, 0), (1, 1), (2, 2)]
+        assert results[0] == results[2] == (output_obj, device.get_object(1, 0))
+        assert results[1] == (value_obj, None)
+        assert output_obj.present_value == 3
+        assert device.interface.polling_event.is_set()
+
+    async def test_errors_per_request(self, device):
+        input_obj = device.get_object(object_id=1, object_type_id=0)
+        output_obj = device.get_object(object_id=1, object_type_id=1)
+        value_obj = device.get_object(object_id=2, object_type_id=2)
+
+        results = await device.write_many_with_check(
+            requests=[
+                WriteRequest(value=1, obj=input_obj),
+                WriteRequest(value=-1, obj=value_obj),
+                WriteRequest(value=2, obj=output_obj),
+            ]
+        )
+
+        assert isinstance(results[0], ValueError)
+        assert str(results[1]) == "Negative"
+        assert results[2] == (output_obj, input_obj)
+
+    async def test_write_with_check_raises(self, device):
+        value_obj = device.get_object(object_id=2, object_type_id=2)
+
+        with pytest.raises(ValueError):
+            await device.write_with_check(value=-1, output_obj=value_obj)
+        assert device.interface.polling_event.is_set()
+
+
+class TestWriteCoalescing:
+    async def test_last_writer_wins(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+        device.lag = 1  # Holds the first batch, while other writes wait.
+
+        results = await asyncio.gather(
+            *[device.write_with_check(value=value, output_obj=obj) for value in (1, 2, 3)]
+        )
+
+        assert device.writes == [(2, 1), (2, 3)]
+        assert device.writes_coalesced == 1
+        assert results == [(obj, None)] * 3
+        assert obj.present_value == 3
+
+    async def test_priorities_not_coalesced(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+
+        await device.write_many_with_check(
+            requests=[
+                WriteRequest(value=1, obj=obj, priority=8),
+                WriteRequest(value=2, obj=obj, priority=11),
+            ]
+        )
+
+        assert device.writes == [(2, 1), (2, 2)]
+
+    async def test_cancelled_caller(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+        device.lag = 1
+        batches = []
+        write_many = device._write_many_with_check
+
+        async def _write_many_with_check(requests):
+            batches.append(len(batches))
+            result = await write_many(requests=requests)
+            batches.append(None)
+            return result
+
+        device._write_many_with_check = _write_many_with_check
+        first = asyncio.create_task(device.write_with_check(value=1, output_obj=obj))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(device.write_with_check(value=2, output_obj=obj))
+        waiting = asyncio.create_task(device.write_with_check(value=3, output_obj=obj))
+        await asyncio.sleep(0)
+        first.cancel()
+        cancelled.cancel()
+
+        assert await waiting == (obj, None)
+        assert first.cancelled() and cancelled.cancelled()
+        assert batches == [0, None, 2, None]  # One batch at a time.
+        assert device.writes == [(2, 1), (2, 3)]
+        assert device.interface.polling_event.is_set()
+
+    async def test_abandoned_slot_dropped(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+        value_obj = device.get_object(object_id=1, object_type_id=1)
+        device.lag = 1
+        first = asyncio.create_task(device.write_with_check(value=1, output_obj=obj))
+        await asyncio.sleep(0)
+        abandoned = asyncio.create_task(
+            device.write_with_check(value=2, output_obj=value_obj)
+        )
+        await asyncio.sleep(0)
+        abandoned.cancel()
+
+        assert await first == (obj, None)
+        await asyncio.sleep(0)
+        assert abandoned.cancelled()
+        assert device.writes == [(2, 1)]
+        assert not device._pending_writes
+
+
+class TestReadBack:
+    async def test_lagging_device(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+        device.lag = 2
+
+        (result,) = await device.write_many_with_check(
+            requests=[WriteRequest(value=5, obj=obj)]
+        )
+
+        assert result == (obj, None)
+        assert obj.present_value == 5
+        assert device.reads == [(2, 2)] * 3
+        assert device._read_back_delay > 0.1
+
+    async def test_fast_device(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+
+        await device.write_many_with_check(requests=[WriteRequest(value=5, obj=obj)])
+
+        assert device.reads == [(2, 2)]
+        assert device._read_back_delay < 0.1
+
+    async def test_timeout(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+        device.device_obj.property_list.write_check_timeout = 0.2
+        device.lag = 100
+
+        (result,) = await device.write_many_with_check(
+            requests=[WriteRequest(value=5, obj=obj)]
+        )
+
+        assert result == (obj, None)
+        assert obj.present_value != 5
+        assert 1 < len(device.reads) < 10
+
+
+class TestReadFresh:
+    async def test_single_flight(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+        obj.updated = None
+        device.interface.polling_event.set()
+
+        results = await asyncio.gather(
+            device.read_fresh(obj=obj, max_age=1), device.read_fresh(obj=obj, max_age=1)
+        )
+
+        assert results == [obj, obj]
+        assert device.reads == [(2, 2)]
+        assert device._fresh_reads == {}
+
+    async def test_fresh_not_read(self, device):
+        obj = device.get_object(object_id=2, object_type_id=2)
+        obj.updated = datetime.now()
+
+        assert await device.read_fresh(obj=obj, max_age=10) is obj
+        assert device.reads == []
+
+
+def test_client_absent(device):
+    """Client is absent while supervisor reconnects it."""
+    device._interface = SimpleNamespace(client=None, interface_key="bus")
+
+    with pytest.raises(ConnectionError):
+        device.client
+
+
+class TestStop:
+    @staticmethod
+    def _create_device(device_obj, interface):
+        device = _Device(device_obj=device_obj, objs=[])
+        device._interface = interface
+        device._scheduler = SimpleNamespace(close=AsyncMock())
+        interface.used_by.add(device.id)
+        return device
+
+    async def test_shared_interface(self, serial_device_obj_factory, mocker, monkeypatch):
+        interface = Interface(
+            interface_key="bus",
+            used_by=set(),
+            client=None,
+            lock=asyncio.Lock(),
+            polling_event=asyncio.Event(),
+            client_connected=True,
+            supervisor=mocker.Mock(close=mocker.AsyncMock()),
+        )
+        interface.polling_event.set()
+        monkeypatch.setitem(BasePollingDevice._interfaces, "bus", interface)
+        device_1 = self._create_device(serial_device_obj_factory(**{"75": 1}), interface)
+        device_2 = self._create_device(serial_device_obj_factory(**{"75": 2}), interface)
+        devices = {1: device_1, 2: device_2}
+        device_1._gtw = SimpleNamespace(get_device=lambda dev_id: devices.get(dev_id))
+
+        await device_1.stop()
+        assert interface.used_by == {2}
+        assert interface.polling_event.is_set()
+        interface.supervisor.close.assert_not_called()
+        interface.supervisor.bind.assert_called_once_with(
+            connect=device_2.open_client, disconnect=device_2._disconnect_client
+        )
+
+        await device_2.stop()
+        assert not interface.used_by
+        assert not interface.polling_event.is_set()
+        interface.supervisor.close.assert_awaited_once()
+        assert "bus" not in BasePollingDevice._interfaces
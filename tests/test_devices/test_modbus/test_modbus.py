@@ -0,0 +1,95 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from visiobas_gateway.devices import ModbusDevice, WriteRequest
+from visiobas_gateway.schemas import ModbusWriteFunc
+from visiobas_gateway.schemas.modbus.obj import ModbusObj
+
+
+def _modbus_device(mocker, write_registers):
+    return SimpleNamespace(
+        write_funcs={ModbusWriteFunc.WRITE_REGISTERS: write_registers},
+        _build_payload=lambda value, obj: [int(value)] * obj.quantity,
+        _device_obj=SimpleNamespace(
+            property_list=SimpleNamespace(rtu=SimpleNamespace(unit=1))
+        ),
+        _LOG=mocker.Mock(),
+        sync_write=mocker.Mock(),
+    )
+
+
+@pytest.fixture
+def request_factory(modbus_properties_factory):
+    def _factory(value, address, quantity=2, func_write=ModbusWriteFunc.WRITE_REGISTERS):
+        modbus = modbus_properties_factory(
+            address=address,
+            quantity=quantity,
+            dataLength=16 * quantity,
+            functionWrite=func_write.value,
+        )
+        obj = ModbusObj(
+            **{
+                "75": address,
+                "77": "Name:Name/Name.Name",
+                "79": "analog-output",
+                "371": json.dumps({"modbus": modbus.dict(by_alias=True)}),
+                "846": 846,
+            }
+        )
+        return WriteRequest(value=value, obj=obj)
+
+    return _factory
+
+
+class TestSyncWriteMany:
+    def test_contiguous_registers_merged(self, mocker, request_factory):
+        write_registers = mocker.Mock(return_value=mocker.Mock(isError=lambda: False))
+        device = _modbus_device(mocker, write_registers)
+        requests = [
+            request_factory(value=2, address=12),
+            request_factory(value=1, address=10),
+            request_factory(value=3, address=20, quantity=1),
+            request_factory(value=4, address=30, func_write=ModbusWriteFunc.WRITE_REGISTER),
+        ]
+
+        results = ModbusDevice.sync_write_many(device, requests)
+
+        assert results == [None] * 4
+        assert [call.args for call in write_registers.call_args_list] == [
+            (10, [1, 1, 2, 2]),
+            (20, [3]),
+        ]
+        device.sync_write.assert_called_once_with(value=4, obj=requests[3].obj)
+
+    def test_failed_request_mapped_to_merged_writes(self, mocker, request_factory):
+        write_registers = mocker.Mock(return_value=mocker.Mock(isError=lambda: True))
+        device = _modbus_device(mocker, write_registers)
+        device.sync_write.side_effect = ValueError("Failed")
+        requests = [
+            request_factory(value=1, address=10),
+            request_factory(value=2, address=12),
+            request_factory(value=3, address=30, func_write=ModbusWriteFunc.WRITE_COIL),
+        ]
+
+        results = ModbusDevice.sync_write_many(device, requests)
+
+        write_registers.assert_called_once()
+        assert results[0] is results[1]
+        assert all(isinstance(result, Exception) for result in results)
+
+    def test_not_modbus_obj_rejected(self, mocker, request_factory):
+        write_registers = mocker.Mock(return_value=mocker.Mock(isError=lambda: False))
+        device = _modbus_device(mocker, write_registers)
+        requests = [
+            request_factory(value="null", address=10),
+            WriteRequest(value=1, obj=SimpleNamespace(address=12)),
+        ]
+
+        results = ModbusDevice.sync_write_many(device, requests)
+
+        write_registers.assert_not_called()
+        device.sync_write.assert_called_once_with(value="null", obj=requests[0].obj)
+        assert results[0] is None
+        assert isinstance(results[1], ValueError)
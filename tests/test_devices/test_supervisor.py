@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from visiobas_gateway.devices._interface import Interface
+from visiobas_gateway.devices._supervisor import ConnectionState, ConnectionSupervisor
+
+
+def _interface():
+    return Interface(
+        interface_key=("127.0.0.1", 502),
+        used_by={1, 2},
+        client=None,
+        client_connected=False,
+        lock=asyncio.Lock(),
+        polling_event=asyncio.Event(),
+    )
+
+
+class _Link:
+    def __init__(self, failures):
+        self.failures = failures
+        self.connects = 0
+        self.disconnected = []
+
+    async def connect(self):
+        self.connects += 1
+        if self.connects <= self.failures:
+            raise ConnectionError("Link is down")
+        return f"client-{self.connects}"
+
+    async def disconnect(self, client):
+        self.disconnected.append(client)
+
+
+def _supervisor(interface, link):
+    return ConnectionSupervisor(
+        interface=interface,
+        connect=link.connect,
+        disconnect=link.disconnect,
+        min_delay=0.001,
+        max_delay=0.01,
+    )
+
+
+class TestConnectionSupervisor:
+    async def test_connect(self):
+        interface, link = _interface(), _Link(failures=0)
+        supervisor = _supervisor(interface, link)
+
+        assert await supervisor.connect()
+        assert supervisor.state is ConnectionState.CONNECTED
+        assert interface.client == "client-1"
+        assert interface.client_connected
+
+    async def test_waiters_woken_on_reconnect(self):
+        interface, link = _interface(), _Link(failures=3)
+        supervisor = _supervisor(interface, link)
+
+        assert not await supervisor.connect()
+        await asyncio.wait_for(
+            asyncio.gather(*[supervisor.wait_connected() for _ in range(5)]), timeout=1
+        )
+
+        assert link.connects == 4  # One reconnection task for all waiters.
+        assert interface.client == "client-4"
+        assert supervisor.transitions["connecting->connected"] == 1
+        assert supervisor.transitions["connecting->disconnected"] == 3
+
+    async def test_connection_lost(self):
+        interface, link = _interface(), _Link(failures=0)
+        supervisor = _supervisor(interface, link)
+        await supervisor.connect()
+
+        supervisor.connection_lost(exc=ConnectionError())
+        assert not interface.client_connected
+        await asyncio.wait_for(supervisor.wait_connected(), timeout=1)
+
+        assert link.disconnected == ["client-1"]
+        assert interface.client == "client-2"
+
+    async def test_close(self):
+        interface, link = _interface(), _Link(failures=100)
+        supervisor = _supervisor(interface, link)
+        supervisor.ensure_reconnecting()
+
+        await supervisor.close()
+
+        assert supervisor.state is ConnectionState.DISCONNECTED
+        assert interface.client is None
+
+    async def test_bind(self):
+        interface, link = _interface(), _Link(failures=0)
+        supervisor = _supervisor(interface, link)
+        await supervisor.connect()
+
+        new_link = _Link(failures=0)
+        supervisor.bind(connect=new_link.connect, disconnect=new_link.disconnect)
+        supervisor.connection_lost()
+        await asyncio.wait_for(supervisor.wait_connected(), timeout=1)
+
+        assert new_link.disconnected == ["client-1"]
+        assert new_link.connects == 1
+        assert link.connects == 1
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 5, 100])
+def test_delay(attempt):
+    supervisor = ConnectionSupervisor(
+        interface=None, connect=None, disconnect=None, min_delay=1, max_delay=30
+    )
+    expected = min(30, 2**attempt)
+    assert expected * 0.5 <= supervisor.delay(attempt=attempt) <= expected
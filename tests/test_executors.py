@@ -0,0 +1,43 @@
+import threading
+
+from visiobas_gateway.executors import (
+    CPU_EXECUTOR,
+    DEFAULT_WORKERS,
+    Executors,
+    InstrumentedExecutor,
+    interface_executor_name,
+)
+
+
+def test_instrumented_executor_wait_time():
+    executor = InstrumentedExecutor(name="test", max_workers=1)
+    release = threading.Event()
+
+    blocking = executor.submit(release.wait)
+    queued = executor.submit(lambda value: value * 2, 21)
+    assert executor.stats["queued"] >= 1
+
+    release.set()
+    assert blocking.result(timeout=1)
+    assert queued.result(timeout=1) == 42
+    executor.shutdown()
+
+    stats = executor.stats
+    assert stats["started"] == 2
+    assert stats["queued"] == 0
+    assert stats["max_wait_time"] > 0
+
+
+def test_executors():
+    executors = Executors(workers={CPU_EXECUTOR: 3})
+
+    assert executors.get(CPU_EXECUTOR) is executors.get(CPU_EXECUTOR)
+    assert executors.get(CPU_EXECUTOR)._max_workers == 3
+
+    name = interface_executor_name(("127.0.0.1", 502))
+    assert executors.get(name)._max_workers == DEFAULT_WORKERS["interface"]
+    assert executors.get("interface:/dev/ttyS0", max_workers=1)._max_workers == 1
+    assert set(executors.stats) == {CPU_EXECUTOR, name, "interface:/dev/ttyS0"}
+
+    executors.shutdown()
+    assert executors.stats == {}
@@ -0,0 +1,56 @@
+import aiohttp
+import pytest
+
+from visiobas_gateway.clients import HTTPClient
+from visiobas_gateway.schemas import ObjType
+
+
+def _obj_data(object_id, object_type):
+    return {
+        "75": object_id,
+        "77": f"Name:Name/Name.{object_id}",
+        "79": object_type.value,
+        "371": '{"template": "", "alias": "", "replace": {}, "pollPeriod": 5}',
+        "846": 846,
+    }
+
+
+class TestFetchObjects:
+    async def test_parsed_by_batches(self, gateway_factory, tcp_device_obj_factory):
+        async def _iter_objects(dev_id, obj_type):
+            if obj_type is ObjType.BINARY_INPUT:
+                raise aiohttp.ClientPayloadError("Failure server result")
+            if obj_type is ObjType.ANALOG_INPUT:
+                yield [_obj_data(i, obj_type) for i in range(400)]
+                yield [_obj_data(i, obj_type) for i in range(400, 700)]
+
+        gateway = gateway_factory()
+        gateway.http_client = HTTPClient.__new__(HTTPClient)
+        gateway.http_client.iter_objects = _iter_objects
+        batches = []
+
+        async def _on_parsed(objs):
+            batches.append(objs)
+
+        objs, loaded_types = await gateway._fetch_objects(
+            device_obj=tcp_device_obj_factory(), on_parsed=_on_parsed
+        )
+
+        assert [len(batch) for batch in batches] == [700]
+        assert len(objs) == 700
+        assert ObjType.ANALOG_INPUT in loaded_types
+        assert ObjType.BINARY_INPUT not in loaded_types
+
+
+class TestLoadObjects:
+    async def test_not_loaded_stops_polling_start(self, gateway_factory, mocker):
+        gateway = gateway_factory()
+        polls_job = mocker.Mock(close=mocker.AsyncMock())
+        gateway._scheduler = mocker.Mock(spawn=mocker.AsyncMock(return_value=polls_job))
+        gateway._fetch_objects = mocker.AsyncMock(return_value=({}, set()))
+        device = mocker.Mock(id=1)
+
+        with pytest.raises(ValueError):
+            await gateway._load_objects(device=device)
+
+        polls_job.close.assert_awaited_once()
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from visiobas_gateway.parser import ObjectParser, parse_objects, parse_payload
+from visiobas_gateway.schemas import BACnetObj
+from visiobas_gateway.schemas.modbus.obj import ModbusObj
+from visiobas_gateway.sync import content_hash
+
+_PROPERTY_LIST = json.dumps({"template": "", "alias": "", "replace": {}, "pollPeriod": 5})
+
+
+def _obj_data(**kwargs):
+    return {
+        "75": 75,
+        "77": "Name:Name/Name.Name",
+        "79": "analog-input",
+        "371": _PROPERTY_LIST,
+        "846": 846,
+        "103": "no-fault-detected",
+        "106": None,
+        "111": [False, False, False, False],
+        "85": 85.8585,
+        "timestamp": "2011-11-11 11:11:11",
+        **kwargs,
+    }
+
+
+class TestObjectParser:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            _obj_data(),
+            _obj_data(**{"79": 1, "87": [None] * 8 + [40.5] + [None] * 7}),
+            _obj_data(**{"75": "12", "103": "over-range", "111": 3, "106": 0.5}),
+            _obj_data(**{"103": "", "111": [True, False, False, True], "107": True}),
+            _obj_data(**{"sendPeriod": 10}),  # Extra field.
+        ],
+    )
+    def test_parse_same_as_model(self, data):
+        parser = ObjectParser(cls=BACnetObj)
+
+        assert parser.parse(data=data) == BACnetObj(**data)
+        assert parser.parse(data=data) == BACnetObj(**data)  # Cached.
+
+    def test_parse_modbus(self, modbus_properties_factory):
+        modbus = modbus_properties_factory().dict(by_alias=True)
+        data = _obj_data(**{"371": json.dumps({"modbus": modbus})})
+
+        assert ObjectParser(cls=ModbusObj).parse(data=data) == ModbusObj(**data)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            _obj_data(**{"846": 0}),
+            _obj_data(**{"77": ""}),
+            _obj_data(**{"111": [0, 0, 0, 0]}),
+            {"75": 75},
+        ],
+    )
+    @pytest.mark.parametrize("strict", [False, True])
+    def test_parse_invalid(self, data, strict):
+        with pytest.raises(ValidationError):
+            ObjectParser(cls=BACnetObj, strict=strict).parse(data=data)
+
+    def test_parse_shares_property_list(self):
+        first, second = parse_objects(
+            cls=BACnetObj, payload=[_obj_data(), _obj_data(**{"75": 76})]
+        )
+
+        assert first.property_list is second.property_list
+        assert first.status_flags is not second.status_flags
+        assert first.priority_array is not second.priority_array
+
+
+def test_parse_payload():
+    data = _obj_data()
+    ((obj, hash_),) = parse_payload(cls=BACnetObj, payload=[data])
+
+    assert obj == BACnetObj(**data)
+    assert hash_ == content_hash(data)
@@ -13,7 +13,7 @@ class TestBaseDevicePropertyList:
         "data, expected_protocol, expected_timeout, expected_retries, "
         "expected_send_period, expected_reconnect_period",
         [
-            ({}, Protocol.BACNET, 500, 3, 300, 300),
+            ({}, Protocol.BACNET, 500, 3, 0, 300),
             (
                 {
                     "protocol": "ModbusTCP",
@@ -0,0 +1,18 @@
+import pytest
+from pydantic import ValidationError
+
+from visiobas_gateway.schemas.mqtt import Codec
+from visiobas_gateway.schemas.settings import MQTTSettings
+
+
+class TestMQTTSettings:
+    def test_msgpack_not_installed(self, mocker):
+        mocker.patch("importlib.util.find_spec", return_value=None)
+
+        with pytest.raises(ValidationError, match="requires `msgpack` package"):
+            MQTTSettings(url="mqtt://127.0.0.1:1883", codec="msgpack")
+
+    def test_codec(self):
+        settings = MQTTSettings(url="mqtt://127.0.0.1:1883", codec="cbor")
+
+        assert settings.codec is Codec.CBOR
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from visiobas_gateway.schemas import ObjType, Reliability, StatusFlags
+from visiobas_gateway.serializer import LightSerializer
+from visiobas_gateway.verifier import BACnetVerifier
+
+
+class TestLightSerializer:
+    @pytest.mark.parametrize(
+        "data, disabled_flags",
+        [
+            ({"103": "", "111": 8, "85": 6.666, "79": 0}, StatusFlags(flags=0b1011)),
+            ({"103": Reliability.OVER_RANGE, "79": ObjType.BINARY_OUTPUT}, StatusFlags()),
+            ({"103": Reliability.OVER_RANGE, "85": asyncio.TimeoutError()}, StatusFlags()),
+            ({"85": True, "79": ObjType.BINARY_VALUE}, StatusFlags(flags=0b1011)),
+        ],
+    )
+    def test_fragment_same_as_to_http_str(self, bacnet_obj_factory, data, disabled_flags):
+        serializer = LightSerializer(disabled_flags=disabled_flags)
+        bacnet_obj = bacnet_obj_factory(**data)
+        for obj in (bacnet_obj, BACnetVerifier().verify(obj=bacnet_obj)):
+            expected = obj.to_http_str(obj=obj, disabled_flags=disabled_flags)
+            assert serializer.fragment(obj=obj) == expected.encode()
+
+    def test_fragment_cached(self, bacnet_obj_factory):
+        serializer = LightSerializer(disabled_flags=StatusFlags())
+        obj = bacnet_obj_factory(**{"85": 1.5})
+
+        first = serializer.fragment(obj=obj)
+        assert serializer.fragment(obj=obj) is first
+        assert (serializer.hits, serializer.misses) == (1, 1)
+
+        obj.present_value = 2.5
+        assert serializer.fragment(obj=obj) == b"75 0 2.5 0 0;"
+        assert (serializer.hits, serializer.misses) == (1, 2)
+
+    def test_fragment_type_of_value_changed(self, bacnet_obj_factory):
+        serializer = LightSerializer(disabled_flags=StatusFlags())
+        obj = bacnet_obj_factory(**{"85": 1})
+
+        assert serializer.fragment(obj=obj) == b"75 0 1 0 0;"
+        obj.present_value = 1.0
+        assert serializer.fragment(obj=obj) == b"75 0 1.0 0 0;"
+
+    def test_serialize(self, bacnet_obj_factory):
+        serializer = LightSerializer(disabled_flags=StatusFlags())
+        objs = [bacnet_obj_factory(**{"75": i, "85": i}) for i in range(3)]
+
+        assert serializer.serialize(objs=objs) == b"0 0 0 0 0;1 0 1 0 0;2 0 2 0 0;"
+        assert serializer.serialize(objs=objs[1:]) == b"1 0 1 0 0;2 0 2 0 0;"
+        assert len(serializer) == 3
+
+    def test_forget(self, bacnet_obj_factory):
+        serializer = LightSerializer(disabled_flags=StatusFlags())
+        obj = bacnet_obj_factory()
+        serializer.fragment(obj=obj)
+
+        serializer.forget(keys=[(obj.device_id, obj.object_id, obj.object_type.value)])
+        assert len(serializer) == 0
@@ -0,0 +1,51 @@
+import pytest
+
+from visiobas_gateway.snapshot import DeviceSnapshot, SnapshotError, SnapshotStore
+
+
+@pytest.fixture
+def snapshot(tcp_device_obj_factory, bacnet_obj_factory) -> DeviceSnapshot:
+    obj = bacnet_obj_factory()
+    return DeviceSnapshot(
+        device_obj=tcp_device_obj_factory(),
+        device_hash="device-hash",
+        objects={(obj.object_id, obj.object_type.value): (obj, "obj-hash")},
+    )
+
+
+class TestDeviceSnapshot:
+    def test_dumps_loads(self, snapshot):
+        loaded = DeviceSnapshot.loads(data=snapshot.dumps())
+
+        assert loaded.device_obj == snapshot.device_obj
+        assert loaded.device_hash == "device-hash"
+        assert loaded.objects.keys() == snapshot.objects.keys()
+        key = next(iter(snapshot.objects))
+        assert loaded.objects[key] == snapshot.objects[key]
+
+    @pytest.mark.parametrize(
+        "corrupt",
+        [
+            lambda data: data[:10],
+            lambda data: b"X" + data[1:],
+            lambda data: data[:-1] + bytes([data[-1] ^ 1]),
+        ],
+    )
+    def test_loads_invalid(self, snapshot, corrupt):
+        with pytest.raises(SnapshotError):
+            DeviceSnapshot.loads(data=corrupt(snapshot.dumps()))
+
+
+class TestSnapshotStore:
+    def test_save_load(self, tmp_path, snapshot):
+        store = SnapshotStore(directory=tmp_path / "snapshots")
+        assert store.load(dev_id=1) is None
+
+        store.save(dev_id=1, data=snapshot.dumps())
+        assert store.load(dev_id=1).device_hash == "device-hash"
+
+    def test_load_invalid(self, tmp_path):
+        store = SnapshotStore(directory=tmp_path)
+        store.save(dev_id=1, data=b"invalid")
+
+        assert store.load(dev_id=1) is None
@@ -0,0 +1,16 @@
+from visiobas_gateway.sync import Diff, content_hash, diff_hashes
+
+
+def test_content_hash_ignores_keys_order():
+    assert content_hash({"75": 1, "77": "name"}) == content_hash({"77": "name", "75": 1})
+    assert content_hash({"75": 1}) != content_hash({"75": 2})
+
+
+def test_diff_hashes():
+    old = {(1, 0): "a", (2, 0): "b", (3, 0): "c"}
+    new = {(1, 0): "a", (2, 0): "x", (4, 0): "d"}
+
+    assert diff_hashes(old=old, new=new) == Diff(
+        added={(4, 0)}, removed={(3, 0)}, changed={(2, 0)}
+    )
+    assert not diff_hashes(old=old, new=dict(old))
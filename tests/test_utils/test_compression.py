@@ -0,0 +1,34 @@
+import pytest
+
+from visiobas_gateway.schemas import Compression
+from visiobas_gateway.utils.compression import CompressionStats, compress, decompress
+
+
+@pytest.mark.parametrize("method", [Compression.GZIP, Compression.DEFLATE])
+def test_compress_decompress(method):
+    data = b"".join(f"{i} 0 22.5 0;".encode() for i in range(1000))
+
+    compressed, cpu_time = compress(data=data, method=method, level=6)
+
+    assert len(compressed) < len(data)
+    assert cpu_time >= 0
+    assert decompress(data=compressed, method=method) == data
+
+
+def test_compression_invalid_method():
+    with pytest.raises(ValueError):
+        compress(data=b"data", method="br", level=1)
+    with pytest.raises(ValueError):
+        decompress(data=b"data", method="br")
+
+
+def test_compression_stats():
+    stats = CompressionStats()
+    assert stats.ratio == 1.0
+
+    stats.add(raw_size=1000, compressed_size=100, cpu_time=0.1)
+    stats.add(raw_size=1000, compressed_size=300, cpu_time=0.2)
+
+    assert stats.payloads == 2
+    assert stats.ratio == 5.0
+    assert stats.cpu_time == pytest.approx(0.3)
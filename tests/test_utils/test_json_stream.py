@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from visiobas_gateway.utils.json_stream import JSONArrayStream
+
+_DATA = {
+    "success": True,
+    "data": [{"75": i, "77": f"Объект {i}", "85": i * 1.5} for i in range(50)],
+    "total": 50,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100_000])
+def test_feed_chunks(chunk_size):
+    raw = json.dumps(_DATA, ensure_ascii=False).encode()
+    stream = JSONArrayStream(field="data")
+
+    items = []
+    for start in range(0, len(raw), chunk_size):
+        end = start + chunk_size
+        items.extend(stream.feed(raw[start:end]))
+    items.extend(stream.close())
+
+    assert items == _DATA["data"]
+    assert stream.items_quantity == 50
+    assert stream.fields == {"success": True, "total": 50}
+
+
+def test_feed_yields_completed_items():
+    stream = JSONArrayStream(field="data")
+
+    assert stream.feed(b'{"data": [1') == []
+    assert stream.feed(b"2, 3") == [12]
+    assert stream.feed(b"]}") == [3]
+    assert stream.close() == []
+
+
+def test_fields_before_data():
+    stream = JSONArrayStream(field="data")
+
+    stream.feed(b'{"success": false, "message": "err", "data": [')
+
+    assert stream.fields == {"success": False, "message": "err"}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b'{"data": [1, 2', b'{"data": [1 2]}', b"[1, 2]", b'{"data": []} 1', b'{"data"'],
+)
+def test_invalid(raw):
+    stream = JSONArrayStream(field="data")
+
+    with pytest.raises(json.JSONDecodeError):
+        stream.feed(raw)
+        stream.close()
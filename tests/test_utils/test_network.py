@@ -1,5 +1,8 @@
+import asyncio
+
 import pytest
-from visiobas_gateway.utils.network import ping
+
+from visiobas_gateway.utils.network import ReachabilityChecker, icmp_ping, ping, tcp_probe
 
 
 @pytest.mark.parametrize(
@@ -13,3 +16,59 @@ from visiobas_gateway.utils.network import ping
 )
 async def test_check_ping(host, expected):
     assert await ping(host=host, attempts=1) == expected
+
+
+async def test_ping_killed_on_timeout(mocker):
+    process = mocker.Mock(returncode=None)
+    killed = asyncio.Event()
+    process.kill.side_effect = killed.set
+
+    async def _wait():
+        await killed.wait()
+
+    process.wait.side_effect = _wait
+    mocker.patch("asyncio.create_subprocess_exec", return_value=process)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(ping(host="10.21.10.66", attempts=1), timeout=0.01)
+
+    process.kill.assert_called_once()
+    assert process.wait.call_count == 2
+
+
+async def test_tcp_probe():
+    server = await asyncio.start_server(
+        lambda reader, writer: writer.close(), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        assert await tcp_probe(host="127.0.0.1", port=port, timeout=1)
+    # Refused connection means that host is up.
+    assert await tcp_probe(host="127.0.0.1", port=port, timeout=1)
+
+
+async def test_icmp_ping():
+    try:
+        assert await icmp_ping(host="127.0.0.1", timeout=1)
+    except PermissionError:
+        pytest.skip("ICMP sockets are not permitted")
+
+
+class TestReachabilityChecker:
+    async def test_single_probe_per_host(self):
+        checker = ReachabilityChecker(ttl=60, timeout=1)
+
+        results = await asyncio.gather(
+            *[checker.is_reachable(host="127.0.0.1", port=1) for _ in range(10)]
+        )
+        assert results == [True] * 10
+        assert await checker.is_reachable(host="127.0.0.1", port=1)
+        assert checker.probes_quantity == 1
+
+    async def test_ttl_expired(self):
+        checker = ReachabilityChecker(ttl=0, timeout=1)
+
+        await checker.is_reachable(host="127.0.0.1", port=1)
+        await checker.is_reachable(host="127.0.0.1", port=1)
+
+        assert checker.probes_quantity == 2
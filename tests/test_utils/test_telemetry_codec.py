@@ -0,0 +1,73 @@
+import math
+
+import pytest
+
+from visiobas_gateway.schemas.mqtt import Codec
+from visiobas_gateway.utils.telemetry_codec import (
+    TelemetryRecord,
+    cbor_dumps,
+    cbor_loads,
+    codec_available,
+    codec_from_topic,
+    decode,
+    encode,
+)
+
+_RECORDS = [
+    TelemetryRecord(
+        object_id=75, object_type=0, value=22.5, status_flags=0, timestamp=1700000000.0
+    ),
+    TelemetryRecord(
+        object_id=4_000_000, object_type=3, value="null", status_flags=4, timestamp=0.0
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (0, "00"),
+        (100, "1864"),
+        (1000, "1903e8"),
+        (-1, "20"),
+        (1.1, "fb3ff199999999999a"),
+        (None, "f6"),
+        (True, "f5"),
+        ("a", "6161"),
+        (b"\x01", "4101"),
+        ([1, [2, 3]], "8201820203"),
+        ({"a": 1}, "a1616101"),
+    ],
+)
+def test_cbor(value, expected):
+    assert cbor_dumps(value).hex() == expected
+    assert cbor_loads(bytes.fromhex(expected)) == value
+
+
+def test_cbor_codec():
+    payload = encode(records=_RECORDS, codec=Codec.CBOR)
+
+    assert decode(payload=payload, codec=Codec.CBOR) == _RECORDS
+
+
+def test_struct_codec():
+    payload = encode(records=_RECORDS, codec=Codec.STRUCT)
+    decoded = decode(payload=payload, codec=Codec.STRUCT)
+
+    assert len(payload) == 18 * len(_RECORDS)
+    assert decoded[0] == _RECORDS[0]
+    assert decoded[1].object_id == 4_000_000
+    assert decoded[1].status_flags == 4
+    assert math.isnan(decoded[1].value)
+
+
+@pytest.mark.skipif(not codec_available(Codec.MSGPACK), reason="msgpack not installed")
+def test_msgpack_codec():
+    payload = encode(records=_RECORDS, codec=Codec.MSGPACK)
+
+    assert decode(payload=payload, codec=Codec.MSGPACK) == _RECORDS
+
+
+def test_codec_from_topic():
+    assert codec_from_topic("devices/846/cbor") is Codec.CBOR
+    assert codec_from_topic("devices/846") is Codec.TEXT
@@ -1,10 +1,12 @@
 import asyncio
 import logging
+import os
 import sys
 
 from pydantic import ValidationError
 
 from visiobas_gateway import ENV_PATH
+from visiobas_gateway.cluster import ClusterSupervisor, ClusterWorker
 from visiobas_gateway.gateway import Gateway
 from visiobas_gateway.schemas.settings import (
     ApiSettings,
@@ -39,12 +41,21 @@ def setup_logging(settings: LogSettings) -> None:
 
 async def load_and_run() -> None:
     try:
+        gateway_settings = GatewaySettings()
         gateway = await Gateway.create(
-            gateway_settings=GatewaySettings(),
+            gateway_settings=gateway_settings,
             api_settings=ApiSettings(),
             mqtt_settings=MQTTSettings(),
             http_settings=HTTPSettings(),
         )
+        workers = gateway_settings.workers
+        if workers:
+            gateway.cluster = ClusterSupervisor(
+                gateway=gateway,
+                workers=(os.cpu_count() or 1) if workers == -1 else workers,
+                socket_path=gateway_settings.ipc_socket,
+                target=worker_main,
+            )
         await gateway.run()
     except ValidationError as exc:
         raise EnvironmentError(
@@ -52,6 +63,27 @@ async def load_and_run() -> None:
         ) from exc
 
 
+async def load_and_run_worker(index: int, socket_path: str, device_ids: list[int]) -> None:
+    gateway_settings = GatewaySettings().copy(
+        update={"poll_device_ids": device_ids, "workers": 0}
+    )
+    mqtt_settings = MQTTSettings()
+    # Broker disconnects previous client with the same identifier. JSON-RPC requests
+    # are received by supervisor and routed to the worker, which polls the device.
+    mqtt_settings = mqtt_settings.copy(
+        update={"client_id": f"{mqtt_settings.client_id}-{index}", "topics_sub": []}
+    )
+    gateway = await Gateway.create(
+        gateway_settings=gateway_settings,
+        api_settings=ApiSettings(),
+        mqtt_settings=mqtt_settings,
+        http_settings=HTTPSettings(),
+    )
+    gateway.worker = ClusterWorker(gateway=gateway, index=index, socket_path=socket_path)
+    await gateway.worker.connect()
+    await gateway.run()
+
+
 def main() -> None:
     setup_logging(settings=LogSettings())
 
@@ -60,5 +92,16 @@ def main() -> None:
     asyncio.run(load_and_run())
 
 
+def worker_main(index: int, socket_path: str, device_ids: list[int]) -> None:
+    """Entry point of worker process in multi-process mode."""
+    setup_logging(settings=LogSettings())
+
+    if _UVLOOP_ENABLE:
+        uvloop.install()
+    asyncio.run(
+        load_and_run_worker(index=index, socket_path=socket_path, device_ids=device_ids)
+    )
+
+
 if __name__ == "__main__":
     main()
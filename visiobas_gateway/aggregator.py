@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection, Optional
+
+from .schemas import BACnetObj
+
+ObjectKey = tuple[int, int]  # obj_id, obj_type_id
+
+
+@dataclass
+class ObjAggregate:
+    """Incremental statistics of verified object values inside one send window.
+
+    `obj` is a copy of the last verified state of object, so polling of object does not
+    change it until window is sent. Statistics are
+    calculated only for numeric values, so `min`, `max` and `mean` are `None` if
+    only "null" values were received in window.
+    """
+
+    obj: BACnetObj
+    count: int = 0
+    numeric_count: int = 0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+
+    def add(self, obj: BACnetObj) -> None:
+        """Updates aggregate with new verified state of object.
+
+        Args:
+            obj: Verified object instance.
+        """
+        self.obj = _snapshot(obj=obj)
+        self.count += 1
+
+        value = obj.verified_present_value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return
+
+        self.numeric_count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.mean is None:
+            self.mean = float(value)
+        else:
+            self.mean += (value - self.mean) / self.numeric_count
+
+    def to_mqtt_str(self) -> str:
+        """
+        Returns:
+            Statistics of window. Example: `75 1 0 12 20.5 22.5 21.4` (device id,
+                object id, object type, count, min, max, mean). Missing statistics are
+                `null`.
+        """
+        return (
+            f"{self.obj.device_id} {self.obj.object_id} {self.obj.object_type.value} "
+            f"{self.count} {_str(self.min)} {_str(self.max)} {_str(self.mean)}"
+        )
+
+
+def _snapshot(obj: BACnetObj) -> BACnetObj:
+    """Copies object with its mutable fields. Executor sets properties of polled object
+    in place, so window keeps verified state to send.
+    """
+    return obj.copy(
+        update={
+            "status_flags": obj.status_flags.copy(),
+            "priority_array": obj.priority_array and list(obj.priority_array),
+        }
+    )
+
+
+def _str(value: Optional[float]) -> str:
+    return "null" if value is None else str(value)
+
+
+class ObjAggregator:
+    """Accumulates verified objects between sends.
+
+    Each polling result is merged into per-object aggregate, so sending period does not
+    depend on polling period.
+    """
+
+    def __init__(self) -> None:
+        self._aggregates: dict[ObjectKey, ObjAggregate] = {}
+
+    def __len__(self) -> int:
+        return len(self._aggregates)
+
+    def add(self, objs: Collection[BACnetObj]) -> None:
+        """Merges verified objects into current window.
+
+        Args:
+            objs: Verified objects.
+        """
+        for obj in objs:
+            key = (obj.object_id, obj.object_type.value)
+            try:
+                self._aggregates[key].add(obj=obj)
+            except KeyError:
+                aggregate = ObjAggregate(obj=obj)
+                aggregate.add(obj=obj)
+                self._aggregates[key] = aggregate
+
+    def flush(self) -> list[ObjAggregate]:
+        """Closes current window and starts new one.
+
+        Returns:
+            Aggregates of closed window.
+        """
+        aggregates = list(self._aggregates.values())
+        self._aggregates = {}
+        return aggregates
@@ -11,6 +11,7 @@ from aiohttp.web_runner import AppRunner, TCPSite
 from ..schemas.settings import ApiSettings
 from ..utils import get_file_logger
 from .jsonrpc import JSON_RPC_HANDLERS
+from .stream import STREAM_HANDLERS, StreamHub
 
 if TYPE_CHECKING:
     from ..gateway import Gateway
@@ -40,6 +41,7 @@ class ApiServer:
         self._settings = settings
         self._app: Application | None = None
         self._stopped = asyncio.Event()
+        self.streams = StreamHub(max_pending=settings.STREAM_MAX_PENDING)
 
     # def __repr__(self) -> str:
     #     return self.__class__.__name__
@@ -48,7 +50,7 @@ class ApiServer:
     def handlers(
         self,
     ) -> tuple:
-        return JSON_RPC_HANDLERS
+        return (*JSON_RPC_HANDLERS, *STREAM_HANDLERS)
 
     @classmethod
     async def create(cls, gateway: Gateway, settings: ApiSettings) -> ApiServer:
@@ -77,6 +79,7 @@ class ApiServer:
         _LOG.debug("Creating app")
         app = Application()
         app["gateway"] = self._gateway
+        app["streams"] = self.streams
         app["scheduler"] = await aiojobs.create_scheduler(close_timeout=60, limit=100)
 
         # Configure default CORS settings.
@@ -0,0 +1,485 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from aiohttp_jsonrpc.common import py2json  # type: ignore
+from aiohttp_jsonrpc.exceptions import InvalidArguments, MethodNotFound  # type: ignore
+from pydantic import BaseModel
+
+from ...devices import BACnetDevice, BaseDevice, BasePollingDevice, WriteRequest
+from ...schemas import BACnetObj, ObjProperty, Reliability
+from .schemas import (
+    JsonRPCGetDeviceParams,
+    JsonRPCGetValuesParams,
+    JsonRPCObjectKey,
+    JsonRPCSetPointParams,
+    JsonRPCSetPointsParams,
+)
+
+if TYPE_CHECKING:
+    from ...gateway import Gateway
+else:
+    Gateway = "Gateway"
+
+RPCMethod = Callable[[Gateway, JsonRPCSetPointParams], Awaitable[dict]]
+RoutedRPCMethod = Callable[[Gateway, Any], Awaitable[dict]]
+
+_INVALID_REQUEST = {"code": -32600, "message": "Invalid Request"}
+
+
+def get_polling_device(gateway: Gateway, device_id: int) -> BasePollingDevice:
+    """
+    Args:
+        gateway: Gateway instance.
+        device_id: Device identifier.
+
+    Returns:
+        Device instance if exists.
+
+    Raises:
+        Exception: if device not found or its protocol is not polling.
+    """
+    device = gateway.get_device(dev_id=device_id)
+    if not isinstance(device, BaseDevice):
+        raise Exception(f"Device {device_id} not found.")
+    if isinstance(device, BasePollingDevice):
+        return device
+    raise Exception(
+        f"Device protocol must be polling. "
+        f"Protocol of device {device.id} is {device.protocol}. It's not polling "
+        f"protocol."
+    )
+
+
+def get_obj(obj_id: int, obj_type_id: int, device: BasePollingDevice) -> BACnetObj:
+    """
+    Args:
+        device: Device instance.
+        obj_type_id: Object type identifier.
+        obj_id: Object identifier.
+
+    Returns:
+        Object instance.
+
+    Raises:
+        Exception: if object not found.
+    """
+    obj = device.get_object(object_id=obj_id, object_type_id=obj_type_id)
+    if isinstance(obj, BACnetObj):
+        return obj
+    raise Exception(f"Object ({obj_type_id}, {obj_id}) not found in device {device.id}.")
+
+
+async def reset_set_point(gateway: Gateway, params: JsonRPCSetPointParams) -> dict:
+    """Resets priorityArray value in BACnet device."""
+    device = get_polling_device(gateway=gateway, device_id=params.device_id)
+    if not isinstance(device, BACnetDevice):
+        raise Exception(
+            "Only BACnet objects has priorityArray. "
+            "So only BACnet devices can reset priorityArray. "
+            f"This device using {device.protocol} protocol."
+        )
+    obj = get_obj(
+        device=device, obj_type_id=params.object_type.value, obj_id=params.object_id
+    )
+    output_obj, input_obj = await device.write_with_check(
+        value="null",
+        prop=ObjProperty.PRESENT_VALUE,
+        priority=params.priority.value,
+        output_obj=obj,
+        device=device,
+    )
+    await gateway._scheduler.spawn(  # pylint: disable=protected-access
+        gateway.send_objects(objs=[obj for obj in (output_obj, input_obj) if obj])
+    )
+    success = output_obj.priority_array[params.priority.value - 1] is None
+    if success:
+        return {"success": success}
+    return {
+        "success": success,
+        "msg": "Priority not `null`",
+        "debug": {
+            "priority": params.priority.value,
+            "priorityArray": output_obj.priority_array,
+        },
+    }
+
+
+async def write_set_point(gateway: Gateway, params: JsonRPCSetPointParams) -> dict:
+    """Writes value to any polling device."""
+    device = get_polling_device(gateway=gateway, device_id=params.device_id)
+    obj = get_obj(
+        device=device, obj_type_id=params.object_type.value, obj_id=params.object_id
+    )
+    output_obj, input_obj = await device.write_with_check(
+        value=params.value,
+        prop=ObjProperty.PRESENT_VALUE,
+        priority=params.priority.value,
+        output_obj=obj,
+        device=device,
+    )
+    await gateway._scheduler.spawn(  # pylint: disable=protected-access
+        gateway.send_objects(objs=[obj for obj in (output_obj, input_obj) if obj])
+    )
+    return _write_result(value=params.value, output_obj=output_obj)
+
+
+def _write_result(value: int | float, output_obj: BACnetObj) -> dict:
+    success = value == output_obj.present_value
+    if success:
+        return {"success": success}
+    return {
+        "success": success,
+        "msg": "The written value does not match the read.",
+        "debug": {
+            "written_value": value,
+            "read_value": output_obj.present_value,
+        },
+    }
+
+
+async def write_set_points(gateway: Gateway, params: JsonRPCSetPointsParams) -> dict:
+    """Writes values to several polling devices.
+
+    Writes are grouped by devices, devices are written concurrently. Each device writes
+    its objects and reads them back once. Written objects of all devices are sent to
+    servers by one update.
+
+    Returns:
+        Result of each write in order of params. Write, which failed, has result with
+        error message.
+    """
+    devices_indexes: dict[int, list[int]] = {}
+    for i, item in enumerate(params.writes):
+        devices_indexes.setdefault(item.device_id, []).append(i)
+
+    devices_results = await asyncio.gather(
+        *[
+            _write_device_set_points(
+                gateway=gateway, items=[params.writes[i] for i in indexes]
+            )
+            for indexes in devices_indexes.values()
+        ]
+    )
+    results: list[dict] = [{}] * len(params.writes)
+    objs: list[BACnetObj] = []
+    for indexes, (device_results, device_objs) in zip(
+        devices_indexes.values(), devices_results
+    ):
+        for i, result in zip(indexes, device_results):
+            results[i] = result
+        objs.extend(device_objs)
+    if objs:
+        await gateway._scheduler.spawn(  # pylint: disable=protected-access
+            gateway.send_objects(objs=objs)
+        )
+    return {"success": all(result["success"] for result in results), "results": results}
+
+
+async def _write_device_set_points(
+    gateway: Gateway, items: list[JsonRPCSetPointParams]
+) -> tuple[list[dict], list[BACnetObj]]:
+    """Writes values to objects of one device. Device is written by worker process,
+    which polls it, if gateway is clustered.
+
+    Returns:
+        Result of each write and written objects, which should be sent to servers.
+    """
+    device_id = items[0].device_id
+    try:
+        if gateway.cluster is not None:
+            response = await gateway.cluster.call(
+                device_id=device_id,
+                method="writeSetPoints",
+                params={"writes": [_set_point_dict(item) for item in items]},
+            )
+            return response["results"], []
+        device = get_polling_device(gateway=gateway, device_id=device_id)
+    except Exception as exc:  # pylint: disable=broad-except
+        return [_error_result(exc) for _ in items], []
+
+    results: list[dict] = [{}] * len(items)
+    indexes: list[int] = []
+    requests: list[WriteRequest] = []
+    for i, item in enumerate(items):
+        try:
+            obj = get_obj(
+                device=device, obj_type_id=item.object_type.value, obj_id=item.object_id
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            results[i] = _error_result(exc)
+            continue
+        indexes.append(i)
+        requests.append(
+            WriteRequest(
+                value=item.value,
+                obj=obj,
+                prop=ObjProperty.PRESENT_VALUE,
+                priority=item.priority.value,
+            )
+        )
+
+    written = await device.write_many_with_check(requests=requests) if requests else []
+    objs: dict[tuple[int, int], BACnetObj] = {}
+    for i, result in zip(indexes, written):
+        if isinstance(result, Exception):
+            results[i] = _error_result(result)
+            continue
+        output_obj, input_obj = result
+        results[i] = _write_result(value=items[i].value, output_obj=output_obj)
+        objs[(output_obj.object_id, output_obj.object_type.value)] = output_obj
+        if input_obj is not None:  # Output object may have no mapped input.
+            objs[(input_obj.object_id, input_obj.object_type.value)] = input_obj
+    return results, list(objs.values())
+
+
+def _set_point_dict(params: JsonRPCSetPointParams) -> dict[str, Any]:
+    return {
+        "device_id": params.device_id,
+        "object_type": params.object_type.value,
+        "object_id": params.object_id,
+        "property": params.property.value,
+        "priority": params.priority.value,
+        "value": params.value,
+    }
+
+
+def _error_result(exc: Exception) -> dict:
+    return {"success": False, "msg": str(exc)}
+
+
+async def get_values(gateway: Gateway, params: JsonRPCGetValuesParams) -> dict:
+    """Returns latest values of objects, polled by gateway, without reading devices.
+    Objects, which values are older than `maxAge`, are read from devices.
+
+    Returns:
+        State of each object in order of params. Object, which failed, has state with
+        error message.
+    """
+    devices_indexes: dict[int, list[int]] = {}
+    for i, key in enumerate(params.objects):
+        devices_indexes.setdefault(key.device_id, []).append(i)
+
+    devices_values = await asyncio.gather(
+        *[
+            _device_values(
+                gateway=gateway,
+                keys=[params.objects[i] for i in indexes],
+                max_age=params.max_age,
+            )
+            for indexes in devices_indexes.values()
+        ]
+    )
+    values: list[dict] = [{}] * len(params.objects)
+    for indexes, device_values in zip(devices_indexes.values(), devices_values):
+        for i, value in zip(indexes, device_values):
+            values[i] = value
+    return {"values": values}
+
+
+async def get_device(gateway: Gateway, params: JsonRPCGetDeviceParams) -> dict:
+    """Returns latest values of all objects of device, polled by gateway. Objects, which
+    values are older than `maxAge`, are read from device.
+    """
+    if gateway.cluster is not None:
+        return await gateway.cluster.call(
+            device_id=params.device_id,
+            method="getDevice",
+            params={"device_id": params.device_id, "maxAge": params.max_age},
+        )
+    device = get_polling_device(gateway=gateway, device_id=params.device_id)
+    objs = [
+        obj for objs_group in device.object_groups.values() for obj in objs_group.values()
+    ]
+    values = await asyncio.gather(
+        *[_obj_value(device=device, obj=obj, max_age=params.max_age) for obj in objs]
+    )
+    return {"device_id": device.id, "values": list(values)}
+
+
+async def _device_values(
+    gateway: Gateway, keys: list[JsonRPCObjectKey], max_age: float | None
+) -> list[dict]:
+    """Returns latest values of objects of one device. Values are taken from worker
+    process, which polls the device, if gateway is clustered.
+    """
+    device_id = keys[0].device_id
+    try:
+        if gateway.cluster is not None:
+            response = await gateway.cluster.call(
+                device_id=device_id,
+                method="getValues",
+                params={
+                    "objects": [_object_key_dict(key) for key in keys],
+                    "maxAge": max_age,
+                },
+            )
+            return response["values"]
+        device = get_polling_device(gateway=gateway, device_id=device_id)
+    except Exception as exc:  # pylint: disable=broad-except
+        return [{**_object_key_dict(key), "error": str(exc)} for key in keys]
+
+    async def _value(key: JsonRPCObjectKey) -> dict:
+        try:
+            obj = get_obj(
+                device=device, obj_type_id=key.object_type.value, obj_id=key.object_id
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            return {**_object_key_dict(key), "error": str(exc)}
+        return await _obj_value(device=device, obj=obj, max_age=max_age)
+
+    return list(await asyncio.gather(*[_value(key) for key in keys]))
+
+
+async def _obj_value(
+    device: BasePollingDevice, obj: BACnetObj, max_age: float | None
+) -> dict:
+    """
+    Returns:
+        Latest state of object. Object is read from device, if it is older than
+        `max_age`.
+    """
+    key = _object_key_dict(obj)
+    if max_age is not None:
+        try:
+            obj = await device.read_fresh(obj=obj, max_age=max_age)
+        except Exception as exc:  # pylint: disable=broad-except
+            return {**key, "error": str(exc)}
+    reliability = obj.reliability
+    return {
+        **key,
+        "value": obj.verified_present_value,
+        "status_flags": obj.status_flags.flags,
+        "reliability": (
+            reliability.value if isinstance(reliability, Reliability) else reliability
+        ),
+        "age": (datetime.now() - obj.updated).total_seconds() if obj.updated else None,
+    }
+
+
+def _object_key_dict(obj: JsonRPCObjectKey | BACnetObj) -> dict[str, Any]:
+    return {
+        "device_id": obj.device_id,
+        "object_type": obj.object_type.value,
+        "object_id": obj.object_id,
+    }
+
+
+RPC_METHODS: dict[str, RPCMethod] = {
+    "resetSetPoint": reset_set_point,
+    "writeSetPoint": write_set_point,
+}
+
+# Methods, which route calls to worker processes by themselves (e.g. params contain
+# several devices). Value: params model, method.
+ROUTED_RPC_METHODS: dict[str, tuple[type[BaseModel], RoutedRPCMethod]] = {
+    "writeSetPoints": (JsonRPCSetPointsParams, write_set_points),
+    "getValues": (JsonRPCGetValuesParams, get_values),
+    "getDevice": (JsonRPCGetDeviceParams, get_device),
+}
+
+
+async def call(gateway: Gateway, method: str, params: dict[str, Any]) -> dict:
+    """Calls method locally or in worker process, which polls the device.
+
+    Raises:
+        MethodNotFound: if method not exists.
+        ValidationError: if params are invalid.
+    """
+    if method in ROUTED_RPC_METHODS:
+        params_model, routed_method = ROUTED_RPC_METHODS[method]
+        return await routed_method(gateway, params_model(**params))
+    if method not in RPC_METHODS:
+        raise MethodNotFound(f"Method {method!r} not found")
+    set_point_params = JsonRPCSetPointParams(**params)
+    if gateway.cluster is not None:
+        return await gateway.cluster.call(
+            device_id=set_point_params.device_id, method=method, params=params
+        )
+    return await RPC_METHODS[method](gateway, set_point_params)
+
+
+async def dispatch(gateway: Gateway, request: dict[str, Any]) -> dict[str, Any] | None:
+    """Handles JSON-RPC 2.0 request, received not over HTTP (e.g. from MQTT broker).
+
+    Errors are formatted the same way as by `JsonRPCView`.
+
+    Returns:
+        JSON-RPC 2.0 response. None for notification (request without `id`).
+    """
+    request_id = request.get("id")
+    try:
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            raise InvalidArguments("Params must be passed by name")
+        result = await call(gateway=gateway, method=request["method"], params=params)
+    except Exception as exc:  # pylint: disable=broad-except
+        return {"jsonrpc": "2.0", "id": request_id, "error": py2json(exc)}
+    if "id" not in request:
+        return None
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+async def dispatch_batch(
+    gateway: Gateway, requests: list[Any]
+) -> list[dict[str, Any]] | dict[str, Any] | None:
+    """Handles JSON-RPC 2.0 batch.
+
+    `writeSetPoint` requests of batch are written by one `writeSetPoints` call, so
+    writes are grouped by devices. Failed write has result with error message, as in
+    `writeSetPoints`. Other requests are handled concurrently.
+
+    Returns:
+        Responses to requests with `id`. None, if batch contains only notifications.
+    """
+    if not requests:
+        return {"jsonrpc": "2.0", "id": None, "error": _INVALID_REQUEST}
+
+    responses: list[dict[str, Any] | None] = [None] * len(requests)
+    writes: dict[int, JsonRPCSetPointParams] = {}  # Key: index of request.
+    others: list[int] = []
+    for i, request in enumerate(requests):
+        if not isinstance(request, dict):
+            responses[i] = {"jsonrpc": "2.0", "id": None, "error": _INVALID_REQUEST}
+            continue
+        if request.get("method") == "writeSetPoint" and isinstance(
+            request.get("params"), dict
+        ):
+            try:
+                writes[i] = JsonRPCSetPointParams(**request["params"])
+                continue
+            except Exception:  # pylint: disable=broad-except
+                pass  # Error response is formatted by `dispatch`.
+        others.append(i)
+
+    async def _write() -> None:
+        if not writes:
+            return None
+        try:
+            result = await write_set_points(
+                gateway=gateway,
+                params=JsonRPCSetPointsParams(writes=list(writes.values())),
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            for i in writes:
+                responses[i] = {
+                    "jsonrpc": "2.0",
+                    "id": requests[i].get("id"),
+                    "error": py2json(exc),
+                }
+            return None
+        for i, item_result in zip(writes, result["results"]):
+            if "id" in requests[i]:
+                responses[i] = {
+                    "jsonrpc": "2.0",
+                    "id": requests[i]["id"],
+                    "result": item_result,
+                }
+
+    async def _dispatch(i: int) -> None:
+        responses[i] = await dispatch(gateway=gateway, request=requests[i])
+
+    await asyncio.gather(_write(), *[_dispatch(i) for i in others])
+    return [response for response in responses if response is not None] or None
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Optional, Union
 
-from pydantic import Field, validator
+from pydantic import BaseModel, Field, validator
 
 from ...schemas import BaseBACnetObj, ObjProperty, Priority
 
@@ -35,3 +35,41 @@ class JsonRPCSetPointParams(BaseBACnetObj):
                 return int(value)
         return value
         # raise ValueError(f"Value must be number. Got `{type(value)}`.")
+
+
+class JsonRPCSetPointsParams(BaseModel):
+    """Parameters of batch write."""
+
+    writes: list[JsonRPCSetPointParams] = Field(..., min_items=1)
+
+
+class JsonRPCObjectKey(BaseBACnetObj):
+    """Identifies object to read."""
+
+    name: str = Field(default="")
+
+
+class JsonRPCGetValuesParams(BaseModel):
+    """Parameters of reading latest values of objects."""
+
+    objects: list[JsonRPCObjectKey] = Field(..., min_items=1)
+    max_age: Optional[float] = Field(
+        default=None,
+        ge=0,
+        alias="maxAge",
+        description="""Maximum age (in seconds) of value. Objects, which were read
+        earlier, are read from device. Values are not read, if not provided.""",
+    )
+
+    class Config:  # pylint: disable=missing-class-docstring
+        allow_population_by_field_name = True
+
+
+class JsonRPCGetDeviceParams(BaseModel):
+    """Parameters of reading latest values of all objects of device."""
+
+    device_id: int = Field(..., gt=0)
+    max_age: Optional[float] = Field(default=None, ge=0, alias="maxAge")
+
+    class Config:  # pylint: disable=missing-class-docstring
+        allow_population_by_field_name = True
@@ -1,13 +1,12 @@
 from typing import Any
 
+from aiohttp.web import Response
 from aiohttp_cors import CorsViewMixin, ResourceOptions  # type: ignore
 from aiohttp_jsonrpc import handler  # type: ignore
 
-from ...devices import BACnetDevice
-from ...schemas import ObjProperty
 from ...utils import get_file_logger, log_exceptions
 from ..base_view import BaseView
-from .schemas import JsonRPCSetPointParams
+from .methods import call, dispatch_batch
 
 _LOG = get_file_logger(name=__name__)
 
@@ -34,78 +33,50 @@ class JsonRPCView(handler.JSONRPCView, BaseView, CorsViewMixin):
         )
     }
 
+    async def post(self) -> Response:
+        """Handles request. Batch is handled by `dispatch_batch`, so writes of batch are
+        grouped by devices.
+        """
+        await self.authorize()
+        body = self._parse_body(await self.request.read())
+        if not isinstance(body, list):
+            return await super().post()
+        _LOG.debug("Call batch", extra={"requests_quantity": len(body)})
+        return self._make_response(
+            await dispatch_batch(gateway=self._gateway, requests=body)
+        )
+
     @log_exceptions(logger=_LOG)
     async def rpc_resetSetPoint(self, *args: Any, **kwargs: Any) -> dict:
         """Resets priorityArray value in BACnet device."""
-        params = JsonRPCSetPointParams(**kwargs)
-        _LOG.debug(
-            "Call params", extra={"args_": args, "kwargs_": kwargs, "params": params}
-        )
-
-        device = self.get_polling_device(device_id=params.device_id)
-        if not isinstance(device, BACnetDevice):
-            raise Exception(
-                "Only BACnet objects has priorityArray. "
-                "So only BACnet devices can reset priorityArray. "
-                f"This device using {device.protocol} protocol."
-            )
-        obj = self.get_obj(
-            device=device, obj_type_id=params.object_type.value, obj_id=params.object_id
-        )
-        output_obj, input_obj = await device.write_with_check(
-            value="null",
-            prop=ObjProperty.PRESENT_VALUE,
-            priority=params.priority.value,
-            output_obj=obj,
-            device=device,
-        )
-        await self._scheduler.spawn(
-            self._gateway.send_objects(objs=[obj for obj in (output_obj, input_obj) if obj])
-        )
-        success = output_obj.priority_array[params.priority.value - 1] is None
-        if success:
-            return {"success": success}
-        return {
-            "success": success,
-            "msg": "Priority not `null`",
-            "debug": {
-                "priority": params.priority.value,
-                "priorityArray": output_obj.priority_array,
-            },
-        }
+        return await self._call("resetSetPoint", *args, **kwargs)
 
     @log_exceptions(logger=_LOG)
     async def rpc_writeSetPoint(self, *args: Any, **kwargs: Any) -> dict:
         """Writes value to any polling device."""
-        params = JsonRPCSetPointParams(**kwargs)
+        return await self._call("writeSetPoint", *args, **kwargs)
+
+    @log_exceptions(logger=_LOG)
+    async def rpc_writeSetPoints(self, *args: Any, **kwargs: Any) -> dict:
+        """Writes values to several polling devices. Devices are written concurrently."""
+        return await self._call("writeSetPoints", *args, **kwargs)
+
+    @log_exceptions(logger=_LOG)
+    async def rpc_getValues(self, *args: Any, **kwargs: Any) -> dict:
+        """Returns latest values of objects without reading devices."""
+        return await self._call("getValues", *args, **kwargs)
+
+    @log_exceptions(logger=_LOG)
+    async def rpc_getDevice(self, *args: Any, **kwargs: Any) -> dict:
+        """Returns latest values of all objects of device without reading it."""
+        return await self._call("getDevice", *args, **kwargs)
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> dict:
+        """Calls method locally or in worker process, which polls the device."""
         _LOG.debug(
-            "Call params", extra={"args_": args, "kwargs_": kwargs, "params": params}
-        )
-        device = self.get_polling_device(device_id=params.device_id)
-        obj = self.get_obj(
-            device=device, obj_type_id=params.object_type.value, obj_id=params.object_id
-        )
-        output_obj, input_obj = await device.write_with_check(
-            value=params.value,
-            prop=ObjProperty.PRESENT_VALUE,
-            priority=params.priority.value,
-            output_obj=obj,
-            device=device,
-        )
-        await self._scheduler.spawn(
-            self._gateway.send_objects(objs=[obj for obj in (output_obj, input_obj) if obj])
+            "Call params", extra={"method": method, "args_": args, "kwargs_": kwargs}
         )
-        success = params.value == output_obj.present_value
-        if success:
-            return {"success": success}
-        return {
-            "success": success,
-            "msg": "The written value does not match the read.",
-            "debug": {
-                "written_value": params.value,
-                "read_value": output_obj.present_value,
-            },
-        }
+        return await call(gateway=self._gateway, method=method, params=kwargs)
 
     # async def rpc_ptz(self, *args: Any, **kwargs: Any) -> dict:
     #     _LOG.debug(
@@ -0,0 +1,11 @@
+from .hub import StreamHub, StreamSubscriber
+from .view import StreamView
+
+STREAM_HANDLERS = (StreamView,)
+
+__all__ = [
+    "StreamHub",
+    "StreamSubscriber",
+    "StreamView",
+    "STREAM_HANDLERS",
+]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Iterable, Sequence
+
+from ...utils import get_file_logger
+from ...utils.telemetry_codec import TelemetryRecord
+
+_LOG = get_file_logger(name=__name__)
+
+StreamKey = tuple[int, int, int]  # device_id, obj_type_id, obj_id
+
+
+class StreamSubscriber:
+    """Outbound queue of WebSocket client.
+
+    Queue is bounded and keyed by object, so only the latest value is kept for each
+    object. When queue is full, the oldest value is dropped. Slow client never blocks
+    producer of values.
+    """
+
+    def __init__(self, max_pending: int):
+        self._max_pending = max_pending
+        self._pending: OrderedDict[StreamKey, TelemetryRecord] = OrderedDict()
+        self._ready = asyncio.Event()
+
+        self.devices: set[int] = set()
+        self.objects: set[StreamKey] = set()
+
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{self.stats}"
+
+    @property
+    def depth(self) -> int:
+        """Number of values waiting for send."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "devices": len(self.devices),
+            "objects": len(self.objects),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+    def subscribe(self, devices: Iterable[int], objects: Iterable[StreamKey]) -> None:
+        self.devices.update(devices)
+        self.objects.update(objects)
+
+    def unsubscribe(self, devices: Iterable[int], objects: Iterable[StreamKey]) -> None:
+        self.devices.difference_update(devices)
+        self.objects.difference_update(objects)
+
+    def put(self, device_id: int, records: Sequence[TelemetryRecord]) -> None:
+        """Puts values of subscribed objects into queue."""
+        subscribed_device = device_id in self.devices
+        for record in records:
+            key = (device_id, record.object_type, record.object_id)
+            if not subscribed_device and key not in self.objects:
+                continue
+            if key in self._pending:
+                self.coalesced += 1
+                del self._pending[key]  # Moves updated value to the end of queue.
+            elif len(self._pending) >= self._max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self._pending[key] = record
+        if self._pending:
+            self._ready.set()
+
+    async def get(self) -> list[tuple[int, TelemetryRecord]]:
+        """Waits for values and takes all of them from queue.
+
+        Returns:
+            Device identifiers and values of objects.
+        """
+        await self._ready.wait()
+        values = [(key[0], record) for key, record in self._pending.items()]
+        self._pending.clear()
+        self._ready.clear()
+        self.sent += len(values)
+        return values
+
+
+class StreamHub:
+    """Distributes changes of verified values of objects to WebSocket clients.
+
+    Value is streamed, if value or status flags of object are changed. New subscriber
+    receives the last values of subscribed objects.
+    """
+
+    def __init__(self, max_pending: int):
+        self._max_pending = max_pending
+        self._subscribers: set[StreamSubscriber] = set()
+        self._last: dict[StreamKey, TelemetryRecord] = {}
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def add(self) -> StreamSubscriber:
+        subscriber = StreamSubscriber(max_pending=self._max_pending)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def remove(self, subscriber: StreamSubscriber) -> None:
+        self._subscribers.discard(subscriber)
+        _LOG.debug("Subscriber removed", extra={**subscriber.stats})
+
+    def subscribe(
+        self,
+        subscriber: StreamSubscriber,
+        devices: Iterable[int],
+        objects: Iterable[StreamKey],
+    ) -> None:
+        """Subscribes client and puts the last values of subscribed objects."""
+        devices, objects = set(devices), set(objects)
+        subscriber.subscribe(devices=devices, objects=objects)
+        for key, record in self._last.items():
+            if key[0] in devices or key in objects:
+                subscriber.put(device_id=key[0], records=[record])
+
+    def put(self, device_id: int, records: Sequence[TelemetryRecord]) -> None:
+        """Puts changed values of device objects into queues of subscribers."""
+        changed = []
+        for record in records:
+            key = (device_id, record.object_type, record.object_id)
+            last = self._last.get(key)
+            self._last[key] = record
+            if (
+                last is None
+                or last.value != record.value
+                or last.status_flags != record.status_flags
+            ):
+                changed.append(record)
+        if not changed:
+            return None
+        for subscriber in self._subscribers:
+            subscriber.put(device_id=device_id, records=changed)
+        return None
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from aiohttp import WSMsgType
+from aiohttp.web import HTTPBadRequest, WebSocketResponse
+from aiohttp_cors import CorsViewMixin, ResourceOptions  # type: ignore
+
+from ...utils import get_file_logger
+from ..base_view import BaseView
+from .hub import StreamHub, StreamKey, StreamSubscriber
+
+try:
+    import msgpack  # type: ignore
+
+    _MSGPACK_ENABLE = True
+except ImportError:
+    _MSGPACK_ENABLE = False
+
+_LOG = get_file_logger(name=__name__)
+
+_HEARTBEAT = 30  # Seconds between pings of client.
+
+
+class StreamView(BaseView, CorsViewMixin):
+    """WebSocket endpoint streaming changes of verified values of objects.
+
+    Client chooses encoding of values by `codec` query parameter: `json` (default) or
+    `msgpack`. Client subscribes to whole devices or separate objects by JSON commands::
+
+        {"subscribe": {"devices": [846], "objects": [[846, 1, 75]]}}
+        {"unsubscribe": {"devices": [846]}}
+
+    The last values of subscribed objects are sent after subscription, then values
+    are sent when value or status flags of object change. Values are sent as
+    `{"values": [[device_id, object_id, object_type, value, status_flags, timestamp],
+    ...]}`.
+    """
+
+    URL_PATH = r"/ws"
+
+    cors_config = {
+        "*": ResourceOptions(
+            allow_credentials=False,
+            expose_headers="*",
+            allow_headers="*",
+            allow_methods=[
+                "GET",
+            ],
+        )
+    }
+
+    @property
+    def _streams(self) -> StreamHub:
+        return self.request.app["streams"]
+
+    async def get(self) -> WebSocketResponse:
+        codec = self.request.query.get("codec", "json")
+        if codec not in {"json", "msgpack"}:
+            raise HTTPBadRequest(reason=f"Unknown codec: {codec}")
+        if codec == "msgpack" and not _MSGPACK_ENABLE:
+            raise HTTPBadRequest(reason="Codec `msgpack` is not installed")
+
+        ws = WebSocketResponse(heartbeat=_HEARTBEAT)
+        await ws.prepare(self.request)
+        subscriber = self._streams.add()
+        sender = asyncio.ensure_future(
+            self._send(ws=ws, subscriber=subscriber, codec=codec)
+        )
+        _LOG.debug("Client connected", extra={"remote": self.request.remote})
+        try:
+            async for msg in ws:
+                if msg.type is WSMsgType.TEXT:
+                    await self._handle_command(
+                        ws=ws, streams=self._streams, subscriber=subscriber, data=msg.data
+                    )
+        finally:
+            sender.cancel()
+            self._streams.remove(subscriber=subscriber)
+            _LOG.debug("Client disconnected", extra={"remote": self.request.remote})
+        return ws
+
+    @staticmethod
+    async def _handle_command(
+        ws: WebSocketResponse, streams: StreamHub, subscriber: StreamSubscriber, data: str
+    ) -> None:
+        try:
+            command = json.loads(data)
+            if "subscribe" in command:
+                devices, objects = _parse_keys(params=command["subscribe"])
+                streams.subscribe(subscriber=subscriber, devices=devices, objects=objects)
+            elif "unsubscribe" in command:
+                subscriber.unsubscribe(*_parse_keys(params=command["unsubscribe"]))
+            else:
+                raise ValueError("Expected `subscribe` or `unsubscribe` command")
+        except Exception as exc:  # pylint: disable=broad-except
+            await ws.send_json({"error": str(exc)})
+            return None
+        await ws.send_json(
+            {
+                "subscribed": {
+                    "devices": sorted(subscriber.devices),
+                    "objects": sorted(subscriber.objects),
+                }
+            }
+        )
+
+    @staticmethod
+    async def _send(
+        ws: WebSocketResponse, subscriber: StreamSubscriber, codec: str
+    ) -> None:
+        try:
+            while True:
+                values = await subscriber.get()
+                message = {"values": [[device_id, *record] for device_id, record in values]}
+                if codec == "msgpack":
+                    await ws.send_bytes(msgpack.packb(message))
+                else:
+                    await ws.send_str(json.dumps(message, default=str))
+        except ConnectionError as exc:
+            _LOG.debug("Failed send to client", extra={"exc": exc})
+            await ws.close()
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOG.warning("Failed send to client. Closing connection", extra={"exc": exc})
+            await ws.close()
+
+
+def _parse_keys(params: dict[str, Any]) -> tuple[list[int], list[StreamKey]]:
+    """
+    Returns:
+        Devices identifiers and keys of objects.
+
+    Raises:
+        ValueError: if keys are invalid.
+    """
+    devices = [int(device_id) for device_id in params.get("devices", [])]
+    objects = []
+    for key in params.get("objects", []):
+        device_id, obj_type_id, obj_id = key
+        objects.append((int(device_id), int(obj_type_id), int(obj_id)))
+    return devices, objects
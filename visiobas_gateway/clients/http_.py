@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import asyncio
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Collection
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Collection
 
 import aiohttp
 
+from ..executors import CPU_EXECUTOR, FILES_EXECUTOR
 from ..schemas import ObjType
 from ..schemas.settings import HTTPServerConfig, HTTPSettings
 from ..utils import get_file_logger, kebab_case, log_exceptions
+from ..utils.compression import CompressionStats, compress
+from ..utils.json_stream import JSONArrayStream
+from .outbox import Outbox, group_records
+from .send_queue import SendQueue
 
 if TYPE_CHECKING:
     from ..gateway import Gateway
@@ -17,6 +22,9 @@ else:
 
 _LOG = get_file_logger(name=__name__)
 
+# Data greater than this size (in bytes) is compressed in executor.
+_COMPRESS_IN_EXECUTOR_SIZE = 65_536
+
 
 class HTTPClient:
     """HTTP client of visiobas_gateway."""
@@ -40,6 +48,16 @@ class HTTPClient:
 
         self._authorized = False
 
+        self.send_queue = SendQueue(
+            send=self._send_device,
+            linger=settings.send_linger,
+            batch_size=settings.send_batch_size,
+        )
+        self.compression_stats = CompressionStats()
+        self._outboxes: dict[str, Outbox] = {}  # Key: server url
+        self._replay_tasks: dict[str, asyncio.Task] = {}
+        self._replay_needed: dict[str, bool] = {}
+
     def __repr__(self) -> str:
         return self.__class__.__name__
 
@@ -56,8 +74,13 @@ class HTTPClient:
         await self.wait_login(next_attempt=self._settings.next_attempt)
 
     async def shutdown_tasks(self) -> None:
-        """Perform logout."""
+        """Sends pending data. Perform logout. Closes outboxes."""
+        await self.send_queue.close()
+        for task in self._replay_tasks.values():
+            task.cancel()
         await self.logout(servers=[self.server_get, *self.servers_post])
+        for outbox in self._outboxes.values():
+            await self._gtw.async_add_job(outbox.close, executor=FILES_EXECUTOR)
 
     async def get_objects(
         self, dev_id: int, obj_types: Collection[ObjType]
@@ -90,6 +113,57 @@ class HTTPClient:
 
         return extracted_data
 
+    async def iter_objects(
+        self, dev_id: int, obj_type: ObjType
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Requests objects of provided type. Yields objects as soon as they are
+        received, so whole response is never kept in memory.
+
+        Args:
+            dev_id: device identifier
+            obj_type: type of objects
+
+        Yields:
+            Objects, received by chunk of response.
+
+        Raises:
+            aiohttp.ClientResponseError: if response status >= 400.
+            aiohttp.ClientPayloadError: if failure result of the request.
+            json.JSONDecodeError: if response is not valid JSON.
+        """
+        url = self._URL_GET.format(
+            base_url=self.server_get.get_url_str(url=self.server_get.current_url),
+            device_id=str(dev_id),
+            object_type_kebab=kebab_case(obj_type.name),
+        )
+        _LOG.debug("Perform streaming request", extra={"method": "GET", "url": url})
+        async with self._session.request(
+            method="GET",
+            url=url,
+            headers=self.server_get.auth_headers,
+            timeout=self._timeout,
+        ) as resp:
+            resp.raise_for_status()
+            stream = JSONArrayStream(field="data")
+            async for chunk in resp.content.iter_any():
+                objs = stream.feed(chunk)
+                if not stream.fields.get("success", True):
+                    break
+                if objs:
+                    yield objs
+            else:
+                objs = stream.close()
+                if objs:
+                    yield objs
+            if not stream.fields.get("success"):
+                raise aiohttp.ClientPayloadError(
+                    f"Failure server result: {resp.url} {stream.fields}"
+                )
+            _LOG.debug(
+                "Successfully response",
+                extra={"url": resp.url, "objects_quantity": stream.items_quantity},
+            )
+
     @log_exceptions(logger=_LOG)
     async def logout(self, servers: list[HTTPServerConfig]) -> None:
         """Performs log out from servers.
@@ -223,46 +297,197 @@ class HTTPClient:
                 continue
         return False
 
+    async def _send_device(self, dev_id: int, data: bytes) -> None:
+        await self.post_device(servers=self.servers_post, dev_id=dev_id, data=data)
+
     @log_exceptions(logger=_LOG)
     async def post_device(
-        self, servers: Collection[HTTPServerConfig], dev_id: int, data: str
+        self, servers: Collection[HTTPServerConfig], dev_id: int, data: str | bytes
     ) -> None:
         """Performs POST requests with data to servers.
 
+        Data, which was not sent to server, is stored in the outbox of server. Stored
+        data is sent, when server becomes available.
+
         Args:
             servers: servers to send POST requests to
             dev_id: device identifier
             data: body of POST request
+        """
+        servers = list(servers)
+        if isinstance(data, str):
+            data = data.encode()
+        body, headers = await self._encode_body(body=data)
+        results = await asyncio.gather(
+            *[
+                self._post_light(server=server, dev_id=dev_id, body=body, headers=headers)
+                for server in servers
+            ],
+            return_exceptions=True,
+        )
+        for server, result in zip(servers, results):
+            if isinstance(result, Exception):
+                _LOG.warning(
+                    "Failed to send data",
+                    extra={"device_id": dev_id, "server": server, "exc": result},
+                )
+                try:
+                    await self._store_failed(server=server, dev_id=dev_id, data=data)
+                except Exception:  # pylint: disable=broad-except
+                    pass  # Logged in `_store_failed`. Other servers should be served.
+            else:
+                self._spawn_replay(server=server)
+        _LOG.debug(
+            "Data sent",
+            extra={
+                "device_id": dev_id,
+                "servers": servers,
+            },
+        )
+
+    async def _post_light(
+        self, server: HTTPServerConfig, dev_id: int, body: bytes, headers: dict[str, str]
+    ) -> None:
+        await self.request(
+            method="POST",
+            url=self._URL_POST_LIGHT.format(
+                base_url=server.get_url_str(url=server.current_url),
+                device_id=str(dev_id),
+            ),
+            headers={**server.auth_headers, **headers},
+            data=body,
+            extract_data=True,
+        )
+
+    async def _encode_body(self, body: bytes) -> tuple[bytes, dict[str, str]]:
+        """Prepares body of POST request. Compresses it, if compression is enabled.
+
+        Large data is compressed in executor to not block the event loop.
 
         Returns:
-            POST request is successful.
+            Body and headers of request.
         """
-        post_tasks = [
-            self.request(
-                method="POST",
-                url=self._URL_POST_LIGHT.format(
-                    base_url=server.get_url_str(url=server.current_url),
-                    device_id=str(dev_id),
-                ),
-                headers=server.auth_headers,
-                data=data,
-                extract_data=True,
+        headers = {"Content-Type": "text/plain; charset=utf-8"}
+        method = self._settings.compression
+        if method is None or len(body) < self._settings.compression_threshold:
+            return body, headers
+
+        if len(body) > _COMPRESS_IN_EXECUTOR_SIZE:
+            compressed, cpu_time = await self._gtw.async_add_job(
+                compress,
+                body,
+                method,
+                self._settings.compression_level,
+                executor=CPU_EXECUTOR,
             )
-            for server in servers
-        ]
-        await asyncio.gather(*post_tasks)
+        else:
+            compressed, cpu_time = compress(
+                data=body, method=method, level=self._settings.compression_level
+            )
+        self.compression_stats.add(
+            raw_size=len(body), compressed_size=len(compressed), cpu_time=cpu_time
+        )
         _LOG.debug(
-            "Successfully sent data",
+            "Data compressed",
             extra={
-                "device_id": dev_id,
-                "servers": servers,
+                "raw_size": len(body),
+                "compressed_size": len(compressed),
+                "ratio": len(body) / len(compressed),
+                "cpu_time": cpu_time,
+                "total_ratio": self.compression_stats.ratio,
+                "total_cpu_time": self.compression_stats.cpu_time,
             },
         )
-        # TODO: What we should do with failed data?
-        # failed_data = [
-        #     await self.async_extract_response_data(resp=await resp) for resp in
-        #     asyncio.as_completed(asyncio.gather(*post_tasks))
-        # ]
+        headers["Content-Encoding"] = method.value
+        return compressed, headers
+
+    @staticmethod
+    def _outbox_key(server: HTTPServerConfig) -> str:
+        url = server.urls[0]
+        return f"{url.host}_{url.port}"
+
+    async def _get_outbox(self, server: HTTPServerConfig) -> Outbox:
+        key = self._outbox_key(server=server)
+        if key not in self._outboxes:
+            self._outboxes[key] = await self._gtw.async_add_job(
+                Outbox,
+                self._settings.outbox_dir / key,
+                self._settings.outbox_segment_size,
+                self._settings.outbox_max_size,
+                executor=FILES_EXECUTOR,
+            )
+        return self._outboxes[key]
+
+    @log_exceptions(logger=_LOG)
+    async def _store_failed(
+        self, server: HTTPServerConfig, dev_id: int, data: bytes
+    ) -> None:
+        """Stores data, which was not sent, into outbox of server."""
+        if not self._settings.outbox_max_size:
+            return None
+        outbox = await self._get_outbox(server=server)
+        await self._gtw.async_add_job(outbox.append, dev_id, data, executor=FILES_EXECUTOR)
+        self._replay_needed[self._outbox_key(server=server)] = True
+
+    def _spawn_replay(self, server: HTTPServerConfig) -> None:
+        """Spawns sending data from outbox of server, if it is not running."""
+        if not self._settings.outbox_max_size:
+            return None
+        key = self._outbox_key(server=server)
+        if not self._replay_needed.get(key, True):
+            return None
+        task = self._replay_tasks.get(key)
+        if task is not None and not task.done():
+            return None
+        task = self._gtw.loop.create_task(self._replay(server=server))
+        task.add_done_callback(self._on_replay_done)
+        self._replay_tasks[key] = task
+
+    @staticmethod
+    def _on_replay_done(task: asyncio.Task) -> None:
+        """Retrieves exception of replay task. It is logged in `_replay`."""
+        if not task.cancelled():
+            task.exception()
+
+    @log_exceptions(logger=_LOG)
+    async def _replay(self, server: HTTPServerConfig) -> None:
+        """Sends data from outbox of server in order, grouped by devices.
+
+        Stops on first failure. Not delivered data remains in outbox.
+        """
+        key = self._outbox_key(server=server)
+        outbox = await self._get_outbox(server=server)
+        self._replay_needed[key] = False
+
+        while oldest := await self._gtw.async_add_job(
+            outbox.read_oldest, executor=FILES_EXECUTOR
+        ):
+            segment, records = oldest
+            delivered = 0
+            try:
+                for dev_id, data, quantity in group_records(
+                    records=records, max_size=self._settings.outbox_segment_size
+                ):
+                    body, headers = await self._encode_body(body=data)
+                    await self._post_light(
+                        server=server, dev_id=dev_id, body=body, headers=headers
+                    )
+                    delivered += quantity
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+                _LOG.warning(
+                    "Failed to send data from outbox",
+                    extra={"server": server, "outbox": outbox, "exc": exc},
+                )
+                self._replay_needed[key] = True
+                return None
+            finally:
+                await self._gtw.async_add_job(
+                    outbox.mark_delivered, segment, delivered, executor=FILES_EXECUTOR
+                )
+            _LOG.info(
+                "Data from outbox sent",
+                extra={"server": server, "outbox": outbox, "records_quantity": delivered},
+            )
 
     # @log_exceptions
     # async def post_property(
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from dataclasses import dataclass
 from json import JSONDecodeError, dumps, loads
-from typing import TYPE_CHECKING, Any, Sequence
-
-import paho.mqtt.client as mqtt  # type: ignore
+from typing import TYPE_CHECKING, Any, Coroutine, Sequence
 
+from ..api.jsonrpc.methods import dispatch, dispatch_batch
 from ..schemas.mqtt import Qos, ResultCode
 from ..schemas.settings import MQTTSettings
 from ..utils import get_file_logger
+from . import mqtt_protocol as proto
+from .mqtt_publisher import MQTTPublisher
+from .mqtt_router import MessageHandler, TopicRouter
 
 _LOG = get_file_logger(name=__name__)
 
@@ -17,34 +21,71 @@ if TYPE_CHECKING:
 else:
     Gateway = "Gateway"
 
+_RECONNECT_MIN_DELAY = 1
+_RECONNECT_MAX_DELAY = 60
+_MAX_PACKET_ID = 65_535
+
+
+@dataclass
+class _Delivery:
+    """Published QoS 1/2 message, waiting for acknowledgement."""
+
+    packet_id: int
+    packet: bytes
+    future: asyncio.Future
+    released: bool = False  # PUBREC received (QoS 2).
+
+    def resend_packet(self) -> bytes:
+        """Packet to send after reconnect."""
+        if self.released:
+            return proto.ack(proto.PacketType.PUBREL, self.packet_id)
+        return bytes((self.packet[0] | 0x08,)) + self.packet[1:]  # DUP flag.
+
 
 class MQTTClient:
-    """MQTT client of visiobas_gateway."""
+    """MQTT 3.1.1 client of visiobas_gateway.
+
+    Client works in event loop without threads. Publishes are pipelined: QoS 1/2
+    messages are written without waiting for acknowledgements of previous messages.
+    Unacknowledged messages are resent after reconnect.
+    """
 
     def __init__(self, gateway: Gateway, settings: MQTTSettings) -> None:
         self._gtw = gateway
         self.settings = settings
 
-        self._client: mqtt.Client | None = None
-        self._stopped: asyncio.Event | None = None
-        self._connected = False
-        self._paho_lock = asyncio.Lock()
-
-        self.setup()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._connected = asyncio.Event()
+        self._runner: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self._last_packet_id = 0
+        self._deliveries: dict[int, _Delivery] = {}  # Key: packet id
+        self._requests: dict[int, asyncio.Future] = {}  # (Un)subscriptions.
+        self._received_qos2: set[int] = set()
+        self._last_received = 0.0
+
+        self.router = TopicRouter()
+        self._subscriptions: dict[str, int] = {}  # Key: topic filter
+        for topic_filter in settings.topics_sub:
+            if topic_filter:
+                self.router.add(topic_filter=topic_filter, handler=self._handle_jsonrpc)
+                self._subscriptions[topic_filter] = self._qos
+
+        self.publisher = MQTTPublisher(
+            publish=self.publish,
+            qos=self._qos,
+            retain=self._retain,
+            window=settings.publish_window,
+            max_pending=settings.publish_max_pending,
+            device_topic=settings.device_topic,
+            codec=settings.codec,
+        )
 
     @classmethod
     def create(cls, gateway: Gateway, settings: MQTTSettings) -> MQTTClient:
-        mqtt_client = cls(gateway=gateway, settings=settings)
-        mqtt_client.setup()
-        return mqtt_client
-
-    async def start(self) -> None:
-        self._stopped = asyncio.Event()
-
-        if self._client is None:
-            self.setup()
-
-        await self.connect(host=self._host, port=self._port)
+        return cls(gateway=gateway, settings=settings)
 
     def __repr__(self) -> str:
         return self.__class__.__name__
@@ -60,6 +101,10 @@ class MQTTClient:
             return int(port)
         return 1883
 
+    @property
+    def _ssl(self) -> bool:
+        return self.settings.url.scheme in {"mqtts", "ssl"}
+
     @property
     def _username(self) -> str:
         return self.settings.url.user or ""
@@ -83,261 +128,369 @@ class MQTTClient:
     @property
     def topics_sub(self) -> list[tuple[str, int]]:
         """Topics to subscribe."""
-        return [(topic, self._qos) for topic in self.settings.topics_sub]
-
-    # @property
-    # def certificate(self) -> str:
-    #     certificate = self._config.get('certificate')
-    # self._client.tls_set_context(ssl.SSLContext(ssl.PROTOCOL_TLSv1_2))
-    # self._client.tls_set()
-    #     # todo add certificate
-
-    def setup(self) -> None:
-        """Initialize MQTT client."""
-        self._client = mqtt.Client(
-            client_id=self.settings.client_id,
-            protocol=mqtt.MQTTv311,
-            transport="tcp",  # todo ws
-        )  # todo add protocol version choice
-        self._client.username_pw_set(username=self._username, password=self._password)
-
-        # Set up external MQTT broker callbacks
-        self._client.on_connect = self._on_connect_callback
-        self._client.on_disconnect = self._on_disconnect_callback
-        self._client.on_subscribe = self._on_subscribe_cb
-        # todo unsubscribe cb
-        self._client.on_message = self._on_message_cb
-        # self._client.on_publish = self._on_publish_cb
-
-    # def run(self):
-    #     """Main loop."""
-    #     while not self._stopped:  # not self._connected and
-    #         if self._connected:
-    #             self._run_loop()
-    #         else:
-    #             try:
-    #                 self.connect(host=self._host,
-    #                              port=self._port
-    #                              )
-    #             except ConnectionRefusedError as e:
-    #                 _log.warning(f'Cannot connect to broker: {e}')
-    #                 time.sleep(10)
-    #             except Exception as e:
-    #                 _log.error(f'Connection to broker error: {e}',
-    #                            exc_info=True
-    #                            )
-
-    # def _run_loop(self):
-    #     """Listen queue from verifier.
-    #     When receive data from verifier - publish it to MQTT.
-    #
-    #     Designed as an endless loop. Can be stopped from visiobas_gateway thread.
-    #     """
-    #     # self.subscribe(topics=self.topics)
-    #     while not self._stopped:
-    #         try:
-    #             topic, data = self._getting_queue.get()
-    #             _log.debug(f'Received: {topic}: {data}')
-    #
-    #             self.publish(payload=data,
-    #                          topic=topic,
-    #                          qos=self._qos,
-    #                          retain=self._retain
-    #                          )
-    #         except Exception as e:
-    #             _log.error(f"Receive-publish error: {e}",
-    #                        exc_info=True
-    #                        )
-    #     else:  # received stop signal
-    #         _log.info(f'{self} stopped.')
+        return list(self._subscriptions.items())
 
-    async def stop(self) -> None:
-        if isinstance(self._stopped, asyncio.Event):
-            self._stopped.set()
-        _LOG.info("Stopping")
-        await self.async_disconnect()
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
 
-    async def wait_connect(self) -> None:
-        """Ensures the connection with MQTT broker."""
-        while not self._connected:
-            await self.connect(host=self._host, port=self._port)
+    async def start(self) -> None:
+        """Spawns connection to the broker. Reconnects, when connection lost."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+        self.publisher.start()
 
-    async def connect(self, host: str, port: int = 1883) -> None:
-        """Connect to the broker. Without subscriptions."""
-        try:
-            if isinstance(self._client, mqtt.Client):
-                await self._client.connect_async(
-                    host=host, port=port, keepalive=self._keepalive
+    async def stop(self) -> None:
+        _LOG.info("Stopping")
+        await self.publisher.close()
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+        for task in self._tasks:
+            task.cancel()
+        if self._writer is not None:
+            self._writer.write(proto.DISCONNECT)
+        self._connection_lost()
+        for delivery in self._deliveries.values():
+            if not delivery.future.done():
+                delivery.future.set_exception(ConnectionError("Client stopped"))
+        self._deliveries = {}
+
+    async def wait_connect(self, timeout: float | None = None) -> None:
+        """Ensures the connection with MQTT broker.
+
+        Raises:
+            asyncio.TimeoutError: if not connected within `timeout` seconds.
+        """
+        await asyncio.wait_for(self._connected.wait(), timeout=timeout)
+
+    async def _run(self) -> None:
+        """Keeps connection to the broker."""
+        attempt = 0
+        while True:
+            try:
+                await self._connect()
+                attempt = 0
+                await self._serve()
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as exc:
+                _LOG.warning(
+                    "Connection to MQTT broker lost",
+                    extra={"host": self._host, "port": self._port, "exc": exc},
                 )
-                self._client.reconnect_delay_set()
-        except OSError as exc:
-            _LOG.warning(
-                "Failed to connect to MQTT broker",
-                extra={"host": host, "port": port, "exc": exc},
+            except ValueError as exc:
+                _LOG.warning("Malformed packet from MQTT broker", extra={"exc": exc})
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOG.exception("Unexpected error of MQTT client", extra={"exc": exc})
+            self._connection_lost()
+            delay = min(_RECONNECT_MAX_DELAY, _RECONNECT_MIN_DELAY * 2**attempt)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _connect(self) -> None:
+        """Connects to the broker. Resends unacknowledged messages and subscribes.
+
+        Raises:
+            ConnectionError: if connection refused by broker.
+        """
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host=self._host, port=self._port, ssl=self._ssl),
+            timeout=self._keepalive,
+        )
+        writer.write(
+            proto.connect(
+                client_id=self.settings.client_id,
+                keepalive=self._keepalive,
+                username=self._username,
+                password=self._password,
             )
-        if isinstance(self._client, mqtt.Client):
-            self._client.loop_start()
-        # self._client.loop_forever(retry_first_connection=True)
-
-    async def async_disconnect(self) -> None:
-        """Asynchronously call disconnect."""
+        )
+        packet = await asyncio.wait_for(proto.read_packet(reader), timeout=self._keepalive)
+        if packet.type is not proto.PacketType.CONNACK:
+            writer.close()
+            raise ValueError(f"Expected CONNACK, received {packet.type.name}")
+        if packet.body[1] != ResultCode.CONNECTION_SUCCESSFUL:
+            writer.close()
+            raise ConnectionError(ResultCode(packet.body[1]).name)
+
+        self._reader, self._writer = reader, writer
+        self._last_received = time.monotonic()
+        self._connected.set()
+        _LOG.info("Connected to broker", extra={"host": self._host, "port": self._port})
+
+        for delivery in self._deliveries.values():
+            writer.write(delivery.resend_packet())
+        # Subscriptions are renewed on each connection, because session is clean.
+        self._spawn(self._subscribe_topics())
+
+    async def _serve(self) -> None:
+        """Handles received packets until connection lost."""
+        assert self._reader is not None
+        keepalive = asyncio.create_task(self._keep_alive())
+        try:
+            while True:
+                packet = await proto.read_packet(self._reader)
+                self._last_received = time.monotonic()
+                self._handle(packet=packet)
+        finally:
+            keepalive.cancel()
+
+    async def _keep_alive(self) -> None:
+        """Pings the broker. Closes connection, if the broker not responds."""
+        while True:
+            await asyncio.sleep(self._keepalive / 2)
+            if time.monotonic() - self._last_received > self._keepalive * 1.5:
+                _LOG.warning("MQTT broker not responding")
+                if self._writer is not None:
+                    self._writer.close()
+                return None
+            self._write(proto.PINGREQ)
+
+    def _connection_lost(self) -> None:
+        self._connected.clear()
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+        self._received_qos2.clear()
+        for future in self._requests.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Connection lost"))
+        self._requests = {}
+
+    def _write(self, data: bytes) -> asyncio.StreamWriter:
+        if self._writer is None:
+            raise ConnectionError("Not connected to MQTT broker")
+        self._writer.write(data)
+        return self._writer
+
+    def _spawn(self, coro: Coroutine) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _new_packet_id(self) -> int:
+        for _ in range(_MAX_PACKET_ID):
+            self._last_packet_id = self._last_packet_id % _MAX_PACKET_ID + 1
+            if (
+                self._last_packet_id not in self._deliveries
+                and self._last_packet_id not in self._requests
+            ):
+                return self._last_packet_id
+        raise RuntimeError("All packet identifiers are in use")
+
+    def _handle(self, packet: proto.Packet) -> None:
+        # pylint: disable=too-many-branches
+        type_ = packet.type
+        if type_ is proto.PacketType.PUBLISH:
+            self._handle_publish(message=proto.parse_publish(packet=packet))
+        elif type_ in {proto.PacketType.PUBACK, proto.PacketType.PUBCOMP}:
+            delivery = self._deliveries.pop(proto.ack_id(packet=packet), None)
+            if delivery is not None and not delivery.future.done():
+                delivery.future.set_result(None)
+        elif type_ is proto.PacketType.PUBREC:
+            packet_id = proto.ack_id(packet=packet)
+            delivery = self._deliveries.get(packet_id)
+            if delivery is not None:
+                delivery.released = True
+            self._write(proto.ack(proto.PacketType.PUBREL, packet_id))
+        elif type_ is proto.PacketType.PUBREL:
+            packet_id = proto.ack_id(packet=packet)
+            self._received_qos2.discard(packet_id)
+            self._write(proto.ack(proto.PacketType.PUBCOMP, packet_id))
+        elif type_ in {proto.PacketType.SUBACK, proto.PacketType.UNSUBACK}:
+            future = self._requests.pop(proto.ack_id(packet=packet), None)
+            if future is not None and not future.done():
+                future.set_result(packet.body[2:])
+        elif type_ is not proto.PacketType.PINGRESP:
+            _LOG.debug("Unexpected packet", extra={"packet_type": type_})
+
+    def _handle_publish(self, message: proto.Message) -> None:
+        if message.qos == Qos.AT_LEAST_ONCE_DELIVERY:
+            assert message.packet_id is not None
+            self._write(proto.ack(proto.PacketType.PUBACK, message.packet_id))
+        elif message.qos == Qos.EXACTLY_ONCE_DELIVERY:
+            assert message.packet_id is not None
+            self._write(proto.ack(proto.PacketType.PUBREC, message.packet_id))
+            if message.packet_id in self._received_qos2:
+                return None  # Duplicate.
+            self._received_qos2.add(message.packet_id)
+        self._on_message(message=message)
+
+    async def subscribe(self, topics: Sequence[tuple[str, int]]) -> None:
+        """Perform a subscription.
 
-        def disconnect() -> None:
-            """Disconnect to broker."""
-            if isinstance(self._client, mqtt.Client):
-                self._client.disconnect()
-                _LOG.debug("Disconnecting to broker", extra={"client": self._client})
-                # self._connected = False # will call in internal callback
-                self._client.loop_stop()
+        Topics example:
+            [("my/topic", 0), ("another/topic", 2)]
+        """
+        if not topics:
+            return None
+        granted = await self._request(
+            packet=lambda packet_id: proto.subscribe(packet_id=packet_id, topics=topics)
+        )
+        for (topic, _), code in zip(topics, granted):
+            if code == 0x80:
+                _LOG.warning("Failed subscription", extra={"topic": topic})
+            else:
+                _LOG.debug("Subscribed", extra={"topic": topic, "qos": code})
 
-        self._gtw.add_job(disconnect)
+    async def _subscribe_topics(self) -> None:
+        try:
+            await self.subscribe(topics=self.topics_sub)
+        except (ConnectionError, asyncio.TimeoutError) as exc:
+            _LOG.warning("Failed subscription", extra={"exc": exc})
 
-    async def subscribe(
-        self, topics: Sequence[tuple[str, int]], qos: int = Qos.AT_MOST_ONCE_DELIVERY
+    async def add_handler(
+        self, topic_filter: str, handler: MessageHandler, qos: int | None = None
     ) -> None:
-        """Perform a subscription.
+        """Routes messages, which topics match the filter, to handler.
 
-        Topics example:
-            [("my/topic", 0), ("another/topic", 2)]
+        New filter is subscribed at once if connected, otherwise after connection.
+
+        Args:
+            topic_filter: Topic filter. May contain `+` and `#` wildcards.
+            handler: Coroutine function, which accepts received message.
+            qos: Maximum QoS of subscription. QoS from settings by default.
         """
-        async with self._paho_lock:
-            if isinstance(self._client, mqtt.Client):
-                self._gtw.add_job(self._client.subscribe, topics, qos)
-        # check will perform in internal callback
-        # if result == mqtt.MQTT_ERR_SUCCESS:
-        #     _log.debug(f'Subscribed to topics: {topics}')
-        # elif result == mqtt.MQTT_ERR_NO_CONN:
-        #     _log.warning(f'Not subscribed to topic: {topics} {result} {mid}')
+        self.router.add(topic_filter=topic_filter, handler=handler)
+        if topic_filter in self._subscriptions:
+            return None
+        self._subscriptions[topic_filter] = self._qos if qos is None else qos
+        if self.connected:
+            await self.subscribe(topics=[(topic_filter, self._subscriptions[topic_filter])])
+
+    async def remove_handler(
+        self, topic_filter: str, handler: MessageHandler | None = None
+    ) -> None:
+        """Removes handler of filter. Filter without handlers is unsubscribed."""
+        self.router.remove(topic_filter=topic_filter, handler=handler)
+        if topic_filter in self.router.filters or topic_filter not in self._subscriptions:
+            return None
+        del self._subscriptions[topic_filter]
+        if self.connected:
+            await self.unsubscribe(topics=topic_filter)
 
     async def unsubscribe(self, topics: list[str] | str) -> None:
         """Perform an unsubscription."""
-        async with self._paho_lock:
-            if isinstance(self._client, mqtt.Client):
-                self._gtw.add_job(self._client.unsubscribe, topics)
-        # if result == mqtt.MQTT_ERR_SUCCESS:
-        #     _LOG.debug(f"Unsubscribed from topics: {topics}")
-        # else:
-        #     _LOG.warning(f"Failed unsubscription to {topics}")
+        if isinstance(topics, str):
+            topics = [topics]
+        await self._request(
+            packet=lambda packet_id: proto.unsubscribe(packet_id=packet_id, topics=topics)
+        )
+        _LOG.debug("Unsubscribed", extra={"topics": topics})
+
+    async def _request(self, packet: Any) -> bytes:
+        """Sends (un)subscription and waits for its acknowledgement."""
+        await self.wait_connect(timeout=self._keepalive)
+        packet_id = self._new_packet_id()
+        future = self._requests[packet_id] = asyncio.get_running_loop().create_future()
+        try:
+            self._write(packet(packet_id))
+            return await asyncio.wait_for(future, timeout=self._keepalive)
+        finally:
+            self._requests.pop(packet_id, None)
 
     async def publish(
         self,
         topic: str,
-        payload: str = None,
+        payload: str | bytes = b"",
         qos: int = Qos.AT_MOST_ONCE_DELIVERY,
         retain: bool = False,
+        timeout: float | None = None,
     ) -> None:
-        """Send message to the broker."""
-        async with self._paho_lock:
-            if isinstance(self._client, mqtt.Client):
-                self._gtw.add_job(self._client.publish, topic, payload, qos, retain)
-            # return msg_info
+        """Sends message to the broker and waits for its delivery.
 
-    # def _on_publish_cb(self, client, userdata, mid):
-    #     # _log.debug(f'Published: {client} {userdata} {mid}')
-    #     pass
+        QoS 0 message is delivered, when it written to socket. QoS 1/2 message is
+        delivered, when broker acknowledged it. Messages are not waiting for delivery
+        of each other.
 
-    def _on_connect_callback(
-        self,
-        client: Any,
-        userdata: Any,
-        flags: Any,
-        result_code: int,
-        properties: Any = None,
-    ) -> None:
-        # pylint: disable=unused-argument
-        # pylint: disable=too-many-arguments
-        if result_code == ResultCode.CONNECTION_SUCCESSFUL:
-            self._connected = True
-            _LOG.info("Connected to broker")
-            # Subscribing in on_connect() means that if we lose the connection and
-            # reconnect then subscriptions will be renewed.
-            asyncio.run_coroutine_threadsafe(
-                self.subscribe(topics=self.topics_sub), loop=self._gtw.loop
-            )
-        else:
-            _LOG.warning("Failed connection to broker: %s", ResultCode(result_code))
-
-    def _on_disconnect_callback(self, client: Any, userdata: Any, result_code: Any) -> None:
-        # pylint: disable=unused-argument
-        self._connected = False
-        _LOG.info("Disconnected: %s", ResultCode(result_code))
-        # self._client.loop_stop()
+        Args:
+            timeout: Seconds to wait for connection and delivery. Keepalive by default.
 
-    def _on_subscribe_cb(
-        self, userdata: Any, mid: Any, granted_qos: Any, properties: Any = None
-    ) -> None:
-        # todo: type hints
-        if granted_qos == 128:
-            _LOG.warning("Failed subscription")
-        else:
-            _LOG.debug("Subscribed")
+        Raises:
+            asyncio.TimeoutError: if message not delivered within `timeout`.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode()
+        if timeout is None:
+            timeout = self._keepalive
+
+        await self.wait_connect(timeout=timeout)
+        if qos == Qos.AT_MOST_ONCE_DELIVERY:
+            writer = self._write(
+                proto.publish(topic=topic, payload=payload, qos=qos, retain=retain)
+            )
+            await asyncio.wait_for(writer.drain(), timeout=timeout)
+            return None
+
+        packet_id = self._new_packet_id()
+        delivery = self._deliveries[packet_id] = _Delivery(
+            packet_id=packet_id,
+            packet=proto.publish(
+                topic=topic, payload=payload, qos=qos, retain=retain, packet_id=packet_id
+            ),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        try:
+            await asyncio.wait_for(self._write(delivery.packet).drain(), timeout=timeout)
+            await asyncio.wait_for(delivery.future, timeout=timeout)
+        finally:
+            self._deliveries.pop(packet_id, None)
 
-    def _on_message_cb(self, client: Any, userdata: Any, message: mqtt.MQTTMessage) -> None:
-        # todo: type hints
+    def _on_message(self, message: proto.Message) -> None:
         _LOG.debug(
             "Received message",
-            extra={
-                "topic": message.topic,
-                "message": message,
-            },
+            extra={"topic": message.topic, "payload": message.payload},
         )
-        decoded_msg = self._decode(msg=message)
-
-        if isinstance(decoded_msg, dict) and decoded_msg.get("jsonrpc") == 2.0:
-            rpc_task = self._gtw.async_add_job(self.jsonrpc_over_http, decoded_msg)
-            self._gtw.add_job(self._publish_rpc_response, rpc_task, message.topic)
-
-    async def _publish_rpc_response(self, rpc_task: asyncio.Task, topic: str) -> None:
-        rpc_result = await rpc_task
-        await self.publish(topic=topic, payload=rpc_result)
+        handlers = self.router.match(topic=message.topic)
+        if not handlers:
+            _LOG.debug("No handlers of topic", extra={"topic": message.topic})
+        for handler in handlers:
+            self._spawn(self._run_handler(handler=handler, message=message))
 
-    async def jsonrpc_over_http(self, payload: dict) -> str:
-        """Performs JSON-RPC over HTTP.
+    @staticmethod
+    async def _run_handler(handler: MessageHandler, message: proto.Message) -> None:
+        try:
+            await handler(message)
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOG.warning(
+                "Failed handling of message",
+                extra={"topic": message.topic, "handler": handler, "exc": exc},
+            )
 
-        Args:
-            payload:
+    async def _handle_jsonrpc(self, message: proto.Message) -> None:
+        """Dispatches JSON-RPC request in process and publishes response to its topic."""
+        request = self._decode(payload=message.payload)
+
+        # Responses are published to the same topic, so they are skipped by `method`.
+        response: list | dict | None
+        if isinstance(request, list) and any(
+            isinstance(item, dict) and "method" in item for item in request
+        ):
+            response = await dispatch_batch(gateway=self._gtw, requests=request)
+        elif (
+            isinstance(request, dict)
+            and request.get("jsonrpc") in {"2.0", 2.0}
+            and "method" in request
+        ):
+            response = await dispatch(gateway=self._gtw, request=request)
+        else:
+            return None
 
-        Returns:
-            RPC Response is successful.
-        """
-        if self._gtw.http_client is None:
-            raise ValueError("HTTP client required")
-
-        text = await self._gtw.http_client.request(
-            method="POST",
-            url="http://127.0.0.1:7070/json-rpc",
-            json=payload,
-            headers="application/json",
-            extract_text=True,
-        )
-        if isinstance(text, str):
-            return text
-        _LOG.warning(
-            "Failed JSON-RPC 2.0 over HTTP",
-            extra={
-                "http_response": text,
-            },
-        )
-        return dumps(
-            {
-                "jsonrpc": "2.0",
-                "result": {
-                    "success": False,
-                    "http_status": text,
-                },
-            }
+        if response is None:
+            return None
+        if isinstance(response, dict) and "error" in response:
+            _LOG.warning(
+                "Failed JSON-RPC 2.0 over MQTT",
+                extra={"request": request, "error": response["error"]},
+            )
+        await self.publish(
+            topic=message.topic, payload=dumps(response, default=str), qos=self._qos
         )
 
     @staticmethod
-    def _decode(msg: mqtt.MQTTMessage) -> dict | str:
+    def _decode(payload: bytes) -> Any:
+        content = payload.decode("utf-8", "ignore")
         try:
-            if isinstance(msg.payload, bytes):
-                content = loads(msg.payload.decode("utf-8", "ignore"))
-            else:
-                content = loads(msg.payload)
+            return loads(content)
         except JSONDecodeError:
-            if isinstance(msg.payload, bytes):
-                content = msg.payload.decode("utf-8", "ignore")
-            else:
-                content = msg.payload
-        return content
+            return content
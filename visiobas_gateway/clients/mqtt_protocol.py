@@ -0,0 +1,180 @@
+"""Packets of MQTT 3.1.1 protocol, used by `MQTTClient`."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from enum import IntEnum, unique
+from typing import NamedTuple, Sequence
+
+_PROTOCOL_NAME = b"\x00\x04MQTT"
+_PROTOCOL_LEVEL = 4  # MQTT 3.1.1
+_MAX_REMAINING_LENGTH = 268_435_455
+
+
+@unique
+class PacketType(IntEnum):
+    """Types of MQTT control packets."""
+
+    CONNECT = 1
+    CONNACK = 2
+    PUBLISH = 3
+    PUBACK = 4
+    PUBREC = 5
+    PUBREL = 6
+    PUBCOMP = 7
+    SUBSCRIBE = 8
+    SUBACK = 9
+    UNSUBSCRIBE = 10
+    UNSUBACK = 11
+    PINGREQ = 12
+    PINGRESP = 13
+    DISCONNECT = 14
+
+
+class Packet(NamedTuple):
+    """Received control packet."""
+
+    type: PacketType
+    flags: int
+    body: bytes
+
+
+class Message(NamedTuple):
+    """Received application message."""
+
+    topic: str
+    payload: bytes
+    qos: int
+    retain: bool
+    packet_id: int | None
+
+
+def _encode_length(length: int) -> bytes:
+    if length > _MAX_REMAINING_LENGTH:
+        raise ValueError(f"Packet is too large: {length} bytes")
+    encoded = bytearray()
+    while True:
+        length, digit = divmod(length, 128)
+        if length:
+            encoded.append(digit | 0x80)
+        else:
+            encoded.append(digit)
+            return bytes(encoded)
+
+
+def _encode_str(value: str | bytes) -> bytes:
+    if isinstance(value, str):
+        value = value.encode()
+    return struct.pack("!H", len(value)) + value
+
+
+def _packet(packet_type: PacketType, flags: int, body: bytes) -> bytes:
+    return bytes((packet_type << 4 | flags,)) + _encode_length(len(body)) + body
+
+
+def connect(
+    client_id: str,
+    keepalive: int,
+    username: str = "",
+    password: str = "",
+    clean_session: bool = True,
+) -> bytes:
+    """CONNECT packet."""
+    flags = 0x02 if clean_session else 0
+    payload = _encode_str(client_id)
+    if username:
+        flags |= 0x80
+        payload += _encode_str(username)
+        if password:
+            flags |= 0x40
+            payload += _encode_str(password)
+    body = _PROTOCOL_NAME + struct.pack("!BBH", _PROTOCOL_LEVEL, flags, keepalive)
+    return _packet(PacketType.CONNECT, 0, body + payload)
+
+
+def publish(
+    topic: str,
+    payload: bytes,
+    qos: int,
+    retain: bool,
+    packet_id: int | None = None,
+    dup: bool = False,
+) -> bytes:
+    """PUBLISH packet. `packet_id` is required for QoS 1 and 2."""
+    flags = dup << 3 | qos << 1 | retain
+    body = _encode_str(topic)
+    if qos:
+        if packet_id is None:
+            raise ValueError("Packet identifier required for QoS > 0")
+        body += struct.pack("!H", packet_id)
+    return _packet(PacketType.PUBLISH, flags, body + payload)
+
+
+def ack(packet_type: PacketType, packet_id: int) -> bytes:
+    """PUBACK, PUBREC, PUBREL or PUBCOMP packet."""
+    flags = 0x02 if packet_type is PacketType.PUBREL else 0
+    return _packet(packet_type, flags, struct.pack("!H", packet_id))
+
+
+def subscribe(packet_id: int, topics: Sequence[tuple[str, int]]) -> bytes:
+    """SUBSCRIBE packet."""
+    body = struct.pack("!H", packet_id) + b"".join(
+        _encode_str(topic) + bytes((qos,)) for topic, qos in topics
+    )
+    return _packet(PacketType.SUBSCRIBE, 0x02, body)
+
+
+def unsubscribe(packet_id: int, topics: Sequence[str]) -> bytes:
+    """UNSUBSCRIBE packet."""
+    body = struct.pack("!H", packet_id) + b"".join(_encode_str(topic) for topic in topics)
+    return _packet(PacketType.UNSUBSCRIBE, 0x02, body)
+
+
+PINGREQ = _packet(PacketType.PINGREQ, 0, b"")
+PINGRESP = _packet(PacketType.PINGRESP, 0, b"")
+DISCONNECT = _packet(PacketType.DISCONNECT, 0, b"")
+
+
+async def read_packet(reader: asyncio.StreamReader) -> Packet:
+    """Reads one control packet.
+
+    Raises:
+        asyncio.IncompleteReadError: if connection closed.
+        ValueError: if packet is malformed.
+    """
+    header = await reader.readexactly(1)
+    length = 0
+    for shift in range(0, 28, 7):
+        (digit,) = await reader.readexactly(1)
+        length |= (digit & 0x7F) << shift
+        if not digit & 0x80:
+            break
+    else:
+        raise ValueError("Malformed remaining length")
+    body = await reader.readexactly(length) if length else b""
+    return Packet(type=PacketType(header[0] >> 4), flags=header[0] & 0x0F, body=body)
+
+
+def ack_id(packet: Packet) -> int:
+    """Identifier of acknowledgement packet."""
+    return struct.unpack_from("!H", packet.body)[0]
+
+
+def parse_publish(packet: Packet) -> Message:
+    """Parses PUBLISH packet."""
+    qos = packet.flags >> 1 & 0x03
+    (topic_length,) = struct.unpack_from("!H", packet.body)
+    offset = 2 + topic_length
+    topic = packet.body[2:offset].decode()
+    id_ = None
+    if qos:
+        (id_,) = struct.unpack_from("!H", packet.body, offset)
+        offset += 2
+    return Message(
+        topic=topic,
+        payload=packet.body[offset:],
+        qos=qos,
+        retain=bool(packet.flags & 0x01),
+        packet_id=id_,
+    )
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Collection, Union
+
+from ..aggregator import ObjAggregate
+from ..schemas import BACnetObj
+from ..schemas.mqtt import Codec
+from ..utils import get_file_logger
+from ..utils.telemetry_codec import TelemetryRecord, codec_available, encode
+
+_LOG = get_file_logger(name=__name__)
+
+PublishCallable = Callable[[str, Union[str, bytes], int, bool], Awaitable[Any]]
+
+
+class MQTTPublisher:
+    """Publishes data of verified objects to MQTT broker.
+
+    Messages wait in bounded queue keyed by topic, so only the latest message is kept
+    for each topic. When queue is full, the oldest message is dropped. At most `window`
+    messages are published concurrently: publish of QoS 1/2 message is completed by
+    acknowledgement of broker, so slow broker holds the window and queue grows.
+    """
+
+    def __init__(
+        self,
+        publish: PublishCallable,
+        qos: int,
+        retain: bool,
+        window: int,
+        max_pending: int,
+        device_topic: str | None = None,
+        codec: Codec = Codec.TEXT,
+    ):
+        """
+        Args:
+            publish: Coroutine function to publish message. Accepts topic, payload, qos
+                and retain flag. Completed, when message delivered with requested qos.
+            qos: Quality of Service level of messages.
+            retain: Retain flag of messages.
+            window: Maximum number of messages in flight.
+            max_pending: Maximum number of messages waiting for publish.
+            device_topic: Template of topic for batched message of device, formatted
+                with `device_id`. Each object is published to its own `mqtt_topic`,
+                if not provided.
+            codec: Encoding of messages batched by device. Name of binary codec is
+                appended to topic.
+
+        Raises:
+            NotImplementedError: if dependencies of codec are not installed.
+        """
+        if not codec_available(codec=codec):
+            raise NotImplementedError(f"Dependencies of codec `{codec.value}` required")
+        self._publish = publish
+        self._qos = qos
+        self._retain = retain
+        self._window_size = window
+        self._max_pending = max_pending
+        self._device_topic = device_topic
+        self._codec = codec
+
+        self._pending: OrderedDict[str, str | bytes] = OrderedDict()  # Key: topic
+        self._ready: asyncio.Event | None = None
+        self._window: asyncio.Semaphore | None = None
+        self._runner: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+        self.published = 0
+        self.published_bytes = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.window_waits = 0
+        self.window_wait_time = 0.0  # Seconds.
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    @property
+    def depth(self) -> int:
+        """Number of messages waiting for publish."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Metrics of publisher for tuning."""
+        return {
+            "depth": self.depth,
+            "in_flight": len(self._in_flight),
+            "published": self.published,
+            "published_bytes": self.published_bytes,
+            "codec": self._codec.value,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "window_waits": self.window_waits,
+            "window_wait_time": self.window_wait_time,
+            "window": self._window_size,
+            "max_pending": self._max_pending,
+        }
+
+    def messages(
+        self, objs: Collection[BACnetObj], aggregates: Collection[ObjAggregate] = ()
+    ) -> dict[str, str | bytes]:
+        """
+        Args:
+            objs: Objects to publish.
+            aggregates: Statistics of send window. Published as text to `stats`
+                subtopic of object (or device, if `device_topic` set).
+
+        Returns:
+            Payloads by topics. Objects are batched by device, if `device_topic` set.
+        """
+        if self._device_topic is None:
+            return {
+                **{obj.mqtt_topic: obj.to_mqtt_str() for obj in objs},
+                **{
+                    f"{aggregate.obj.mqtt_topic}/stats": aggregate.to_mqtt_str()
+                    for aggregate in aggregates
+                },
+            }
+
+        devices_aggregates: dict[int, list[ObjAggregate]] = {}
+        for aggregate in aggregates:
+            devices_aggregates.setdefault(aggregate.obj.device_id, []).append(aggregate)
+        stats_messages = {
+            f"{self._device_topic.format(device_id=dev_id)}/stats": "\n".join(
+                aggregate.to_mqtt_str() for aggregate in dev_aggregates
+            )
+            for dev_id, dev_aggregates in devices_aggregates.items()
+        }
+
+        devices_objs: dict[int, list[BACnetObj]] = {}
+        for obj in objs:
+            devices_objs.setdefault(obj.device_id, []).append(obj)
+
+        if self._codec is Codec.TEXT:
+            return {
+                **{
+                    self._device_topic.format(device_id=dev_id): "\n".join(
+                        obj.to_mqtt_str() for obj in dev_objs
+                    )
+                    for dev_id, dev_objs in devices_objs.items()
+                },
+                **stats_messages,
+            }
+        return {
+            **{
+                f"{self._device_topic.format(device_id=dev_id)}/{self._codec.value}": (
+                    encode(
+                        records=[TelemetryRecord.from_obj(obj=obj) for obj in dev_objs],
+                        codec=self._codec,
+                    )
+                )
+                for dev_id, dev_objs in devices_objs.items()
+            },
+            **stats_messages,
+        }
+
+    def put(
+        self, objs: Collection[BACnetObj], aggregates: Collection[ObjAggregate] = ()
+    ) -> None:
+        """Puts data of objects (and statistics of send window) into queue."""
+        for topic, payload in self.messages(objs=objs, aggregates=aggregates).items():
+            if topic in self._pending:
+                self.coalesced += 1
+            elif len(self._pending) >= self._max_pending:
+                dropped_topic, _ = self._pending.popitem(last=False)
+                self.dropped += 1
+                _LOG.debug("Message dropped", extra={"topic": dropped_topic})
+            self._pending[topic] = payload
+        if self._ready is not None:
+            self._ready.set()
+
+    def start(self) -> None:
+        """Spawns publishing of queued messages."""
+        if self._runner is not None:
+            return None
+        self._ready = asyncio.Event()
+        self._window = asyncio.Semaphore(self._window_size)
+        self._runner = asyncio.create_task(self._run())
+        if self._pending:
+            self._ready.set()
+
+    async def close(self, timeout: float = 5) -> None:
+        """Stops publishing. Waits for messages in flight not more than `timeout`."""
+        if self._runner is not None:
+            self._runner.cancel()
+            self._runner = None
+        if self._in_flight:
+            await asyncio.wait(self._in_flight, timeout=timeout)
+        if self._pending:
+            _LOG.info("Messages not published", extra={"messages_quantity": self.depth})
+
+    async def _run(self) -> None:
+        assert self._ready is not None and self._window is not None
+        while True:
+            await self._ready.wait()
+            while self._pending:
+                if self._window.locked():
+                    self.window_waits += 1
+                    started = time.monotonic()
+                    await self._window.acquire()
+                    self.window_wait_time += time.monotonic() - started
+                else:
+                    await self._window.acquire()
+                topic, payload = self._pending.popitem(last=False)
+                task = asyncio.create_task(self._publish_message(topic, payload))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+            self._ready.clear()
+
+    async def _publish_message(self, topic: str, payload: str | bytes) -> None:
+        assert self._window is not None
+        try:
+            await self._publish(topic, payload, self._qos, self._retain)
+            self.published += 1
+            self.published_bytes += len(payload)
+        except Exception as exc:  # pylint: disable=broad-except
+            self.failed += 1
+            _LOG.warning("Failed publish", extra={"topic": topic, "exc": exc})
+        finally:
+            self._window.release()
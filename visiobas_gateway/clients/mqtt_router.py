@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from .mqtt_protocol import Message
+
+MessageHandler = Callable[[Message], Awaitable[None]]
+
+_SINGLE_LEVEL = "+"
+_MULTI_LEVEL = "#"
+
+
+@dataclass
+class _Node:
+    children: dict[str, _Node] = field(default_factory=dict)
+    handlers: list[MessageHandler] = field(default_factory=list)
+
+
+def validate_filter(topic_filter: str) -> list[str]:
+    """
+    Returns:
+        Levels of topic filter.
+
+    Raises:
+        ValueError: if wildcards are used incorrectly.
+    """
+    levels = topic_filter.split("/")
+    for i, level in enumerate(levels):
+        if _MULTI_LEVEL in level and (level != _MULTI_LEVEL or i != len(levels) - 1):
+            raise ValueError(f"`#` must be the last level of filter: {topic_filter}")
+        if _SINGLE_LEVEL in level and level != _SINGLE_LEVEL:
+            raise ValueError(f"`+` must occupy the entire level: {topic_filter}")
+    return levels
+
+
+class TopicRouter:
+    """Maps topic filters to handlers of messages.
+
+    Filters are stored in trie by levels, so matching of topic takes time proportional
+    to its depth (multiplied by number of wildcard branches).
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._filters: dict[str, list[MessageHandler]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{list(self._filters)}"
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    @property
+    def filters(self) -> list[str]:
+        return list(self._filters)
+
+    def add(self, topic_filter: str, handler: MessageHandler) -> None:
+        """Adds handler of messages, which topics match the filter.
+
+        Raises:
+            ValueError: if filter is invalid.
+        """
+        node = self._root
+        for level in validate_filter(topic_filter=topic_filter):
+            node = node.children.setdefault(level, _Node())
+        node.handlers.append(handler)
+        self._filters[topic_filter] = node.handlers
+
+    def remove(self, topic_filter: str, handler: MessageHandler | None = None) -> None:
+        """Removes handler of filter. All handlers of filter removed, if not provided."""
+        path = [self._root]
+        for level in topic_filter.split("/"):
+            node = path[-1].children.get(level)
+            if node is None:
+                return None
+            path.append(node)
+
+        if handler is None:
+            path[-1].handlers.clear()
+        elif handler in path[-1].handlers:
+            path[-1].handlers.remove(handler)
+        if not path[-1].handlers:
+            self._filters.pop(topic_filter, None)
+
+        # Prunes empty branch.
+        levels = topic_filter.split("/")
+        for i in range(len(levels), 0, -1):
+            node = path[i]
+            if node.handlers or node.children:
+                break
+            del path[i - 1].children[levels[i - 1]]
+
+    def match(self, topic: str) -> list[MessageHandler]:
+        """
+        Returns:
+            Handlers of filters, which match the topic. Wildcards at the first level do
+            not match topics, which start with `$`.
+        """
+        handlers: list[MessageHandler] = []
+        levels = topic.split("/")
+        self._match(
+            node=self._root,
+            levels=levels,
+            index=0,
+            handlers=handlers,
+            wildcards=not topic.startswith("$"),
+        )
+        return handlers
+
+    def _match(
+        self,
+        node: _Node,
+        levels: list[str],
+        index: int,
+        handlers: list[MessageHandler],
+        wildcards: bool = True,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        if wildcards:
+            multi = node.children.get(_MULTI_LEVEL)
+            if multi is not None:  # Also matches parent level.
+                handlers.extend(multi.handlers)
+        if index == len(levels):
+            handlers.extend(node.handlers)
+            return None
+
+        exact = node.children.get(levels[index])
+        if exact is not None:
+            self._match(node=exact, levels=levels, index=index + 1, handlers=handlers)
+        if wildcards:
+            single = node.children.get(_SINGLE_LEVEL)
+            if single is not None:
+                self._match(node=single, levels=levels, index=index + 1, handlers=handlers)
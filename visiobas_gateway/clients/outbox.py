@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from ..utils import get_file_logger
+
+_LOG = get_file_logger(name=__name__)
+
+_SEGMENT_SUFFIX = ".seg"
+
+# Record: device identifier, length of payload, payload.
+_RECORD_HEADER = struct.Struct("!II")
+
+Record = tuple[int, bytes]  # device_id, payload
+
+
+class Outbox:
+    """Append-only store for payloads, which were not sent to the server.
+
+    Payloads are appended to segment files. When current segment exceeds
+    `segment_size`, the next one is started. When outbox exceeds `max_size`, the oldest
+    segments are dropped.
+
+    Note: All methods perform blocking file operations. Call them in executor.
+    """
+
+    def __init__(self, directory: Path, segment_size: int, max_size: int):
+        self._dir = directory
+        self._segment_size = segment_size
+        self._max_size = max_size
+
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = None
+        # Number of records, delivered from partially sent segments.
+        self._delivered: dict[Path, int] = {}
+        # Number of records in closed segments, which were read.
+        self._totals: dict[Path, int] = {}
+
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._segments: list[Path] = sorted(self._dir.glob(f"*{_SEGMENT_SUFFIX}"))
+        self._size = sum(segment.stat().st_size for segment in self._segments)
+        self.dropped = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self._dir}]"
+
+    def __len__(self) -> int:
+        """Number of segments in outbox."""
+        return len(self._segments)
+
+    @property
+    def size(self) -> int:
+        """Size of stored payloads in bytes."""
+        return self._size
+
+    def append(self, dev_id: int, data: bytes) -> None:
+        """Appends payload to the current segment.
+
+        Args:
+            dev_id: Device identifier.
+            data: Payload.
+        """
+        record = _RECORD_HEADER.pack(dev_id, len(data)) + data
+        with self._lock:
+            file = self._current_file()
+            file.write(record)
+            file.flush()
+            self._size += len(record)
+            if file.tell() >= self._segment_size:
+                self._rotate()
+            self._drop_oldest()
+
+    def read_oldest(self) -> tuple[Path, list[Record]] | None:
+        """Reads the oldest segment. Current segment is closed to be read.
+
+        Returns:
+            Segment path and records, which were not delivered yet.
+            None if outbox is empty.
+        """
+        with self._lock:
+            if not self._segments:
+                return None
+            segment = self._segments[0]
+            if self._file is not None and self._file.name == str(segment):
+                self._rotate()
+        records = list(self._read_records(path=segment))
+        delivered = self._delivered.get(segment, 0)
+        with self._lock:
+            if segment in self._segments:
+                self._totals[segment] = len(records)
+        return segment, records[delivered:]
+
+    def mark_delivered(self, segment: Path, quantity: int) -> None:
+        """Marks records from segment as delivered. Removes fully delivered segment.
+
+        Args:
+            segment: Segment path, received from `read_oldest()`.
+            quantity: Number of delivered records.
+        """
+        with self._lock:
+            if segment not in self._segments:
+                return  # Already dropped.
+            delivered = self._delivered.get(segment, 0) + quantity
+            total = self._totals.get(segment)
+            if total is None:
+                total = sum(1 for _ in self._read_records(path=segment))
+                self._totals[segment] = total
+            if delivered < total:
+                self._delivered[segment] = delivered
+                return
+            self._remove(segment=segment)
+
+    def close(self) -> None:
+        """Closes current segment."""
+        with self._lock:
+            self._rotate()
+
+    def _current_file(self) -> BinaryIO:
+        if self._file is None:
+            last_index = int(self._segments[-1].stem) if self._segments else 0
+            path = self._dir / f"{last_index + 1:012d}{_SEGMENT_SUFFIX}"
+            self._file = open(path, mode="ab")  # pylint: disable=consider-using-with
+            self._segments.append(path)
+        return self._file
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _drop_oldest(self) -> None:
+        while self._size > self._max_size and len(self._segments) > 1:
+            segment = self._segments[0]
+            if self._file is not None and self._file.name == str(segment):
+                break
+            _LOG.warning(
+                "Outbox size exceeded. Dropping oldest segment",
+                extra={"outbox": self, "segment": segment, "max_size": self._max_size},
+            )
+            self.dropped += sum(1 for _ in self._read_records(path=segment))
+            self._remove(segment=segment)
+
+    def _remove(self, segment: Path) -> None:
+        self._size -= segment.stat().st_size
+        segment.unlink()
+        self._segments.remove(segment)
+        self._delivered.pop(segment, None)
+        self._totals.pop(segment, None)
+
+    @staticmethod
+    def _read_records(path: Path) -> Iterator[Record]:
+        """Reads records from segment. Incomplete trailing record is skipped."""
+        content = path.read_bytes()
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(content):
+            dev_id, length = _RECORD_HEADER.unpack_from(content, offset)
+            offset += _RECORD_HEADER.size
+            if offset + length > len(content):
+                _LOG.warning("Incomplete record in outbox segment", extra={"path": path})
+                return
+            end = offset + length
+            yield dev_id, content[offset:end]
+            offset = end
+
+
+def group_records(records: list[Record], max_size: int) -> Iterator[tuple[int, bytes, int]]:
+    """Joins consecutive records of the same device to send them in one request.
+
+    Order of records is kept.
+
+    Args:
+        records: Records to group.
+        max_size: Max size of joined payload. Single record may exceed it.
+
+    Yields:
+        Device identifier, joined payload and number of joined records.
+    """
+    group_dev_id: int | None = None
+    group: list[bytes] = []
+    group_size = 0
+    for dev_id, data in records:
+        if group and (dev_id != group_dev_id or group_size + len(data) > max_size):
+            yield group_dev_id, b"".join(group), len(group)  # type: ignore
+            group, group_size = [], 0
+        group_dev_id = dev_id
+        group.append(data)
+        group_size += len(data)
+    if group:
+        yield group_dev_id, b"".join(group), len(group)  # type: ignore
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from ..utils import get_file_logger
+
+_LOG = get_file_logger(name=__name__)
+
+ObjectKey = tuple[int, int]  # obj_id, obj_type_id
+
+
+@dataclass
+class _DeviceBatch:
+    """Pending data of device."""
+
+    fragments: dict[ObjectKey, bytes] = field(default_factory=dict)
+    size: int = 0
+    timer: asyncio.TimerHandle | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)  # Keeps order of sends.
+
+
+class SendQueue:
+    """Coalesces data of objects to send it in one request per device.
+
+    Pending data is sent when `linger` seconds passed since first put into empty batch
+    or when size of batch reaches `batch_size` bytes. Only the latest state is kept for
+    each object.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[int, bytes], Awaitable[Any]],
+        linger: float,
+        batch_size: int,
+    ):
+        """
+        Args:
+            send: Coroutine function to send payload of device. Accepts device
+                identifier and payload.
+            linger: Seconds to wait for other data of device before send.
+            batch_size: Size of payload (in bytes) to send without waiting.
+        """
+        self._send = send
+        self._linger = linger
+        self._batch_size = batch_size
+
+        self._batches: dict[int, _DeviceBatch] = {}  # Key: device id
+        self._tasks: set[asyncio.Task] = set()
+
+        self.batches_sent = 0
+        self.objects_sent = 0
+        self.objects_coalesced = 0
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    @property
+    def depth(self) -> int:
+        """Number of objects waiting to be sent."""
+        return sum(len(batch.fragments) for batch in self._batches.values())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Metrics of queue for tuning."""
+        return {
+            "depth": self.depth,
+            "pending_bytes": sum(batch.size for batch in self._batches.values()),
+            "in_flight": len(self._tasks),
+            "batches_sent": self.batches_sent,
+            "objects_sent": self.objects_sent,
+            "objects_coalesced": self.objects_coalesced,
+            "linger": self._linger,
+            "batch_size": self._batch_size,
+        }
+
+    def put(self, dev_id: int, fragments: dict[ObjectKey, bytes]) -> None:
+        """Puts serialized objects of device into queue.
+
+        Args:
+            dev_id: Device identifier.
+            fragments: Serialized objects by their keys.
+        """
+        try:
+            batch = self._batches[dev_id]
+        except KeyError:
+            batch = self._batches[dev_id] = _DeviceBatch()
+
+        for key, fragment in fragments.items():
+            previous = batch.fragments.get(key)
+            if previous is not None:
+                batch.size -= len(previous)
+                self.objects_coalesced += 1
+            batch.fragments[key] = fragment
+            batch.size += len(fragment)
+
+        if batch.size >= self._batch_size or not self._linger:
+            self._flush(dev_id=dev_id)
+        elif batch.timer is None:
+            batch.timer = asyncio.get_running_loop().call_later(
+                self._linger, self._flush, dev_id
+            )
+
+    async def close(self) -> None:
+        """Sends all pending data and waits for sending."""
+        for dev_id in list(self._batches):
+            self._flush(dev_id=dev_id)
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+    def _flush(self, dev_id: int) -> None:
+        """Takes pending data of device and spawns its sending."""
+        batch = self._batches[dev_id]
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        if not batch.fragments:
+            return None
+
+        data = b"".join(batch.fragments.values())
+        quantity = len(batch.fragments)
+        batch.fragments = {}
+        batch.size = 0
+
+        task = asyncio.get_running_loop().create_task(
+            self._send_batch(dev_id=dev_id, data=data, quantity=quantity, lock=batch.lock)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(
+        self, dev_id: int, data: bytes, quantity: int, lock: asyncio.Lock
+    ) -> None:
+        async with lock:
+            try:
+                await self._send(dev_id, data)
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOG.warning(
+                    "Failed to send batch",
+                    extra={"device_id": dev_id, "objects_quantity": quantity, "exc": exc},
+                )
+                return None
+        self.batches_sent += 1
+        self.objects_sent += quantity
+        _LOG.debug(
+            "Batch sent",
+            extra={"device_id": dev_id, "objects_quantity": quantity, **self.stats},
+        )
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import struct
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Mapping, Sequence
+
+from .api.jsonrpc.methods import call
+from .schemas import DeviceObj
+from .utils import get_file_logger, log_exceptions
+from .utils.telemetry_codec import TelemetryRecord
+
+if TYPE_CHECKING:
+    from .gateway import Gateway
+else:
+    Gateway = "Gateway"
+
+_LOG = get_file_logger(name=__name__)
+
+ObjectKey = tuple[int, int]  # obj_id, obj_type_id
+WorkerTarget = Callable[[int, str, list[int]], None]  # index, socket path, device ids
+
+# Frame: type of message, size of body.
+_FRAME = struct.Struct("!BI")
+
+MSG_HELLO = 1  # Worker -> supervisor. JSON: worker index.
+MSG_SEND = 2  # Worker -> supervisor. JSON: device id, serialized objects, records.
+MSG_RPC = 3  # Supervisor -> worker. JSON: call id, method, params.
+MSG_RPC_RESULT = 4  # Worker -> supervisor. JSON: call id, result or error.
+
+# Period (in seconds) to check that workers are alive.
+_WATCH_PERIOD = 5
+
+# Seconds to wait for workers to stop, before they are terminated.
+_STOP_TIMEOUT = 30
+
+# Credentials of peer of Unix socket: pid, uid, gid.
+_PEER_CREDENTIALS = struct.Struct("3i")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Reads message.
+
+    Raises:
+        asyncio.IncompleteReadError: If connection closed.
+    """
+    msg_type, size = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    return msg_type, await reader.readexactly(size)
+
+
+def write_frame(writer: asyncio.StreamWriter, msg_type: int, body: bytes) -> None:
+    """Writes message. Call `drain()` of writer to wait for sending."""
+    writer.write(_FRAME.pack(msg_type, len(body)))
+    writer.write(body)
+
+
+def peer_allowed(writer: asyncio.StreamWriter) -> bool:
+    """Checks that peer of Unix socket is run by the same user. Peer is allowed, if
+    platform does not provide credentials of peer.
+    """
+    sock = writer.get_extra_info("socket")
+    so_peercred = getattr(socket, "SO_PEERCRED", None)
+    if sock is None or so_peercred is None:
+        return True
+    _, uid, _ = _PEER_CREDENTIALS.unpack(
+        sock.getsockopt(socket.SOL_SOCKET, so_peercred, _PEER_CREDENTIALS.size)
+    )
+    return uid == os.getuid()
+
+
+def partition_devices(interfaces: Mapping[int, Hashable], workers: int) -> list[list[int]]:
+    """Partitions devices across workers. Devices of one interface are assigned to one
+    worker, because interface is shared by its devices. The largest interfaces are
+    assigned first to the least loaded worker.
+
+    Args:
+        interfaces: Interface keys by device identifiers.
+        workers: Max number of workers.
+
+    Returns:
+        Device identifiers of each worker. Workers without devices are omitted.
+    """
+    groups: dict[Hashable, list[int]] = {}
+    for dev_id, interface_key in interfaces.items():
+        groups.setdefault(interface_key, []).append(dev_id)
+
+    partitions: list[list[int]] = [[] for _ in range(max(workers, 1))]
+    for group in sorted(groups.values(), key=lambda ids: (-len(ids), min(ids))):
+        min(partitions, key=len).extend(sorted(group))
+    return [partition for partition in partitions if partition]
+
+
+class ClusterSupervisor:
+    """Runs devices in worker processes, partitioned by interfaces.
+
+    Supervisor keeps HTTP send path and API. Workers send serialized objects to
+    supervisor through Unix socket, where they are queued to send as in single
+    process mode. JSON-RPC calls are routed to the worker, which polls the device.
+    Dead workers are restarted.
+    """
+
+    def __init__(
+        self,
+        gateway: Gateway,
+        workers: int,
+        socket_path: Path,
+        target: WorkerTarget,
+        rpc_timeout: float = 60,
+    ):
+        """
+        Args:
+            gateway: Gateway of supervisor process.
+            workers: Max number of worker processes.
+            socket_path: Path of Unix socket to communicate with workers.
+            target: Entry point of worker process. Must be importable function.
+            rpc_timeout: Seconds to wait for result of JSON-RPC call.
+        """
+        self._gateway = gateway
+        self._workers = workers
+        self._socket_path = socket_path
+        self._target = target
+        self._rpc_timeout = rpc_timeout
+
+        self._partitions: list[list[int]] = []
+        self._owners: dict[int, int] = {}  # Key: device id. Value: worker index.
+        self._processes: dict[int, BaseProcess] = {}
+        self._links: dict[int, asyncio.StreamWriter] = {}
+        self._calls: dict[int, asyncio.Future] = {}
+        self._call_ids = itertools.count()
+        self._server: asyncio.AbstractServer | None = None
+        self._watch_task: asyncio.Task | None = None
+
+        self.restarts = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{len(self._processes)} workers]"
+
+    async def start(self) -> None:
+        """Partitions devices and starts workers. Call it after login."""
+        interfaces = await self._resolve_interfaces(
+            device_ids=self._gateway.settings.poll_device_ids
+        )
+        self._partitions = partition_devices(interfaces=interfaces, workers=self._workers)
+        self._owners = {
+            dev_id: index
+            for index, partition in enumerate(self._partitions)
+            for dev_id in partition
+        }
+
+        if self._socket_path.exists():
+            self._socket_path.unlink()
+        self._server = await asyncio.start_unix_server(
+            self._handle_worker, path=str(self._socket_path)
+        )
+        os.chmod(self._socket_path, 0o600)  # Only user of gateway may connect.
+        for index in range(len(self._partitions)):
+            self._spawn(index=index)
+        self._watch_task = asyncio.ensure_future(self._watch())
+        _LOG.info(
+            "Workers started",
+            extra={"workers": len(self._partitions), "partitions": self._partitions},
+        )
+
+    async def stop(self) -> None:
+        """Stops workers. Workers stop gracefully, when link to supervisor is closed.
+        Workers, which are not stopped in time, are terminated.
+        """
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+        for writer in self._links.values():
+            writer.close()
+        await self._join(processes=self._processes.values(), timeout=_STOP_TIMEOUT)
+        hung = {
+            index: process
+            for index, process in self._processes.items()
+            if process.is_alive()
+        }
+        for index, process in hung.items():
+            _LOG.warning("Worker not stopped. Terminating", extra={"worker": index})
+            process.terminate()
+        await self._join(processes=hung.values(), timeout=10)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._socket_path.exists():
+            self._socket_path.unlink()
+        _LOG.info("Workers stopped")
+
+    async def call(self, device_id: int, method: str, params: dict[str, Any]) -> dict:
+        """Calls JSON-RPC method in worker, which polls the device.
+
+        Raises:
+            Exception: if device not found, worker not connected or call failed.
+        """
+        index = self._owners.get(device_id)
+        if index is None:
+            raise Exception(f"Device {device_id} not found.")
+        writer = self._links.get(index)
+        if writer is None:
+            raise Exception(f"Worker {index} of device {device_id} not connected.")
+
+        call_id = next(self._call_ids)
+        future = self._calls[call_id] = asyncio.get_running_loop().create_future()
+        body = json.dumps({"id": call_id, "method": method, "params": params}, default=str)
+        try:
+            write_frame(writer=writer, msg_type=MSG_RPC, body=body.encode())
+            await writer.drain()
+            response = await asyncio.wait_for(future, timeout=self._rpc_timeout)
+        finally:
+            self._calls.pop(call_id, None)
+        if response.get("error") is not None:
+            raise Exception(response["error"])
+        return response["result"]
+
+    async def _join(self, processes: Iterable[BaseProcess], timeout: float) -> None:
+        await asyncio.gather(
+            *[self._gateway.async_add_job(process.join, timeout) for process in processes]
+        )
+
+    async def _resolve_interfaces(self, device_ids: list[int]) -> dict[int, Hashable]:
+        """Downloads device objects to find their interfaces. Device, which is not
+        downloaded, is considered to have own interface.
+        """
+        results = await asyncio.gather(
+            *[
+                self._gateway._download_device_data(  # pylint: disable=protected-access
+                    device_id=dev_id
+                )
+                for dev_id in device_ids
+            ],
+            return_exceptions=True,
+        )
+        interfaces: dict[int, Hashable] = {}
+        for dev_id, result in zip(device_ids, results):
+            if not isinstance(result, BaseException):  # Downloaded.
+                try:
+                    interfaces[dev_id] = DeviceObj(**result).property_list.interface
+                    continue
+                except Exception as exc:  # pylint: disable=broad-except
+                    result = exc
+            _LOG.warning(
+                "Interface of device not resolved",
+                extra={"device_id": dev_id, "exc": result},
+            )
+            interfaces[dev_id] = ("device", dev_id)
+        return interfaces
+
+    def _spawn(self, index: int) -> None:
+        context = multiprocessing.get_context("spawn")
+        process = context.Process(
+            target=self._target,
+            args=(index, str(self._socket_path), self._partitions[index]),
+            name=f"gtw-worker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+        _LOG.debug(
+            "Worker spawned",
+            extra={"worker": index, "pid": process.pid, "devices": self._partitions[index]},
+        )
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(_WATCH_PERIOD)
+            for index, process in list(self._processes.items()):
+                if process.is_alive():
+                    continue
+                _LOG.warning(
+                    "Worker died. Restarting",
+                    extra={"worker": index, "exitcode": process.exitcode},
+                )
+                self._links.pop(index, None)
+                self.restarts += 1
+                self._spawn(index=index)
+
+    async def _handle_worker(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        index: int | None = None
+        try:
+            if not peer_allowed(writer=writer):
+                raise PermissionError("Peer is run by other user")
+            msg_type, body = await read_frame(reader=reader)
+            if msg_type != MSG_HELLO:
+                raise ValueError(f"Expected hello message. Got {msg_type}")
+            index = json.loads(body)["worker"]
+            self._links[index] = writer
+            _LOG.debug("Worker connected", extra={"worker": index})
+
+            while True:
+                msg_type, body = await read_frame(reader=reader)
+                if msg_type == MSG_SEND:
+                    self._put(body=body)
+                elif msg_type == MSG_RPC_RESULT:
+                    response = json.loads(body)
+                    future = self._calls.get(response["id"])
+                    if future is not None and not future.done():
+                        future.set_result(response)
+                else:
+                    raise ValueError(f"Unexpected message type: {msg_type}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            _LOG.warning("Worker disconnected", extra={"worker": index})
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOG.warning("Invalid message of worker", extra={"worker": index, "exc": exc})
+        finally:
+            if index is not None and self._links.get(index) is writer:
+                del self._links[index]
+            writer.close()
+
+    def _put(self, body: bytes) -> None:
+        message = json.loads(body)
+        dev_id = message["device"]
+        http_client = self._gateway.http_client
+        if http_client is not None:
+            fragments = {
+                (obj_id, obj_type): fragment.encode()
+                for obj_id, obj_type, fragment in message["fragments"]
+            }
+            http_client.send_queue.put(dev_id=dev_id, fragments=fragments)
+        api = self._gateway.api
+        if api is not None:
+            records = [TelemetryRecord(*record) for record in message["records"]]
+            api.streams.put(device_id=dev_id, records=records)
+
+
+class ClusterWorker:
+    """Link of worker process to supervisor.
+
+    Sends serialized objects of worker devices to supervisor and performs JSON-RPC
+    calls, routed by supervisor. Gateway of worker is stopped, if supervisor is gone.
+    """
+
+    def __init__(self, gateway: Gateway, index: int, socket_path: str):
+        self._gateway = gateway
+        self._index = index
+        self._socket_path = socket_path
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._serve_task: asyncio.Task | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self._index}]"
+
+    async def connect(self) -> None:
+        """Connects to supervisor."""
+        self._reader, self._writer = await asyncio.open_unix_connection(
+            path=self._socket_path
+        )
+        write_frame(
+            writer=self._writer,
+            msg_type=MSG_HELLO,
+            body=json.dumps({"worker": self._index, "pid": os.getpid()}).encode(),
+        )
+        await self._writer.drain()
+        self._serve_task = asyncio.ensure_future(self._serve())
+
+    async def close(self) -> None:
+        if self._serve_task is not None:
+            self._serve_task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+
+    async def send(
+        self,
+        dev_id: int,
+        fragments: dict[ObjectKey, bytes],
+        records: Sequence[TelemetryRecord] = (),
+    ) -> None:
+        """Sends serialized objects of device and their values, streamed by API, to
+        supervisor.
+        """
+        if self._writer is None:
+            raise ConnectionError("Worker not connected to supervisor")
+        body = json.dumps(
+            {
+                "device": dev_id,
+                "fragments": [
+                    [obj_id, obj_type, fragment.decode()]
+                    for (obj_id, obj_type), fragment in fragments.items()
+                ],
+                "records": [list(record) for record in records],
+            },
+            default=str,
+        ).encode()
+        write_frame(writer=self._writer, msg_type=MSG_SEND, body=body)
+        await self._writer.drain()
+
+    async def _serve(self) -> None:
+        if self._reader is None:
+            raise ConnectionError("Worker not connected to supervisor")
+        try:
+            while True:
+                msg_type, body = await read_frame(reader=self._reader)
+                if msg_type == MSG_RPC:
+                    asyncio.ensure_future(self._call(request=json.loads(body)))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            _LOG.warning("Supervisor disconnected. Stopping", extra={"worker": self._index})
+            await self._gateway.stop()
+
+    @log_exceptions(logger=_LOG)
+    async def _call(self, request: dict[str, Any]) -> None:
+        response: dict[str, Any] = {"id": request["id"], "result": None, "error": None}
+        try:
+            response["result"] = await call(
+                gateway=self._gateway, method=request["method"], params=request["params"]
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            response["error"] = str(exc)
+        if self._writer is not None:
+            body = json.dumps(response, default=str).encode()
+            write_frame(writer=self._writer, msg_type=MSG_RPC_RESULT, body=body)
+            await self._writer.drain()
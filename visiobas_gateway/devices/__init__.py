@@ -1,6 +1,6 @@
 from .bacnet.bacnet import BACnetDevice
 from .base_device import BaseDevice
-from .base_polling_device import BasePollingDevice
+from .base_polling_device import BasePollingDevice, WriteRequest
 from .modbus.modbus import ModbusDevice
 
 # from .sunapi.sunapi import SUNAPIDevice
@@ -11,4 +11,5 @@ __all__ = [
     # "SUNAPIDevice",
     "BaseDevice",
     "BasePollingDevice",
+    "WriteRequest",
 ]
@@ -3,10 +3,13 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from ipaddress import IPv4Address
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Union
 
 from ..schemas.serial_port import SerialPort
 
+if TYPE_CHECKING:
+    from ._supervisor import ConnectionSupervisor
+
 InterfaceKey = Union[
     IPv4Address,
     tuple[IPv4Address, int],
@@ -30,4 +33,6 @@ class Interface:
     # IMPORTANT: `clear()` that event to change the objects (load or priority write).
     # `wait()` that event in polling to provide priority access to write_with_check.
 
+    supervisor: ConnectionSupervisor | None = None  # Owns connection of client.
+
     # todo: lock via context manager
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import Counter
+from enum import Enum, unique
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from ..utils import get_file_logger
+
+if TYPE_CHECKING:
+    from ._interface import Interface
+
+_LOG = get_file_logger(name=__name__)
+
+
+@unique
+class ConnectionState(str, Enum):
+    """State of interface connection."""
+
+    DISCONNECTED = "disconnected"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+
+
+class ConnectionSupervisor:
+    """Owns connection of interface client.
+
+    Only supervisor connects and disconnects client, so devices on the same interface
+    do not retry in lockstep. Failed connection is retried with exponential backoff
+    and jitter. Devices wait for connection by `wait_connected()` and are woken
+    together when the link comes back.
+    """
+
+    def __init__(
+        self,
+        interface: Interface,
+        connect: Callable[[], Awaitable[Any]],
+        disconnect: Callable[[Any], Awaitable[None]],
+        min_delay: float,
+        max_delay: float,
+        jitter: float = 0.5,
+    ):
+        """
+        Args:
+            interface: Interface, which client is supervised.
+            connect: Coroutine function, that creates and connects client. Returns
+                connected client. Raises if connection failed.
+            disconnect: Coroutine function to disconnect client.
+            min_delay: Delay (in seconds) before the first reconnection attempt.
+            max_delay: Max delay (in seconds) between reconnection attempts.
+            jitter: Part of delay, which is randomized. From 0 to 1.
+        """
+        self._interface = interface
+        self._connect = connect
+        self._disconnect = disconnect
+        self._min_delay = min_delay
+        self._max_delay = max(max_delay, min_delay)
+        self._jitter = jitter
+
+        self._connected = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._attempt = 0
+
+        self.state = ConnectionState.DISCONNECTED
+        self.state_since = time.monotonic()
+        self.transitions: Counter[str] = Counter()
+        self.last_error: str | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self._interface.interface_key}]"
+
+    @property
+    def connected(self) -> bool:
+        return self.state is ConnectionState.CONNECTED
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Metrics of connection."""
+        return {
+            "state": self.state.value,
+            "state_duration": time.monotonic() - self.state_since,
+            "attempt": self._attempt,
+            "transitions": dict(self.transitions),
+            "last_error": self.last_error,
+        }
+
+    def bind(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        disconnect: Callable[[Any], Awaitable[None]],
+    ) -> None:
+        """Replaces functions to connect and disconnect client. Used when device,
+        which owns connection of interface, is changed.
+        """
+        self._connect = connect
+        self._disconnect = disconnect
+
+    def delay(self, attempt: int) -> float:
+        """Delay before reconnection attempt. Grows exponentially up to max delay."""
+        delay = min(self._max_delay, self._min_delay * 2 ** min(attempt, 32))
+        return delay * (1 - self._jitter * random.random())
+
+    async def connect(self) -> bool:
+        """Performs one attempt to connect. Previous client is disconnected.
+
+        Returns:
+            Client is connected.
+        """
+        if self.connected:
+            return True
+        self._set_state(ConnectionState.CONNECTING)
+        async with self._interface.lock:
+            await self._close_client()
+            try:
+                client = await self._connect()
+            except Exception as exc:  # pylint: disable=broad-except
+                self.last_error = repr(exc)
+                self._set_state(ConnectionState.DISCONNECTED)
+                return False
+            self._interface.client = client
+            self._interface.client_connected = True
+        self._attempt = 0
+        self.last_error = None
+        self._set_state(ConnectionState.CONNECTED)
+        return True
+
+    def ensure_reconnecting(self) -> None:
+        """Starts reconnection in background, if client is not connected."""
+        if self.connected or (self._task is not None and not self._task.done()):
+            return None
+        self._task = asyncio.ensure_future(self._reconnect())
+        return None
+
+    async def wait_connected(self) -> None:
+        """Waits until client is connected. Starts reconnection, if required."""
+        self.ensure_reconnecting()
+        await self._connected.wait()
+
+    def connection_lost(self, exc: BaseException | None = None) -> None:
+        """Marks client as disconnected and starts reconnection. Called by devices,
+        when client fails because of connection.
+        """
+        if not self.connected:
+            return None
+        self._interface.client_connected = False
+        self.last_error = repr(exc) if exc is not None else None
+        self._set_state(ConnectionState.DISCONNECTED)
+        self.ensure_reconnecting()
+        return None
+
+    async def close(self) -> None:
+        """Stops reconnection and disconnects client."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._close_client()
+        self._set_state(ConnectionState.DISCONNECTED)
+
+    async def _reconnect(self) -> None:
+        while True:
+            delay = self.delay(attempt=self._attempt)
+            self._attempt += 1
+            _LOG.info(
+                "Client is not connected. Sleeping to next try",
+                extra={
+                    "interface": self._interface.interface_key,
+                    "attempt": self._attempt,
+                    "seconds_to_next_try": delay,
+                    "last_error": self.last_error,
+                },
+            )
+            await asyncio.sleep(delay)
+            if await self.connect():
+                return None
+
+    async def _close_client(self) -> None:
+        client, self._interface.client = self._interface.client, None
+        self._interface.client_connected = False
+        if client is None:
+            return None
+        try:
+            await self._disconnect(client)
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOG.warning(
+                "Client not disconnected",
+                extra={"interface": self._interface.interface_key, "exc": exc},
+            )
+        return None
+
+    def _set_state(self, state: ConnectionState) -> None:
+        if state is self.state:
+            return None
+        self.transitions[f"{self.state.value}->{state.value}"] += 1
+        _LOG.info(
+            "Connection state changed",
+            extra={
+                "interface": self._interface.interface_key,
+                "from_state": self.state,
+                "to_state": state,
+                "seconds_in_state": time.monotonic() - self.state_since,
+            },
+        )
+        self.state = state
+        self.state_since = time.monotonic()
+        if state is ConnectionState.CONNECTED:
+            self._connected.set()
+        else:
+            self._connected.clear()
+        return None
@@ -7,7 +7,13 @@ from typing import Any
 from BAC0.scripts.Lite import Lite  # type: ignore
 
 from ...schemas import BACnetObj, DeviceObj, ObjProperty, TcpDevicePropertyList
-from ...utils import camel_case, get_file_logger, get_subnet_interface, log_exceptions, ping
+from ...utils import (
+    ReachabilityChecker,
+    camel_case,
+    get_file_logger,
+    get_subnet_interface,
+    log_exceptions,
+)
 from .._interface import InterfaceKey
 from ..base_polling_device import BasePollingDevice
 from ._bacnet_coder_mixin import BACnetCoderMixin
@@ -48,14 +54,10 @@ class BACnetDevice(BasePollingDevice, BACnetCoderMixin):
         return bool(self.interface.client)
 
     @staticmethod
-    async def is_reachable(device_obj: DeviceObj) -> bool:
+    async def is_reachable(device_obj: DeviceObj, checker: ReachabilityChecker) -> bool:
         if isinstance(device_obj.property_list, TcpDevicePropertyList):
-            ping_result = await ping(host=str(device_obj.property_list.ip), attempts=4)
-            _LOG.debug(
-                "Ping completed",
-                extra={"ping_result": ping_result, "device_obj": device_obj},
-            )
-            return ping_result
+            # BACnet/IP uses UDP, so host is checked by ICMP.
+            return await checker.is_reachable(host=str(device_obj.property_list.ip))
         raise ValueError(
             f"`TcpDevicePropertyList` expected. Got {device_obj.property_list}."
         )
@@ -140,7 +142,9 @@ class BACnetDevice(BasePollingDevice, BACnetCoderMixin):
     ) -> None:
         prop = kwargs.get("prop")
         priority = kwargs.get("priority")
-        await self._gtw.async_add_job(self.write_property, value, obj, prop, priority)
+        await self._gtw.async_add_job(
+            self.write_property, value, obj, prop, priority, executor=self.executor
+        )
 
     @log_exceptions(logger=_LOG)
     def write_property(
@@ -168,7 +172,7 @@ class BACnetDevice(BasePollingDevice, BACnetCoderMixin):
             f"{value} "
             f"- {priority}"
         )
-        success = self.interface.client.write(args=args)
+        success = self.client.write(args=args)
         self._LOG.debug(
             "Write",
             extra={"device_id": self.id, "object": obj, "value": value, "success": success},
@@ -187,7 +191,9 @@ class BACnetDevice(BasePollingDevice, BACnetCoderMixin):
 
         if wait:
             await self.interface.polling_event.wait()
-        return await self._gtw.async_add_job(self.read_property, obj, prop)
+        return await self._gtw.async_add_job(
+            self.read_property, obj, prop, executor=self.executor
+        )
 
     # @log_exceptions
     def read_property(self, obj: BACnetObj, prop: ObjProperty) -> BACnetObj:
@@ -199,7 +205,7 @@ class BACnetDevice(BasePollingDevice, BACnetCoderMixin):
                 camel_case(prop.name),
             )
         )
-        response = self.interface.client.read(request)
+        response = self.client.read(request)
 
         if prop is ObjProperty.PRIORITY_ARRAY:
             response = self._decode_priority_array(priority_array=response)
@@ -25,6 +25,11 @@ class BaseDevice(ABC):
             f"{self._device_obj.property_list.protocol}]"
         )
 
+    @property
+    def device_obj(self) -> DeviceObj:
+        """Device object, which device was created from."""
+        return self._device_obj
+
     @property
     def id(self) -> int:
         """Device id."""
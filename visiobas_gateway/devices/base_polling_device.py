@@ -2,15 +2,26 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Collection, Iterable
+from typing import TYPE_CHECKING, Any, Collection, Iterable, NamedTuple, Optional, Sequence
 
 import aiojobs  # type: ignore
 
-from ..schemas import OUTPUT_TYPES, STRICT_OUTPUT_TYPES, BACnetObj, DeviceObj
-from ..utils import get_file_logger, log_exceptions
+from ..aggregator import ObjAggregator
+from ..executors import interface_executor_name
+from ..schemas import (
+    OUTPUT_TYPES,
+    STRICT_OUTPUT_TYPES,
+    BACnetObj,
+    DeviceObj,
+    ObjProperty,
+    SerialPort,
+)
+from ..schemas.bacnet.obj import group_by_period
+from ..utils import ReachabilityChecker, get_file_logger, log_exceptions
 from ._interface import Interface, InterfaceKey
+from ._supervisor import ConnectionSupervisor
 from .base_device import BaseDevice
 
 if TYPE_CHECKING:
@@ -19,9 +30,54 @@ else:
     Gateway = "Gateway"
 
 ObjectKey = tuple[int, int]  # obj_id, obj_type_id
+WriteKey = tuple[int, int, ObjProperty, Optional[int]]  # ObjectKey, property, priority
 
 _LOG = get_file_logger(name=__name__)
 
+# Delay (in seconds) before the first reconnection attempt. Doubled on each attempt
+# up to `reconnect_period` of device.
+_RECONNECT_MIN_DELAY = 1
+
+# Read-back of written values (in seconds). Intervals between reads are doubled,
+# starting from the minimal delay.
+_READ_BACK_INITIAL_DELAY = 0.1
+_READ_BACK_MIN_DELAY = 0.02
+_READ_BACK_SMOOTHING = 0.3  # Weight of the last write in learned delay.
+_READ_BACK_SHRINK = 0.8
+
+
+class WriteRequest(NamedTuple):
+    """Value to write into object of device."""
+
+    value: int | float | str
+    obj: BACnetObj
+    prop: ObjProperty = ObjProperty.PRESENT_VALUE
+    priority: int | None = None
+
+
+@dataclass
+class _PendingWrite:
+    """Slot of write, which waits for batch. Future is resolved by result of batch.
+    Slot is dropped, if all its callers are cancelled before batch takes it.
+    """
+
+    request: WriteRequest
+    future: asyncio.Future
+    waiters: int = 1
+
+
+def _is_written(obj: BACnetObj, request: WriteRequest) -> bool:
+    """Checks that value of request is read from object. Numbers are compared with
+    tolerance of object resolution. Values, which cannot be compared (e.g. `null` to
+    relinquish priority), are considered written.
+    """
+    if request.prop is not ObjProperty.PRESENT_VALUE or isinstance(request.value, str):
+        return True
+    try:
+        return abs(float(obj.present_value) - request.value) <= obj.resolution
+    except (TypeError, ValueError):
+        return bool(obj.present_value == request.value)
+
 
 class BasePollingDevice(BaseDevice, ABC):
     """Base class for devices, that can be periodically polled for update sensors data."""
@@ -34,10 +90,20 @@ class BasePollingDevice(BaseDevice, ABC):
         self._scheduler: aiojobs.Scheduler = None  # type: ignore
 
         self.object_groups: dict[float, dict[ObjectKey, BACnetObj]] = {}  # Key: period
+        self._aggregator = ObjAggregator()
+
+        self._polling_started = False
+        self._polled_periods: set[float] = set()
+        self._fresh_reads: dict[ObjectKey, asyncio.Future] = {}
+        self._read_back_delay = _READ_BACK_INITIAL_DELAY  # Seconds. Learned by writes.
+        self._write_lock = asyncio.Lock()
+        self._pending_writes: dict[WriteKey, _PendingWrite] = {}
+        self._write_batches: set[asyncio.Task] = set()
+        self.writes_coalesced = 0
 
     @staticmethod
     @abstractmethod
-    async def is_reachable(device_obj: DeviceObj) -> bool:
+    async def is_reachable(device_obj: DeviceObj, checker: ReachabilityChecker) -> bool:
         """Check device interface is available to interaction."""
 
     @property
@@ -63,7 +129,7 @@ class BasePollingDevice(BaseDevice, ABC):
         existing.
         """
         interface_key = cls.interface_key(device_obj=device_obj)
-        if not await cls.is_reachable(device_obj=device_obj):
+        if not await cls.is_reachable(device_obj=device_obj, checker=gateway.reachability):
             raise EnvironmentError(f"{device_obj.property_list.interface} is unreachable")
         _LOG.debug(
             "Interface reachable",
@@ -74,23 +140,33 @@ class BasePollingDevice(BaseDevice, ABC):
         device._scheduler = await aiojobs.create_scheduler(close_timeout=60, limit=None)
 
         if interface_key not in cls._interfaces:
-            lock = asyncio.Lock(loop=gateway.loop)
-            async with lock:  # pylint: disable=not-async-context-manager
-                client = await device.create_client(device_obj=device_obj)
-                client_connected = await device.connect_client(client=client)
-            polling_event = asyncio.Event()
             interface = Interface(
                 interface_key=interface_key,
                 used_by={device.id},
-                client=client,
-                lock=lock,
-                polling_event=polling_event,
-                client_connected=client_connected,
+                client=None,
+                lock=asyncio.Lock(),
+                polling_event=asyncio.Event(),
+                client_connected=False,
+            )
+            interface.supervisor = ConnectionSupervisor(
+                interface=interface,
+                connect=device.open_client,
+                disconnect=device._disconnect_client,  # pylint: disable=protected-access
+                min_delay=_RECONNECT_MIN_DELAY,
+                max_delay=device.reconnect_period,
             )
             cls._interfaces[interface_key] = interface
+            # Serial bus performs one request at a time.
+            gateway.executors.get(
+                name=interface_executor_name(interface_key),
+                max_workers=1 if isinstance(interface_key, SerialPort) else None,
+            )
+            await interface.supervisor.connect()
         else:
-            # Using existing interface.
+            # Using existing interface. Connection is owned by the newest device, so
+            # config of stopped devices is not used for reconnection.
             cls._interfaces[interface_key].used_by.add(device.id)
+            device.own_connection()
 
         device._LOG.debug(
             "Device created",
@@ -98,10 +174,20 @@ class BasePollingDevice(BaseDevice, ABC):
         )
         return device
 
+    @property
+    def executor(self) -> str:
+        """Name of executor for I/O of interface."""
+        return interface_executor_name(self.interface.interface_key)
+
     @property
     def reconnect_period(self) -> int:
         return self._device_obj.property_list.reconnect_period
 
+    @property
+    def send_period(self) -> float:
+        """Period to send objects to servers. `0` means send after each poll."""
+        return self._device_obj.property_list.send_period
+
     @abstractmethod
     async def create_client(self, device_obj: DeviceObj) -> Any:
         raise NotImplementedError
@@ -110,10 +196,46 @@ class BasePollingDevice(BaseDevice, ABC):
     async def connect_client(self, client: Any) -> bool:
         """Performs connect with client."""
 
+    async def open_client(self) -> Any:
+        """Creates and connects client. Used by supervisor of interface.
+
+        Raises:
+            ConnectionError: If client not connected.
+        """
+        client = await self.create_client(device_obj=self._device_obj)
+        if client is None or not await self.connect_client(client=client):
+            raise ConnectionError(f"Client not connected: {self.interface.interface_key}")
+        return client
+
+    @property
+    def supervisor(self) -> ConnectionSupervisor:
+        """Supervisor of interface connection."""
+        supervisor = self.interface.supervisor
+        if supervisor is None:
+            raise ValueError(f"Interface not supervised: {self.interface.interface_key}")
+        return supervisor
+
+    def own_connection(self) -> None:
+        """Binds connection of interface to client functions of device."""
+        self.supervisor.bind(connect=self.open_client, disconnect=self._disconnect_client)
+
+    @property
+    def client(self) -> Any:
+        """Client of interface.
+
+        Raises:
+            ConnectionError: If client is absent. Supervisor removes client, while
+                reconnecting it.
+        """
+        client = self.interface.client
+        if client is None:
+            raise ConnectionError(f"Client not connected: {self.interface.interface_key}")
+        return client
+
     async def disconnect_client(self) -> None:
         interface = self.interface
         if not interface.used_by:
-            await self._disconnect_client(client=interface.client)
+            await self.supervisor.close()
 
     @abstractmethod
     async def _disconnect_client(self, client: Any) -> None:
@@ -152,6 +274,29 @@ class BasePollingDevice(BaseDevice, ABC):
     ) -> None:
         """You should implement async write method for your device."""
 
+    async def write_many(self, requests: Sequence[WriteRequest]) -> list[Exception | None]:
+        """Writes values to several objects of device.
+
+        Default implementation writes objects one by one. Protocols, which can write
+        several objects by one request, should override it.
+
+        Returns:
+            Exception of each request or None, if value written.
+        """
+        results: list[Exception | None] = []
+        for request in requests:
+            try:
+                await self.write(
+                    value=request.value,
+                    obj=request.obj,
+                    prop=request.prop,
+                    priority=request.priority,
+                )
+                results.append(None)
+            except Exception as exc:  # pylint: disable=broad-except
+                results.append(exc)
+        return results
+
     @log_exceptions(logger=_LOG)
     async def write_with_check(
         self, value: int | float | str, output_obj: BACnetObj, **kwargs: Any
@@ -167,61 +312,313 @@ class BasePollingDevice(BaseDevice, ABC):
             Verified output object instance | tuple of two verified object instances:
             output and mapped input.
         """
-        if output_obj.object_type not in OUTPUT_TYPES:
-            raise ValueError(
-                f"Expected object with type one of: {OUTPUT_TYPES}. "
-                f"Got {output_obj.object_type}"
-            )
+        (result,) = await self.write_many_with_check(
+            requests=[
+                WriteRequest(
+                    value=value,
+                    obj=output_obj,
+                    prop=kwargs.get("prop", ObjProperty.PRESENT_VALUE),
+                    priority=kwargs.get("priority"),
+                )
+            ]
+        )
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def write_many_with_check(
+        self, requests: Sequence[WriteRequest]
+    ) -> list[tuple[BACnetObj, BACnetObj | None] | Exception]:
+        """Writes values to several objects at controller and checks them by one
+        read-back of all writes (see `_read_back()`). Mapped inputs are read once after
+        it.
+
+        Writes of device are performed one batch at a time. Requests, which wait for
+        batch, are kept in slots by object, property and priority: newer value replaces
+        value, which is not written yet. All requests of slot get result of the last
+        value.
 
-        need_synchronize = output_obj.object_type in STRICT_OUTPUT_TYPES
+        Args:
+            requests: Writes to objects of this device.
 
-        input_obj = (
-            self.get_object(
-                object_id=output_obj.object_id,
-                object_type_id=output_obj.object_type.value - 1,
+        Returns:
+            For each request: tuple of verified output object and mapped input object
+            or exception, if write failed.
+        """
+        slots: list[tuple[WriteKey, _PendingWrite]] = []
+        for request in requests:
+            key = (
+                request.obj.object_id,
+                request.obj.object_type.value,
+                request.prop,
+                request.priority,
             )
-            if need_synchronize
-            else None
-        )
+            slot = self._pending_writes.get(key)
+            if slot is None:
+                future = asyncio.get_running_loop().create_future()
+                slot = self._pending_writes[key] = _PendingWrite(request, future)
+            else:
+                self._LOG.debug(
+                    "Write replaced by newer value",
+                    extra={"object": request.obj, "value_replaced": slot.request.value},
+                )
+                slot.request = request
+                slot.waiters += 1
+                self.writes_coalesced += 1
+            slots.append((key, slot))
+
+        try:
+            await self._write_lock.acquire()
+        except asyncio.CancelledError:
+            self._drop_slots(slots=slots)
+            raise
+        if self._pending_writes:  # Not taken by previous batch.
+            # Batch owns the lock until it is written, so cancellation of caller does
+            # not let the next batch start.
+            batch = asyncio.create_task(
+                self._write_batch(slots=list(self._pending_writes.values()))
+            )
+            self._pending_writes.clear()
+            self._write_batches.add(batch)
+            batch.add_done_callback(self._write_batches.discard)
+        else:
+            self._write_lock.release()
+        try:
+            # Future of slot is shared with other callers, so it must not be cancelled.
+            return [await asyncio.shield(slot.future) for _, slot in slots]
+        except asyncio.CancelledError:
+            self._drop_slots(slots=slots)
+            raise
+
+    def _drop_slots(self, slots: list[tuple[WriteKey, _PendingWrite]]) -> None:
+        """Drops slots of cancelled caller, which are not taken by batch yet and are not
+        awaited by other callers.
+        """
+        for key, slot in slots:
+            if self._pending_writes.get(key) is not slot:
+                continue  # Taken by batch.
+            slot.waiters -= 1
+            if not slot.waiters:
+                del self._pending_writes[key]
+                slot.future.cancel()
+
+    async def _write_batch(self, slots: list[_PendingWrite]) -> None:
+        try:
+            await self._write_slots(slots=slots)
+        finally:
+            self._write_lock.release()
+
+    async def _write_slots(self, slots: list[_PendingWrite]) -> None:
+        try:
+            results = await self._write_many_with_check(
+                requests=[slot.request for slot in slots]
+            )
+        except asyncio.CancelledError:
+            for slot in slots:
+                slot.future.cancel()
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            results = [exc] * len(slots)
+        for slot, result in zip(slots, results):
+            if not slot.future.done():  # Callers of slot may be cancelled.
+                slot.future.set_result(result)
+
+    async def _write_many_with_check(
+        self, requests: Sequence[WriteRequest]
+    ) -> list[tuple[BACnetObj, BACnetObj | None] | Exception]:
+        results: list[tuple[BACnetObj, BACnetObj | None] | Exception] = []
+        to_write: list[WriteRequest] = []
+        for request in requests:
+            if request.obj.object_type not in OUTPUT_TYPES:
+                results.append(
+                    ValueError(
+                        f"Expected object with type one of: {OUTPUT_TYPES}. "
+                        f"Got {request.obj.object_type}"
+                    )
+                )
+            else:
+                results.append((request.obj, None))
+                to_write.append(request)
+        if not to_write:
+            return results
 
         self.interface.polling_event.clear()
-        await self.write(value=value, obj=output_obj, **kwargs)
+        try:
+            write_results = iter(await self.write_many(requests=to_write))
+            written: dict[ObjectKey, WriteRequest] = {}  # The last write of object.
+            for i, request in enumerate(requests):
+                if isinstance(results[i], Exception):
+                    continue
+                exc = next(write_results)
+                if exc is not None:
+                    results[i] = exc
+                    continue
+                written[(request.obj.object_id, request.obj.object_type.value)] = request
+
+            polled = await self._read_back(requests=list(written.values()))
+            for i, request in enumerate(requests):
+                if isinstance(results[i], Exception):
+                    continue
+                output_obj = await self._read_once(obj=request.obj, polled=polled)
+                input_obj = self._mapped_input(output_obj=request.obj)
+                if input_obj is not None:
+                    input_obj = await self._read_once(obj=input_obj, polled=polled)
+                results[i] = (output_obj, input_obj)
+        finally:
+            self.interface.polling_event.set()
 
-        # Several devices process write requests with delay.
-        # Wait processing on device side to get actual data.
-        await asyncio.sleep(1)
+        verified: dict[ObjectKey, BACnetObj] = {}
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                continue
+            output_obj = self._verify_once(obj=result[0], verified=verified)
+            input_obj = (
+                self._verify_once(obj=result[1], verified=verified) if result[1] else None
+            )
+            results[i] = (output_obj, input_obj)
+            self._LOG.debug(
+                "Write with check called",
+                extra={
+                    "output_object": output_obj,
+                    "input_object": input_obj,
+                    "value_write": requests[i].value,
+                },
+            )
+        return results
 
-        polled_output_obj = await self.read(obj=output_obj, wait=False, **kwargs)
-        polled_input_obj = (
-            await self.read(obj=input_obj, wait=False, **kwargs) if input_obj else None
-        )
-        self.interface.polling_event.set()
+    async def _read_back(
+        self, requests: Sequence[WriteRequest]
+    ) -> dict[ObjectKey, BACnetObj]:
+        """Reads written objects at growing intervals until written values are read or
+        `writeCheckTimeout` of device is passed.
+
+        Several devices process write requests with delay. Delay before the first read
+        is learned from previous writes of device.
+
+        Returns:
+            Polled objects.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self._device_obj.property_list.write_check_timeout
+        started = loop.time()
+        deadline = started + timeout
+
+        polled: dict[ObjectKey, BACnetObj] = {}
+        pending = {
+            (request.obj.object_id, request.obj.object_type.value): request
+            for request in requests
+        }
+        delay = min(self._read_back_delay, timeout)
+        interval = _READ_BACK_MIN_DELAY
+        attempts = 0
+        while pending:
+            await asyncio.sleep(delay)
+            attempts += 1
+            read_started = loop.time()
+            for key, request in list(pending.items()):
+                polled[key] = await self.read(obj=request.obj, wait=False)
+                if _is_written(obj=polled[key], request=request):
+                    del pending[key]
+            if not pending:
+                self._learn_read_back_delay(
+                    confirmed=read_started - started, first_attempt=attempts == 1
+                )
+                break
+            if loop.time() >= deadline:
+                self._LOG.debug(
+                    "Written values not read back",
+                    extra={"device_id": self.id, "objects_quantity": len(pending)},
+                )
+                break
+            delay = min(interval, deadline - loop.time())
+            interval *= 2
 
-        verified_output_obj = self._gtw.verifier.verify(obj=polled_output_obj)
-        verified_input_obj = (
-            self._gtw.verifier.verify(obj=polled_input_obj) if polled_input_obj else None
-        )
         self._LOG.debug(
-            "Write with check called",
+            "Read back written values",
             extra={
-                "output_object": verified_output_obj,
-                "input_object": verified_input_obj,
-                "value_write": value,
+                "device_id": self.id,
+                "attempts": attempts,
+                "seconds_took": loop.time() - started,
+                "read_back_delay": self._read_back_delay,
             },
         )
-        return verified_output_obj, verified_input_obj
+        return polled
+
+    def _learn_read_back_delay(self, confirmed: float, first_attempt: bool) -> None:
+        """Updates delay before the first read of written values.
+
+        Args:
+            confirmed: Seconds from write until the read, which got written values.
+            first_attempt: Values were got by the first read. Shorter delay is tried
+                next time, because actual processing time of device may be less.
+        """
+        if first_attempt:
+            delay = self._read_back_delay * _READ_BACK_SHRINK
+        else:
+            delay = self._read_back_delay + _READ_BACK_SMOOTHING * (
+                confirmed - self._read_back_delay
+            )
+        self._read_back_delay = max(delay, _READ_BACK_MIN_DELAY)
+
+    def _mapped_input(self, output_obj: BACnetObj) -> BACnetObj | None:
+        """
+        Returns:
+            Input object, which should be synchronized with output object.
+        """
+        if output_obj.object_type not in STRICT_OUTPUT_TYPES:
+            return None
+        return self.get_object(
+            object_id=output_obj.object_id,
+            object_type_id=output_obj.object_type.value - 1,
+        )
+
+    async def _read_once(
+        self, obj: BACnetObj, polled: dict[ObjectKey, BACnetObj]
+    ) -> BACnetObj:
+        key = (obj.object_id, obj.object_type.value)
+        if key not in polled:
+            polled[key] = await self.read(obj=obj, wait=False)
+        return polled[key]
+
+    def _verify_once(
+        self, obj: BACnetObj, verified: dict[ObjectKey, BACnetObj]
+    ) -> BACnetObj:
+        key = (obj.object_id, obj.object_type.value)
+        if key not in verified:
+            verified[key] = self._gtw.verifier.verify(obj=obj)
+        return verified[key]
+
+    async def read_fresh(self, obj: BACnetObj, max_age: float) -> BACnetObj:
+        """Reads object from controller, if it was read more than `max_age` seconds
+        ago. Concurrent calls for object share one read.
+
+        Returns:
+            Verified object instance.
+        """
+        if obj.updated and (datetime.now() - obj.updated).total_seconds() <= max_age:
+            return obj
+        key = (obj.object_id, obj.object_type.value)
+        read = self._fresh_reads.get(key)
+        if read is None:
+            read = self._fresh_reads[key] = asyncio.ensure_future(
+                self._read_and_verify(obj=obj)
+            )
+            read.add_done_callback(lambda _: self._fresh_reads.pop(key, None))
+        # Cancelled caller should not cancel read for others.
+        return await asyncio.shield(read)
+
+    async def _read_and_verify(self, obj: BACnetObj) -> BACnetObj:
+        polled_obj = await self.read(obj=obj, wait=True)
+        return self._gtw.verifier.verify(obj=polled_obj)
 
-    @lru_cache(maxsize=10)
     def get_object(self, object_id: int, object_type_id: int) -> BACnetObj | None:
-        """Cache last 10 object instances.
+        """
         Args:
             object_id: Object identifier.
             object_type_id: Object type identifier.
 
         Returns:
             Object instance.
-
-        fixme: use dict
         """
         for obj_group in self.object_groups.values():
             if (object_id, object_type_id) in obj_group:
@@ -230,45 +627,100 @@ class BasePollingDevice(BaseDevice, ABC):
 
     @log_exceptions(logger=_LOG)
     async def start_periodic_polls(self) -> None:
-        """Starts periodic polls for all periods."""
+        """Starts periodic polls for all periods. Waits for connection of interface."""
 
-        if self.is_client_connected:
-            self.interface.polling_event.set()
-            for period, objs_group in self.object_groups.items():
-                self._LOG.debug(
-                    "Spawning polling task for objects group",
-                    extra={
-                        "device_id": self.id,
-                        "period": period,
-                        "objects_quantity": len(objs_group.values()),
-                    },
-                )
-                await self._scheduler.spawn(
-                    self.periodic_poll(objs=objs_group.values(), period=period)
-                )
-            await self._scheduler.spawn(
-                self._periodic_reset_unreachable(self.object_groups)
-            )
-        else:
+        if not self.is_client_connected:
             self._LOG.info(
-                "Client is not connected. Sleeping to next try",
-                extra={"device_id": self.id, "seconds_to_next_try": self.reconnect_period},
+                "Client is not connected. Waiting for connection",
+                extra={"device_id": self.id, **self.supervisor.stats},
             )
-            await asyncio.sleep(delay=self.reconnect_period)
-            self.__class__._interfaces[  # pylint: disable=protected-access
-                self.interface_key(device_obj=self._device_obj)
-            ].client = await self.create_client(self._device_obj)
-            await self._scheduler.spawn(self.start_periodic_polls())
+            await self.supervisor.wait_connected()
+
+        self.interface.polling_event.set()
+        self._polling_started = True
+        # Groups may be added while spawning. Added groups are spawned by adding.
+        for period in list(self.object_groups):
+            await self._spawn_periodic_poll(period=period)
+        await self._scheduler.spawn(self._periodic_reset_unreachable(self.object_groups))
+        if self.send_period:
+            await self._scheduler.spawn(self.periodic_send(period=self.send_period))
+
+    async def _spawn_periodic_poll(self, period: float) -> None:
+        """Spawns polling task for objects group, if it is not running."""
+        if period in self._polled_periods:
+            return None
+        self._polled_periods.add(period)
+        self._LOG.debug(
+            "Spawning polling task for objects group",
+            extra={
+                "device_id": self.id,
+                "period": period,
+                "objects_quantity": len(self.object_groups[period]),
+            },
+        )
+        await self._scheduler.spawn(self.periodic_poll(period=period))
+
+    async def update_objects(
+        self, objs: Collection[BACnetObj], removed: Collection[ObjectKey]
+    ) -> None:
+        """Adds or replaces objects and removes objects without stopping of polling.
+
+        Polling of new period is started, if polling of device is started. Polling of
+        period without objects is stopped.
+
+        Args:
+            objs: New or changed objects.
+            removed: Keys of removed objects.
+        """
+        keys = {*removed, *((obj.object_id, obj.object_type.value) for obj in objs)}
+        for period, objs_group in list(self.object_groups.items()):
+            for key in keys:
+                objs_group.pop(key, None)
+            if not objs_group:
+                del self.object_groups[period]
+
+        for period, objs_group in group_by_period(objs=list(objs)).items():
+            self.object_groups.setdefault(period, {}).update(objs_group)
+            if self._polling_started:
+                await self._spawn_periodic_poll(period=period)
+
+        self._LOG.info(
+            "Objects updated",
+            extra={
+                "device_id": self.id,
+                "objects_updated_quantity": len(objs),
+                "objects_removed_quantity": len(removed),
+            },
+        )
 
     async def stop(self) -> None:
         """Waits for finish of all polling tasks with timeout, and stop polling.
-        Closes client.
+        Closes client, if device is the last user of interface.
         """
-        self.interface.polling_event.clear()
+        interface = self.interface
+        interface.used_by.discard(self.id)
         await self._scheduler.close()
-        await self.disconnect_client()
+        if self._polling_started:
+            await self._send_window()
+            self._polling_started = False
+        if not interface.used_by:
+            # Event is shared by devices of interface.
+            interface.polling_event.clear()
+            await self.disconnect_client()
+            del self.__class__._interfaces[interface.interface_key]
+        else:
+            self._pass_connection(interface=interface)
         self._LOG.info("Device stopped", extra={"device_id": self.id})
 
+    def _pass_connection(self, interface: Interface) -> None:
+        """Passes connection of interface to another device, which uses it."""
+        for dev_id in interface.used_by:
+            device = self._gtw.get_device(dev_id=dev_id)
+            if isinstance(device, BasePollingDevice):
+                device.own_connection()
+                return None
+        return None
+
     async def _periodic_reset_unreachable(
         self, object_groups: dict[float, dict[tuple[int, int], BACnetObj]]
     ) -> None:
@@ -284,11 +736,21 @@ class BasePollingDevice(BaseDevice, ABC):
         )
 
     @log_exceptions(logger=_LOG)
-    async def periodic_poll(
-        self,
-        objs: Collection[BACnetObj],
-        period: float,
-    ) -> None:
+    async def periodic_poll(self, period: float) -> None:
+        """Polls objects group of `period`. Objects of group are taken on each poll,
+        so changes of group are applied without restart. Stops when group is removed.
+        """
+        objs = list(self.object_groups.get(period, {}).values())
+        if not objs:
+            self._polled_periods.discard(period)
+            self._LOG.debug(
+                "Polling stopped. No objects in group",
+                extra={"device_id": self.id, "period": period},
+            )
+            return None
+        if not self.supervisor.connected:
+            # All devices of interface are woken, when the link comes back.
+            await self.supervisor.wait_connected()
         self._LOG.debug(
             "Polling started",
             extra={"device_id": self.id, "period": period, "objects_number": len(objs)},
@@ -309,11 +771,44 @@ class BasePollingDevice(BaseDevice, ABC):
         )
         if _t_delta.seconds > period:
             self._LOG.warning("Polling period is too short!", extra={"device_id": self.id})
-        verified_objs = await self._after_polling_tasks(objs=polled_objs)
+        await self._after_polling_tasks(objs=polled_objs)
         await asyncio.sleep(delay=period - _t_delta.seconds)
-        await self._scheduler.spawn(self.periodic_poll(objs=verified_objs, period=period))
+        await self._scheduler.spawn(self.periodic_poll(period=period))
 
     async def _after_polling_tasks(self, objs: list[BACnetObj]) -> list[BACnetObj]:
         verified_objects = self._gtw.verifier.verify_objects(objs=objs)
-        await self._scheduler.spawn(self._gtw.send_objects(objs=verified_objects))
+        if self.send_period:
+            self._aggregator.add(objs=verified_objects)
+        else:
+            await self._scheduler.spawn(self._gtw.send_objects(objs=verified_objects))
         return verified_objects
+
+    async def periodic_send(self, period: float) -> None:
+        """Sends objects, accumulated by polling, once per `period`."""
+        await asyncio.sleep(delay=period)
+        try:
+            await self._send_window()
+        except Exception:  # pylint: disable=broad-except
+            pass  # Logged in `_send_window`. Next window should be sent anyway.
+        await self._scheduler.spawn(self.periodic_send(period=period))
+
+    @log_exceptions(logger=_LOG)
+    async def _send_window(self) -> None:
+        """Closes current send window and sends last states of objects in one payload.
+
+        Statistics of window (count, min, max, mean) are sent along with objects.
+        """
+        aggregates = self._aggregator.flush()
+        if not aggregates:
+            return None
+        self._LOG.debug(
+            "Send window closed",
+            extra={
+                "device_id": self.id,
+                "objects_quantity": len(aggregates),
+                "samples_quantity": sum(aggregate.count for aggregate in aggregates),
+            },
+        )
+        await self._gtw.send_objects(
+            objs=[aggregate.obj for aggregate in aggregates], aggregates=aggregates
+        )
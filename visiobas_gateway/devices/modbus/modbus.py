@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from ipaddress import IPv4Address
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 from pymodbus.client.sync import ModbusSerialClient, ModbusTcpClient  # type: ignore
-from pymodbus.exceptions import ModbusException, ModbusIOException  # type: ignore
+from pymodbus.exceptions import (  # type: ignore
+    ConnectionException,
+    ModbusException,
+    ModbusIOException,
+)
 from pymodbus.framer.rtu_framer import ModbusRtuFramer  # type: ignore
 from pymodbus.framer.socket_framer import ModbusSocketFramer  # type: ignore
 
@@ -19,9 +23,14 @@ from ...schemas import (
     Protocol,
     SerialPort,
 )
-from ...utils import get_file_logger, log_exceptions, ping, serial_port_connected
+from ...utils import (
+    ReachabilityChecker,
+    get_file_logger,
+    log_exceptions,
+    serial_port_connected,
+)
 from .._interface import InterfaceKey
-from ..base_polling_device import BasePollingDevice
+from ..base_polling_device import BasePollingDevice, WriteRequest
 from ._modbus_coder_mixin import ModbusCoderMixin
 
 _LOG = get_file_logger(name=__name__)
@@ -39,12 +48,13 @@ class ModbusDevice(BasePollingDevice, ModbusCoderMixin):
         return device_obj.property_list.interface
 
     @staticmethod
-    async def is_reachable(device_obj: DeviceObj) -> bool:
+    async def is_reachable(device_obj: DeviceObj, checker: ReachabilityChecker) -> bool:
         interface_key = device_obj.property_list.interface
         if isinstance(interface_key, SerialPort):
             return serial_port_connected(serial_port=interface_key)
         if isinstance(interface_key, tuple) and isinstance(interface_key[0], IPv4Address):
-            return await ping(host=str(interface_key[0]), attempts=4)
+            ip, port = interface_key
+            return await checker.is_reachable(host=str(ip), port=port)
         raise ValueError
 
     @log_exceptions(logger=_LOG)
@@ -103,7 +113,7 @@ class ModbusDevice(BasePollingDevice, ModbusCoderMixin):
 
     @property
     def read_funcs(self) -> dict[ModbusReadFunc, Callable]:
-        client = self.interface.client
+        client = self.client
         return {
             ModbusReadFunc.READ_COILS: client.read_coils,
             ModbusReadFunc.READ_DISCRETE_INPUTS: client.read_discrete_inputs,
@@ -113,7 +123,7 @@ class ModbusDevice(BasePollingDevice, ModbusCoderMixin):
 
     @property
     def write_funcs(self) -> dict[ModbusWriteFunc, Callable]:
-        client = self.interface.client
+        client = self.client
         return {
             ModbusWriteFunc.WRITE_COIL: client.write_coil,
             ModbusWriteFunc.WRITE_REGISTER: client.write_register,
@@ -126,7 +136,15 @@ class ModbusDevice(BasePollingDevice, ModbusCoderMixin):
             raise ValueError(f"`obj` must be `ModbusObj`. Got {type(obj)}")
         if wait:
             await self.interface.polling_event.wait()
-        return await self._gtw.async_add_job(self.sync_read, obj)
+        try:
+            return await self._gtw.async_add_job(
+                self.sync_read, obj, executor=self.executor
+            )
+        except (ConnectionException, ConnectionError) as exc:
+            # Client is reconnected by supervisor. Polling waits for reconnection.
+            self.supervisor.connection_lost(exc=exc)
+            obj.set_property(value=exc)
+            return obj
 
     @log_exceptions(logger=_LOG)
     def sync_read(self, obj: ModbusObj) -> ModbusObj:
@@ -151,7 +169,7 @@ class ModbusDevice(BasePollingDevice, ModbusCoderMixin):
     ) -> None:
         if not isinstance(obj, ModbusObj):
             raise ValueError(f"`obj` must be `ModbusObj`. Got {type(obj)}")
-        await self._gtw.async_add_job(self.sync_write, value, obj)
+        await self._gtw.async_add_job(self.sync_write, value, obj, executor=self.executor)
 
     def sync_write(self, value: int | float | str, obj: ModbusObj) -> None:
         """Write value to Modbus object.
@@ -180,3 +198,78 @@ class ModbusDevice(BasePollingDevice, ModbusCoderMixin):
         if request.isError():
             raise ModbusIOException("0x80")  # todo: resp.string
         self._LOG.debug("Successfully write", extra={"object": obj, "value": value})
+
+    async def write_many(self, requests: Sequence[WriteRequest]) -> list[Exception | None]:
+        for request in requests:
+            if not isinstance(request.obj, ModbusObj):
+                raise ValueError(f"`obj` must be `ModbusObj`. Got {type(request.obj)}")
+        return await self._gtw.async_add_job(
+            self.sync_write_many, requests, executor=self.executor
+        )
+
+    def sync_write_many(self, requests: Sequence[WriteRequest]) -> list[Exception | None]:
+        """Writes values to several Modbus objects. Registers of objects, written by
+        `WRITE_REGISTERS` function at contiguous addresses, are written by one request.
+
+        Returns:
+            Exception of each request or None, if value written.
+        """
+        results: list[Exception | None] = [None] * len(requests)
+        runs: list[tuple[list[int], list[int]]] = []  # Indexes of requests, registers.
+        run_end: int | None = None  # Address next to the last register of run.
+
+        # Values, which are not numbers, are rejected by `sync_write()`.
+        registers_writes: list[tuple[int, ModbusObj, int | float]] = sorted(
+            (
+                (i, request.obj, request.value)
+                for i, request in enumerate(requests)
+                if isinstance(request.obj, ModbusObj)
+                and request.obj.func_write is ModbusWriteFunc.WRITE_REGISTERS
+                and isinstance(request.value, (int, float))
+            ),
+            key=lambda write: write[1].address,
+        )
+        for i, obj, value in registers_writes:
+            try:
+                payload = self._build_payload(value=value, obj=obj)
+            except Exception as exc:  # pylint: disable=broad-except
+                results[i] = exc
+                continue
+            registers = payload if isinstance(payload, list) else [payload]
+            if runs and run_end == obj.address:
+                runs[-1][0].append(i)
+                runs[-1][1].extend(registers)  # type: ignore
+            else:
+                runs.append(([i], list(registers)))  # type: ignore
+            run_end = obj.address + len(registers)
+
+        addresses = {i: obj.address for i, obj, _ in registers_writes}
+        for indexes, registers in runs:
+            address = addresses[indexes[0]]
+            try:
+                request = self.write_funcs[ModbusWriteFunc.WRITE_REGISTERS](
+                    address,
+                    registers,
+                    unit=self._device_obj.property_list.rtu.unit,  # type: ignore
+                )
+                if request.isError():
+                    raise ModbusIOException("0x80")
+            except Exception as exc:  # pylint: disable=broad-except
+                for i in indexes:
+                    results[i] = exc
+                continue
+            self._LOG.debug(
+                "Successfully write",
+                extra={"address": address, "registers_quantity": len(registers)},
+            )
+
+        for i, request in enumerate(requests):
+            if i in addresses:
+                continue
+            try:
+                if not isinstance(request.obj, ModbusObj):
+                    raise ValueError(f"`obj` must be `ModbusObj`. Got {type(request.obj)}")
+                self.sync_write(value=request.value, obj=request.obj)
+            except Exception as exc:  # pylint: disable=broad-except
+                results[i] = exc
+        return results
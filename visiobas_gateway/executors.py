@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Mapping
+
+from .utils import get_file_logger
+
+_LOG = get_file_logger(name=__name__)
+
+# Names of executors by workload. Executors of interfaces are named by
+# `interface_executor_name()`.
+CPU_EXECUTOR = "cpu"  # Parsing, compression.
+FILES_EXECUTOR = "files"  # Outbox, snapshots.
+INTERFACE_EXECUTOR = "interface"  # Size of each interface executor.
+
+DEFAULT_WORKERS: dict[str, int] = {
+    CPU_EXECUTOR: min(4, os.cpu_count() or 1),
+    FILES_EXECUTOR: 2,
+    INTERFACE_EXECUTOR: 4,
+}
+
+
+def interface_executor_name(interface_key: Any) -> str:
+    """Name of executor for I/O of interface."""
+    return f"{INTERFACE_EXECUTOR}:{interface_key}"
+
+
+class InstrumentedExecutor(ThreadPoolExecutor):
+    """Thread pool, which measures time of jobs waiting in queue."""
+
+    def __init__(self, name: str, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix=name)
+        self.name = name
+        self._stats_lock = threading.Lock()
+
+        self.submitted = 0
+        self.started = 0
+        self.wait_time = 0.0  # Seconds.
+        self.max_wait_time = 0.0  # Seconds.
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self.name}]"
+
+    def submit(  # pylint: disable=arguments-differ
+        self, fn: Callable, /, *args: Any, **kwargs: Any
+    ) -> Future:
+        with self._stats_lock:
+            self.submitted += 1
+        return super().submit(self._run, time.monotonic(), fn, *args, **kwargs)
+
+    def _run(self, enqueued: float, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        wait_time = time.monotonic() - enqueued
+        with self._stats_lock:
+            self.started += 1
+            self.wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+        return fn(*args, **kwargs)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Metrics of executor for tuning."""
+        with self._stats_lock:
+            return {
+                "workers": self._max_workers,
+                "queued": self.submitted - self.started,
+                "started": self.started,
+                "avg_wait_time": self.wait_time / self.started if self.started else 0.0,
+                "max_wait_time": self.max_wait_time,
+            }
+
+
+class Executors:
+    """Named thread pools, separately sized per workload.
+
+    Slow workload (e.g. serial bus) does not starve other workloads, because each one
+    waits in its own queue. Executors are created on first use.
+    """
+
+    def __init__(self, workers: Mapping[str, int]):
+        """
+        Args:
+            workers: Number of threads by name of executor. `interface` - number of
+                threads of each interface executor. Defaults are used for missed.
+        """
+        self._workers = {**DEFAULT_WORKERS, **workers}
+        self._executors: dict[str, InstrumentedExecutor] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{list(self._executors)}"
+
+    def get(self, name: str, max_workers: int | None = None) -> InstrumentedExecutor:
+        """Returns executor. Creates it, if not exists.
+
+        Args:
+            name: Name of executor.
+            max_workers: Number of threads for new executor. Configured number is used,
+                if not provided.
+        """
+        executor = self._executors.get(name)
+        if executor is None:
+            if max_workers is None:
+                max_workers = self._workers.get(
+                    name.partition(":")[0], self._workers[INTERFACE_EXECUTOR]
+                )
+            executor = self._executors[name] = InstrumentedExecutor(
+                name=name, max_workers=max_workers
+            )
+            _LOG.debug(
+                "Executor created", extra={"executor": name, "max_workers": max_workers}
+            )
+        return executor
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {name: executor.stats for name, executor in self._executors.items()}
+
+    def shutdown(self) -> None:
+        """Shutdowns executors. Queued jobs are cancelled."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors = {}
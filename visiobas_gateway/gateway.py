@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Collection, Type, Union
 
-import aiohttp
 import aiojobs  # type: ignore
 
+from visiobas_gateway.aggregator import ObjAggregate
 from visiobas_gateway.api import ApiServer
 from visiobas_gateway.clients import HTTPClient, MQTTClient
+from visiobas_gateway.cluster import ClusterSupervisor, ClusterWorker
 from visiobas_gateway.devices import BACnetDevice, ModbusDevice
 from visiobas_gateway.devices.base_polling_device import BasePollingDevice
+from visiobas_gateway.executors import CPU_EXECUTOR, FILES_EXECUTOR, Executors
+from visiobas_gateway.parser import parse_payload, warm_up
 from visiobas_gateway.schemas import BACnetObj, DeviceObj, ObjType
 from visiobas_gateway.schemas.bacnet.device_obj import POLLING_TYPES
 from visiobas_gateway.schemas.bacnet.obj import group_by_period
@@ -21,7 +28,11 @@ from visiobas_gateway.schemas.settings import (
     HTTPSettings,
     MQTTSettings,
 )
-from visiobas_gateway.utils import get_file_logger, log_exceptions
+from visiobas_gateway.serializer import LightSerializer
+from visiobas_gateway.snapshot import DeviceSnapshot, SnapshotStore
+from visiobas_gateway.sync import content_hash, diff_hashes
+from visiobas_gateway.utils import ReachabilityChecker, get_file_logger, log_exceptions
+from visiobas_gateway.utils.telemetry_codec import TelemetryRecord
 from visiobas_gateway.verifier import BACnetVerifier
 
 if TYPE_CHECKING:
@@ -33,6 +44,12 @@ _LOG = get_file_logger(name=__name__)
 
 Object = Union[BACnetObj, ModbusObj]
 ObjectType = Type[Object]
+ObjectKey = tuple[int, int]  # obj_id, obj_type_id
+ParsedCallback = Callable[[list[tuple[Object, str]]], Awaitable[None]]
+
+# Min number of objects to parse in one task. Smaller batches cost more to send to
+# executor than to parse.
+_PARSE_BATCH_SIZE = 500
 
 
 class Gateway:
@@ -72,8 +89,27 @@ class Gateway:
         self.verifier = BACnetVerifier(
             override_threshold=gateway_settings.override_threshold
         )
+        self.serializer = LightSerializer(
+            disabled_flags=gateway_settings.disabled_status_flags
+        )
+        self.executors = Executors(workers=gateway_settings.executor_workers)
+        self.reachability = ReachabilityChecker(
+            ttl=gateway_settings.reachability_ttl,
+            timeout=gateway_settings.reachability_timeout,
+        )
 
         self._devices: dict[int, Any] = {}
+        # Content hashes of loaded configuration to sync only changes.
+        self._device_hashes: dict[int, str] = {}
+        self._object_hashes: dict[int, dict[ObjectKey, str]] = {}
+        self._snapshots = SnapshotStore(directory=gateway_settings.snapshot_dir)
+        # Kept between syncs to not start processes again.
+        self._parse_executor: ProcessPoolExecutor | None = None
+        self._parse_workers = 0  # Number of processes of `_parse_executor`.
+
+        # Set in multi-process mode. Supervisor runs workers, worker polls devices.
+        self.cluster: ClusterSupervisor | None = None
+        self.worker: ClusterWorker | None = None
 
     @classmethod
     async def create(
@@ -161,10 +197,11 @@ class Gateway:
         # gateway = await gateway._create_clients(  # pylint: disable=protected-access
         #     gateway=gateway, http_settings=http_settings, mqtt_settings=mqtt_settings
         # )
-        gateway.api = await ApiServer.create(gateway=gateway, settings=api_settings)
-        await gateway._scheduler.spawn(  # pylint: disable=protected-access
-            gateway.api.start()
-        )
+        if gateway.worker is None:  # Calls are routed to workers by supervisor API.
+            gateway.api = await ApiServer.create(gateway=gateway, settings=api_settings)
+            await gateway._scheduler.spawn(  # pylint: disable=protected-access
+                gateway.api.start()
+            )
         await gateway._scheduler.spawn(  # pylint: disable=protected-access
             gateway.periodic_update(
                 gateway=gateway,
@@ -181,7 +218,6 @@ class Gateway:
     ) -> Gateway:
         """Creates clients for `gateway`."""
         gateway.http_client = HTTPClient(gateway=gateway, settings=http_settings)
-        await gateway.http_client.startup_tasks()
         gateway.mqtt_client = MQTTClient.create(gateway=gateway, settings=mqtt_settings)
         return gateway
 
@@ -189,7 +225,7 @@ class Gateway:
     async def _shutdown_clients(gateway: Gateway) -> Gateway:
         """Shutdowns clients for `gateway`."""
         if isinstance(gateway.mqtt_client, MQTTClient):
-            await gateway.mqtt_client.async_disconnect()
+            await gateway.mqtt_client.stop()
             gateway.mqtt_client = None
         if isinstance(gateway.http_client, HTTPClient):
             await gateway.http_client.shutdown_tasks()
@@ -203,43 +239,139 @@ class Gateway:
         http_settings: HTTPSettings,
         mqtt_settings: MQTTSettings,
     ) -> None:
-        """Spawn periodic update task."""
+        """Performs start tasks and spawns periodic sync task."""
         gateway = await gateway._startup_tasks(  # pylint: disable=protected-access
             gateway=gateway,
             settings=settings,
             mqtt_settings=mqtt_settings,
             http_settings=http_settings,
         )
-        await asyncio.sleep(delay=settings.update_period)
-        gateway = await gateway._shutdown_tasks(  # pylint: disable=protected-access
-            gateway=gateway
-        )
         await gateway._scheduler.spawn(  # pylint: disable=protected-access
-            gateway.periodic_update(
-                gateway=gateway,
-                settings=settings,
-                mqtt_settings=mqtt_settings,
-                http_settings=http_settings,
+            gateway.periodic_sync(period=settings.update_period)
+        )
+
+    async def periodic_sync(self, period: float) -> None:
+        """Syncs configuration of devices with server once per `period`."""
+        await asyncio.sleep(delay=period)
+        try:
+            if isinstance(self.http_client, HTTPClient):
+                # Renews authorization. Current authorization is used, if failed.
+                await self.http_client.login(
+                    get_server=self.http_client.server_get,
+                    post_servers=self.http_client.servers_post,
+                )
+            if self.cluster is None:  # Workers sync their devices.
+                await self.sync_devices()
+        except Exception:  # pylint: disable=broad-except
+            pass  # Logged in `sync_devices`. Next sync should be performed anyway.
+        _LOG.info("Executors stats", extra={"executors": self.executors.stats})
+        if self._mqtt_settings.enable and isinstance(self.mqtt_client, MQTTClient):
+            _LOG.info(
+                "MQTT publisher stats",
+                extra={"publisher": self.mqtt_client.publisher.stats},
             )
+        await self._scheduler.spawn(self.periodic_sync(period=period))
+
+    @log_exceptions(logger=_LOG)
+    async def sync_devices(self) -> None:
+        """Downloads configuration of devices and applies only changes.
+
+        Changed devices are restarted. Changed objects are replaced in running polls.
+        Clients, sessions and polling of unchanged devices are kept alive.
+        """
+        if not isinstance(self.http_client, HTTPClient):
+            raise NotImplementedError
+
+        await asyncio.gather(
+            *[
+                self._sync_device(device_id=dev_id)
+                for dev_id in self.settings.poll_device_ids
+            ],
+            return_exceptions=True,
+        )
+        _LOG.info("Devices synced", extra={"devices_quantity": len(self._devices)})
+
+    @log_exceptions(logger=_LOG)
+    async def _sync_device(self, device_id: int) -> None:
+        """Loads new device, restarts changed device or syncs objects of device."""
+        device_data = await self._download_device_data(device_id=device_id)
+        device = self._devices.get(device_id)
+        device_changed = content_hash(device_data) != self._device_hashes.get(device_id)
+
+        if device is not None and device_changed:
+            _LOG.info("Device changed. Restarting", extra={"device": device})
+            await self._remove_device(device=device)
+            device = None
+
+        if device is None:
+            await self._load_device(device_data=device_data)
+        elif isinstance(device, BasePollingDevice):
+            await self._sync_objects(device=device)
+
+    async def _sync_objects(self, device: BasePollingDevice) -> None:
+        """Applies changes of objects to running device."""
+        objs, loaded_types = await self._fetch_objects(device_obj=device.device_obj)
+        new_hashes = {key: hash_ for key, (_, hash_) in objs.items()}
+        hashes = self._object_hashes.setdefault(device.id, {})
+        diff = diff_hashes(old=hashes, new=new_hashes)
+
+        # Objects of types, which were not downloaded, are kept.
+        loaded_type_ids = {obj_type.value for obj_type in loaded_types}
+        removed = {key for key in diff.removed if key[1] in loaded_type_ids}
+        updated = diff.added | diff.changed
+        if not removed and not updated:
+            _LOG.debug("Objects not changed", extra={"device_id": device.id})
+            return None
+
+        await device.update_objects(objs=[objs[key][0] for key in updated], removed=removed)
+        for key in removed:
+            del hashes[key]
+        hashes.update({key: new_hashes[key] for key in updated})
+        self.serializer.forget(keys=[(device.id, *key) for key in removed])
+        await self._save_snapshot(device=device)
+        _LOG.info(
+            "Objects synced",
+            extra={
+                "device_id": device.id,
+                "objects_added_quantity": len(diff.added),
+                "objects_changed_quantity": len(diff.changed),
+                "objects_removed_quantity": len(removed),
+            },
         )
 
-    def add_job(self, target: Callable, *args: Any) -> None:
+    async def _remove_device(self, device: BaseDevice) -> None:
+        """Stops device and forgets its configuration."""
+        if isinstance(device, BasePollingDevice):
+            await device.stop()
+        self._devices.pop(device.id, None)
+        self._device_hashes.pop(device.id, None)
+        hashes = self._object_hashes.pop(device.id, {})
+        self.serializer.forget(keys=[(device.id, *key) for key in hashes])
+
+    def add_job(self, target: Callable, *args: Any, executor: str | None = None) -> None:
         """Adds job to the executor pool.
 
         Args:
             target: target to call.
             args: parameters for target to call.
+            executor: name of executor. Default executor of loop is used, if not set.
         """
         if target is None:
             raise ValueError("`None` not allowed")
-        self.loop.call_soon_threadsafe(self.async_add_job, target, *args)
+        self.loop.call_soon_threadsafe(
+            partial(self.async_add_job, target, *args, executor=executor)
+        )
 
-    def async_add_job(self, target: Callable, *args: Any) -> Awaitable | asyncio.Task:
+    def async_add_job(
+        self, target: Callable, *args: Any, executor: str | None = None
+    ) -> Awaitable | asyncio.Task:
         """Adds a job from within the event loop.
 
         Args:
             target: target to call.
             args: parameters for target to call.
+            executor: name of executor for sync target. Default executor of loop is
+                used, if not set.
 
         Returns:
             task or future object.
@@ -254,7 +386,11 @@ class Gateway:
             # await self._scheduler.spawn(target(*args))
             task = self.loop.create_task(target(*args))
             return task
-        task = self.loop.run_in_executor(None, target, *args)
+        task = self.loop.run_in_executor(
+            self.executors.get(name=executor) if executor is not None else None,
+            target,
+            *args,
+        )
         return task
 
     @staticmethod
@@ -272,22 +408,58 @@ class Gateway:
             gateway=gateway, http_settings=http_settings, mqtt_settings=mqtt_settings
         )
 
-        # 1. Load devices tasks.
+        if gateway.cluster is not None:
+            # Devices are polled by workers. Supervisor sends their data and routes
+            # JSON-RPC requests (from API and MQTT broker) to workers.
+            if isinstance(gateway.http_client, HTTPClient):
+                await gateway.http_client.startup_tasks()
+            await gateway.cluster.start()
+            if mqtt_settings.enable and isinstance(gateway.mqtt_client, MQTTClient):
+                await gateway.mqtt_client.start()
+            _LOG.info("Start tasks performed. Devices polled by workers")
+            return gateway
+
+        # 1. Connect to MQTT broker. Messages are queued until connected.
+        if mqtt_settings.enable and isinstance(gateway.mqtt_client, MQTTClient):
+            await gateway.mqtt_client.start()
+
+        # 2. Start devices polling from local snapshots. Data polled before
+        # authorization is stored to outbox and sent later.
+        if settings.snapshot_enabled:
+            restored = await gateway._restore_devices(  # pylint: disable=protected-access
+                device_ids=settings.poll_device_ids
+            )
+        else:
+            restored = 0
+
+        # 3. Wait authorization.
+        if isinstance(gateway.http_client, HTTPClient):
+            await gateway.http_client.startup_tasks()
+
+        if restored:
+            # Reconciles restored devices with server in background. Devices without
+            # snapshots are loaded as new.
+            await gateway._scheduler.spawn(  # pylint: disable=protected-access
+                gateway.sync_devices()
+            )
+            _LOG.info(
+                "Start tasks performed. Devices restored from snapshots",
+                extra={"gateway_settings": settings, "devices_quantity": restored},
+            )
+            return gateway
+
+        # 4. Load devices tasks.
         load_device_tasks = [
             gateway.download_device(device_id=dev_id) for dev_id in settings.poll_device_ids
         ]
 
-        # 2. Start devices polling.
+        # 5. Wait devices loading. Polling is started by devices while loading.
         for ready_device in asyncio.as_completed(load_device_tasks, timeout=60):
             try:
                 ready_device = await ready_device
             except (OSError, Exception) as e:  # pylint: disable=broad-except
                 ready_device = e  # type: ignore
-            if isinstance(ready_device, BasePollingDevice):
-                await gateway._scheduler.spawn(  # pylint: disable=protected-access
-                    ready_device.start_periodic_polls()
-                )
-            else:
+            if not isinstance(ready_device, BasePollingDevice):
                 _LOG.warning(
                     "Device not started. Expected device type `BasePollingDevice`",
                     extra={"device": ready_device, "device_type": type(ready_device)},
@@ -296,6 +468,75 @@ class Gateway:
         _LOG.info("Start tasks performed", extra={"gateway_settings": settings})
         return gateway
 
+    async def _restore_devices(self, device_ids: Collection[int]) -> int:
+        """Creates devices from local snapshots and starts their polling.
+
+        Returns:
+            Number of restored devices.
+        """
+        results = await asyncio.gather(
+            *[self._restore_device(device_id=dev_id) for dev_id in device_ids],
+            return_exceptions=True,
+        )
+        return sum(1 for result in results if isinstance(result, BasePollingDevice))
+
+    @log_exceptions(logger=_LOG)
+    async def _restore_device(self, device_id: int) -> BaseDevice | None:
+        """Creates device from local snapshot and starts its polling."""
+        snapshot = await self.async_add_job(
+            self._snapshots.load, device_id, executor=FILES_EXECUTOR
+        )
+        if snapshot is None:
+            return None
+
+        device = await self.device_factory(dev_obj=snapshot.device_obj, gateway=self)
+        if not isinstance(device, BasePollingDevice):
+            raise ValueError("Device not constructed")
+
+        objs = [obj for obj, _ in snapshot.objects.values()]
+        for obj in objs:  # Reset state of polling, stored with objects.
+            obj.unreachable_in_row = 0
+            obj.existing = True
+        device.object_groups = group_by_period(objs=objs)
+
+        self._devices.update({device.id: device})
+        self._device_hashes[device.id] = snapshot.device_hash
+        self._object_hashes[device.id] = {
+            key: hash_ for key, (_, hash_) in snapshot.objects.items()
+        }
+        await self._scheduler.spawn(device.start_periodic_polls())
+        _LOG.info(
+            "Device restored from snapshot",
+            extra={"device": device, "objects_quantity": len(objs)},
+        )
+        return device
+
+    @log_exceptions(logger=_LOG)
+    async def _save_snapshot(self, device: BasePollingDevice) -> None:
+        """Stores configuration of device to local snapshot."""
+        if not self.settings.snapshot_enabled:
+            return None
+        hashes = self._object_hashes.get(device.id, {})
+        snapshot = DeviceSnapshot(
+            device_obj=device.device_obj,
+            device_hash=self._device_hashes[device.id],
+            objects={
+                key: (obj, hashes[key])
+                for objs_group in device.object_groups.values()
+                for key, obj in objs_group.items()
+                if key in hashes
+            },
+        )
+        # Serialized in the loop, because objects are modified by polling.
+        data = snapshot.dumps()
+        await self.async_add_job(
+            self._snapshots.save, device.id, data, executor=FILES_EXECUTOR
+        )
+        _LOG.debug(
+            "Snapshot saved",
+            extra={"device_id": device.id, "objects_quantity": len(snapshot.objects)},
+        )
+
     @staticmethod
     async def _shutdown_devices(gateway: Gateway) -> Gateway:
         """Shutdowns devices for `gateway`."""
@@ -306,6 +547,8 @@ class Gateway:
         ]
         await asyncio.gather(*stop_device_polling_tasks)
         gateway._devices = {}  # pylint: disable=protected-access
+        gateway._device_hashes = {}  # pylint: disable=protected-access
+        gateway._object_hashes = {}  # pylint: disable=protected-access
 
         return gateway
 
@@ -317,14 +560,26 @@ class Gateway:
         gateway = await gateway._shutdown_devices(  # pylint: disable=protected-access
             gateway=gateway
         )
-
-        # 1. todo: save devices config to local
+        if gateway.cluster is not None:
+            await gateway.cluster.stop()
+        if gateway.worker is not None:
+            await gateway.worker.close()
+
+        # 1. Stop parse processes.
+        if gateway._parse_executor is not None:  # pylint: disable=protected-access
+            gateway._parse_executor.shutdown(  # pylint: disable=protected-access
+                wait=False, cancel_futures=True
+            )
+            gateway._parse_executor = None  # pylint: disable=protected-access
 
         # 2. Shutdown clients.
         gateway = await gateway._shutdown_clients(  # pylint: disable=protected-access
             gateway=gateway
         )
 
+        # 3. Stop executors.
+        gateway.executors.shutdown()
+
         _LOG.info("Stop tasks performed")
         return gateway
 
@@ -334,9 +589,13 @@ class Gateway:
         Then gets polling objects and load them into device.
 
         When device loaded, it may be accessed by `gateway.devices[identifier]`.
-
-        # TODO: If fails get objects from server - loads it from local.
+        Loaded configuration is stored to local snapshot.
         """
+        device_data = await self._download_device_data(device_id=device_id)
+        return await self._load_device(device_data=device_data)
+
+    async def _download_device_data(self, device_id: int) -> dict[str, Any]:
+        """Downloads data of device object."""
         if not isinstance(self.http_client, HTTPClient):
             raise NotImplementedError
 
@@ -360,50 +619,105 @@ class Gateway:
         # objs in the list, so get [0] element in `dev_obj_data[0]` below
         # request one type - 'device', so [0] element of tuple below
         # todo: refactor
-        device_obj = self._parse_device_obj(data=device_obj_data[0][0])
+        return device_obj_data[0][0]
+
+    async def _load_device(self, device_data: dict[str, Any]) -> BaseDevice:
+        """Creates device and loads its polling objects.
+
+        Polling of device is started before objects are downloaded. Objects are added
+        to running polling as soon as they are parsed, so the first poll does not wait
+        for the slowest object type.
+        """
+        device_obj = self._parse_device_obj(data=device_data)
         device = await self.device_factory(dev_obj=device_obj, gateway=self)
 
         if not device:
             raise ValueError("Device not constructed")
 
-        if device.protocol in POLLING_PROTOCOLS:
-            groups = await self.download_objects(device_obj=device_obj)
-            device.object_groups = groups
-
         self._devices.update({device.id: device})
+        self._device_hashes[device.id] = content_hash(device_data)
+
+        if isinstance(device, BasePollingDevice):
+            try:
+                await self._load_objects(device=device)
+            except Exception:
+                await self._remove_device(device=device)
+                raise
+            await self._save_snapshot(device=device)
         _LOG.info("Device loaded", extra={"device": device})
         return device
 
-    async def download_objects(
-        self, device_obj: DeviceObj
-    ) -> dict[float, dict[tuple[int, int], BACnetObj]]:
-        # todo: use for extractions tasks asyncio.as_completed(tasks):
+    async def _load_objects(self, device: BasePollingDevice) -> None:
+        """Starts polling of device and adds objects to it by parsed batches."""
+        hashes = self._object_hashes[device.id] = {}
+
+        async def _add_objects(objs: list[tuple[Object, str]]) -> None:
+            hashes.update(
+                {(obj.object_id, obj.object_type.value): hash_ for obj, hash_ in objs}
+            )
+            await device.update_objects(objs=[obj for obj, _ in objs], removed=())
+
+        polls_job = await self._scheduler.spawn(device.start_periodic_polls())
+        try:
+            objs, _ = await self._fetch_objects(
+                device_obj=device.device_obj, on_parsed=_add_objects
+            )
+            _LOG.debug(
+                "Polling objects created",
+                extra={"device_id": device.id, "objects_count": len(objs)},
+            )
+            if not objs:
+                raise ValueError("Polling objects not loaded")
+        except Exception:
+            # Polling may still wait for connection. It must not start after removal.
+            await polls_job.close()
+            raise
+
+    async def _fetch_objects(
+        self, device_obj: DeviceObj, on_parsed: ParsedCallback | None = None
+    ) -> tuple[dict[ObjectKey, tuple[Object, str]], set[ObjType]]:
+        """Downloads and parses polling objects of device.
+
+        Args:
+            device_obj: Device object.
+            on_parsed: Called with each parsed batch of objects, while the rest are
+                downloading.
+
+        Returns:
+            Objects with content hashes of their data and types of objects, which were
+            downloaded and parsed successfully.
+        """
         if not isinstance(self.http_client, HTTPClient):
             raise NotImplementedError
 
-        objs_data = await self.http_client.get_objects(
-            dev_id=device_obj.object_id, obj_types=POLLING_TYPES
+        results = await asyncio.gather(
+            *[
+                self._download_objects_of_type(
+                    device_obj=device_obj, obj_type=obj_type, on_parsed=on_parsed
+                )
+                for obj_type in POLLING_TYPES
+            ],
+            return_exceptions=True,
         )
         _LOG.debug("Polling objects downloaded", extra={"device_id": device_obj.object_id})
 
-        # todo: refactor!
-        extract_tasks = [
-            self.async_add_job(self._extract_objects, obj_data, device_obj)
-            for obj_data in objs_data
-            if not isinstance(obj_data, (aiohttp.ClientError, Exception))
-        ]
-        objs_lists = await asyncio.gather(*extract_tasks)
-        objs = [obj for lst in objs_lists for obj in lst if obj]  # Flat list of lists.
-        _LOG.debug(
-            "Polling objects created",
-            extra={"device_id": device_obj.object_id, "objects_count": len(objs)},
-        )
-
-        if not objs:
-            raise ValueError("Polling objects not loaded")
-
-        groups = group_by_period(objs=objs)
-        return groups
+        objs: dict[ObjectKey, tuple[Object, str]] = {}
+        loaded_types: set[ObjType] = set()
+        for obj_type, result in zip(POLLING_TYPES, results):
+            if isinstance(result, BaseException):
+                _LOG.warning(
+                    "Objects not loaded",
+                    extra={
+                        "device_id": device_obj.object_id,
+                        "object_type": obj_type,
+                        "exc": result,
+                    },
+                )
+                continue
+            loaded_types.add(obj_type)
+            for obj, hash_ in result:
+                objs[(obj.object_id, obj.object_type.value)] = obj, hash_
+        return objs, loaded_types
 
     @staticmethod
     def _parse_device_obj(data: dict) -> DeviceObj | None:
@@ -416,44 +730,145 @@ class Gateway:
         _LOG.debug("Device object parsed", extra={"device_object": dev_obj})
         return dev_obj
 
-    def _extract_objects(
-        self, data: tuple, dev_obj: DeviceObj
-    ) -> list[BACnetObj | ModbusObj]:
+    async def _download_objects_of_type(
+        self, device_obj: DeviceObj, obj_type: ObjType, on_parsed: ParsedCallback | None
+    ) -> list[tuple[Object, str]]:
+        """Downloads objects of type. Received objects are parsed by batches while the
+        rest are downloading.
+        """
+        if not isinstance(self.http_client, HTTPClient):
+            raise NotImplementedError
+
+        parse_tasks: list[asyncio.Future] = []
+        batch: list[dict[str, Any]] = []
+        try:
+            async for objs_data in self.http_client.iter_objects(
+                dev_id=device_obj.object_id, obj_type=obj_type
+            ):
+                batch.extend(objs_data)
+                if len(batch) >= _PARSE_BATCH_SIZE:
+                    parse_tasks.append(
+                        asyncio.ensure_future(
+                            self._parse_batch(
+                                data=batch, dev_obj=device_obj, on_parsed=on_parsed
+                            )
+                        )
+                    )
+                    batch = []
+            if batch:
+                parse_tasks.append(
+                    asyncio.ensure_future(
+                        self._parse_batch(
+                            data=batch, dev_obj=device_obj, on_parsed=on_parsed
+                        )
+                    )
+                )
+        except Exception:
+            await asyncio.gather(*parse_tasks, return_exceptions=True)
+            raise
+        batches = await asyncio.gather(*parse_tasks)
+        return [obj for parsed_batch in batches for obj in parsed_batch]
+
+    async def _parse_batch(
+        self,
+        data: list[dict[str, Any]],
+        dev_obj: DeviceObj,
+        on_parsed: ParsedCallback | None,
+    ) -> list[tuple[Object, str]]:
+        objs = await self._parse_objects(data=data, dev_obj=dev_obj)
+        if on_parsed is not None and objs:
+            await on_parsed(objs)
+        return objs
+
+    async def _parse_objects(
+        self, data: list[dict[str, Any]], dev_obj: DeviceObj
+    ) -> list[tuple[BACnetObj | ModbusObj, str]]:
         """Parses and validate objects data from JSON.
 
-        Returns:
-            List of parsed and validated objects.
+        Parsing is CPU-bound. If parse processes are enabled, data is split into chunks
+        parsed in parallel by processes. Otherwise, data is parsed in thread.
 
-        # todo: use pydantic for parsing
+        Returns:
+            List of parsed and validated objects with content hashes of their data.
         """
-        objs = [
-            self.object_factory(dev_obj=dev_obj, obj_data=obj_data)
-            for obj_data in data
-            if not isinstance(obj_data, (aiohttp.ClientError, Exception))
-        ]
-        return objs
+        cls = self.object_class(dev_obj=dev_obj)
+        strict = self.settings.strict_validation
+        executor = self._get_parse_executor()
+        if executor is None:
+            return await self.async_add_job(
+                parse_payload, cls, data, strict, executor=CPU_EXECUTOR
+            )
+
+        chunk_size = max(-(-len(data) // self._parse_workers), _PARSE_BATCH_SIZE)
+        data_chunks = []
+        for start in range(0, len(data), chunk_size):
+            end = start + chunk_size
+            data_chunks.append(data[start:end])
+        chunks = await asyncio.gather(
+            *[
+                self.loop.run_in_executor(executor, parse_payload, cls, chunk, strict)
+                for chunk in data_chunks
+            ]
+        )
+        return [obj for chunk in chunks for obj in chunk]
+
+    def _get_parse_executor(self) -> ProcessPoolExecutor | None:
+        """Returns pool of parse processes. Creates and warms it up on first call."""
+        processes = self.settings.parse_processes
+        if not processes:
+            return None
+        if self._parse_executor is None:
+            workers = (os.cpu_count() or 1) if processes == -1 else processes
+            # `spawn` is used, because forking of process with running threads is unsafe.
+            self._parse_workers = workers
+            self._parse_executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_up,
+            )
+            _LOG.info("Parse processes started", extra={"processes_quantity": workers})
+        return self._parse_executor
 
     @log_exceptions(logger=_LOG, parameters_enabled=False)
-    async def send_objects(self, objs: Collection[BACnetObj]) -> None:
-        """Sends objects to server."""
+    async def send_objects(
+        self, objs: Collection[BACnetObj], aggregates: Collection[ObjAggregate] = ()
+    ) -> None:
+        """Puts objects into send queue. Objects are sent to servers grouped by device.
+
+        Args:
+            objs: Verified objects.
+            aggregates: Statistics of send window of objects. Published to MQTT broker,
+                because light protocol of servers has no fields for them.
+        """
         if not objs:
             return None
 
-        dev_id = list(objs)[0].device_id
-        str_ = "".join(
-            [
-                obj.to_http_str(obj=obj, disabled_flags=self.settings.disabled_status_flags)
-                for obj in objs
-            ]
-        )
-        if isinstance(self.http_client, HTTPClient):
-            try:
-                await self.http_client.post_device(
-                    servers=self.http_client.servers_post, dev_id=dev_id, data=str_
+        devices_fragments: dict[int, dict[tuple[int, int], bytes]] = {}
+        devices_records: dict[int, list[TelemetryRecord]] = {}
+        for obj in objs:
+            devices_fragments.setdefault(obj.device_id, {})[
+                (obj.object_id, obj.object_type.value)
+            ] = self.serializer.fragment(obj=obj)
+            devices_records.setdefault(obj.device_id, []).append(
+                TelemetryRecord.from_obj(obj=obj)
+            )
+        for dev_id, fragments in devices_fragments.items():
+            if self.worker is not None:  # Sent and streamed by supervisor.
+                await self.worker.send(
+                    dev_id=dev_id, fragments=fragments, records=devices_records[dev_id]
                 )
-            except aiohttp.ClientError:
-                pass
-        # if self._is_mqtt_enabled:  # todo
+                continue
+            if isinstance(self.http_client, HTTPClient):
+                self.http_client.send_queue.put(dev_id=dev_id, fragments=fragments)
+            if self.api is not None:
+                self.api.streams.put(device_id=dev_id, records=devices_records[dev_id])
+        if self._mqtt_settings.enable and isinstance(self.mqtt_client, MQTTClient):
+            self.mqtt_client.publisher.put(objs=objs, aggregates=aggregates)
+        elif aggregates:
+            _LOG.debug(
+                "Window statistics not published: MQTT is disabled",
+                extra={"aggregates_quantity": len(aggregates)},
+            )
 
     @staticmethod
     @log_exceptions(_LOG)
@@ -499,16 +914,19 @@ class Gateway:
             "default_send_period": dev_obj.property_list.send_period,
         }  # FIXME: hotfix
 
+        cls = Gateway.object_class(dev_obj=dev_obj)
+        return cls(**obj_data, **defaults_from_device)
+
+    @staticmethod
+    def object_class(dev_obj: DeviceObj) -> ObjectType:
+        """Returns class of objects for protocol of device."""
         protocol = dev_obj.property_list.protocol
-        cls: ObjectType
         if protocol in {
             Protocol.MODBUS_TCP,
             Protocol.MODBUS_RTU,
             Protocol.MODBUS_RTU_OVER_TCP,
         }:
-            cls = ModbusObj
-        elif protocol == Protocol.BACNET:
-            cls = BACnetObj
-        else:
-            raise NotImplementedError("Not implemented protocol factory.")
-        return cls(**obj_data, **defaults_from_device)
+            return ModbusObj
+        if protocol == Protocol.BACNET:
+            return BACnetObj
+        raise NotImplementedError("Not implemented protocol factory.")
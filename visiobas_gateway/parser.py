@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Collection, Generic, Hashable, Type, TypeVar
+
+from pydantic import BaseModel, ConstrainedInt, ConstrainedStr, ValidationError
+from pydantic.datetime_parse import parse_datetime
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+from .schemas import BACnetObj
+from .schemas.bacnet.obj_property import ObjProperty
+from .sync import content_hash
+
+Obj = TypeVar("Obj", bound=BACnetObj)
+
+# Max number of cached results of field validation.
+_CACHE_SIZE = 1024
+
+Converter = Callable[[Any], Any]
+Plan = list[tuple[str, str, Converter]]  # alias, field name, converter
+
+
+class ObjectParser(Generic[Obj]):
+    """Parses objects from data, downloaded from server.
+
+    Objects are created by `construct()` with validators of fields only, which skips
+    model overhead. Fields are validated by plan, compiled once per set of keys in
+    data:
+
+    - values of simple types are checked in place;
+    - other fields are validated once per unique value, result is cached;
+    - `property_list` is parsed once per unique JSON and shared between objects.
+
+    Objects, which fail fast validation, are validated by full schema to raise
+    `ValidationError`.
+    """
+
+    def __init__(self, cls: Type[Obj], strict: bool = False):
+        """
+        Args:
+            cls: Class of objects.
+            strict: Validate each object by full schema. Slower. Use for debugging.
+        """
+        self._cls = cls
+        self._strict = strict
+        self._fields: dict[str, ModelField] = {
+            field.alias: field for field in cls.__fields__.values()
+        }
+        self._plans: dict[frozenset[str], Plan] = {}
+        self._property_lists: dict[Hashable, BaseModel] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self._cls.__name__}]"
+
+    def parse(self, data: dict[str, Any]) -> Obj:
+        """Parses object.
+
+        Raises:
+            ValidationError: If data is invalid.
+        """
+        if self._strict:
+            return self._cls(**data)
+        try:
+            return self._parse_fast(data=data)
+        except (ValidationError, ValueError, TypeError, KeyError):
+            return self._cls(**data)
+
+    def parse_many(self, payload: Collection[dict[str, Any]]) -> list[Obj]:
+        """Parses objects. Raises on first invalid object."""
+        return [self.parse(data=data) for data in payload]
+
+    def _parse_fast(self, data: dict[str, Any]) -> Obj:
+        keys = frozenset(data)
+        plan = self._plans.get(keys)
+        if plan is None:
+            plan = self._plans[keys] = self._compile(keys=keys)
+        values = {name: convert(data[alias]) for alias, name, convert in plan}
+        return self._cls.construct(**values)
+
+    def _compile(self, keys: frozenset[str]) -> Plan:
+        """Makes plan of fields validation for data with provided keys."""
+        missed = {
+            field.alias
+            for field in self._fields.values()
+            if field.required and field.alias not in keys
+        }
+        if missed:
+            raise KeyError(f"Required fields missed: {missed}")
+
+        plan: Plan = []
+        for alias in sorted(keys):
+            field = self._fields.get(alias)
+            if field is None:
+                continue  # Extra fields are ignored.
+            if alias == str(ObjProperty.PROPERTY_LIST.value):
+                converter = self._make_cached(field=field, cache=self._property_lists)
+            else:
+                converter = self._make_converter(field=field)
+            plan.append((alias, field.name, converter))
+        return plan
+
+    def _make_converter(self, field: ModelField) -> Converter:
+        # pylint: disable=too-many-return-statements
+        validate = self._make_validator(field=field)
+        type_ = field.outer_type_
+        if type_ is Any:
+            return lambda value: value
+        if field.pre_validators or field.post_validators or field.shape != SHAPE_SINGLETON:
+            return self._make_cached(field=field, cache={})
+        if isinstance(type_, type) and issubclass(type_, ConstrainedInt):
+            return _make_int_converter(type_=type_, validate=validate)
+        if isinstance(type_, type) and issubclass(type_, ConstrainedStr):
+            return _make_str_converter(type_=type_, validate=validate)
+        if type_ in {int, bool, str}:
+            return lambda value: value if type(value) is type_ else validate(value)
+        if type_ is datetime:
+            return lambda value: (
+                parse_datetime(value) if isinstance(value, str) else validate(value)
+            )
+        return self._make_cached(field=field, cache={})
+
+    def _make_validator(self, field: ModelField) -> Converter:
+        cls = self._cls
+
+        def _validate(value: Any) -> Any:
+            value, errors = field.validate(value, {}, loc=field.alias, cls=cls)
+            if errors:
+                raise ValidationError(
+                    [errors] if isinstance(errors, ErrorWrapper) else errors, cls
+                )
+            return value
+
+        return _validate
+
+    def _make_cached(self, field: ModelField, cache: dict[Hashable, Any]) -> Converter:
+        """Validates each unique value once. Mutable results are copied, except
+        `property_list`, which is never modified.
+        """
+        validate = self._make_validator(field=field)
+        copy: Callable[[Any], Any] | None = None
+        if field.shape == SHAPE_LIST:
+            copy = list
+        elif field.alias != str(ObjProperty.PROPERTY_LIST.value) and isinstance(
+            field.outer_type_, type
+        ):
+            if issubclass(field.outer_type_, BaseModel):
+                copy = _copy_model
+
+        def _cached(value: Any) -> Any:
+            key = _freeze(value)
+            try:
+                result = cache[key]
+            except KeyError:
+                result = validate(value)
+                if len(cache) < _CACHE_SIZE:
+                    cache[key] = result
+            except TypeError:  # Unhashable.
+                return validate(value)
+            return copy(result) if copy is not None else result
+
+        return _cached
+
+
+def _freeze(value: Any) -> Hashable:
+    """Makes key of value for cache. Type is included, because `1 == 1.0 == True`."""
+    if type(value) is list:  # pylint: disable=unidiomatic-typecheck
+        return list, tuple(value), tuple(map(type, value))
+    return type(value), value
+
+
+def _copy_model(model: BaseModel) -> BaseModel:
+    return model.__class__.construct(_fields_set=model.__fields_set__, **model.__dict__)
+
+
+def _make_int_converter(type_: Type[ConstrainedInt], validate: Converter) -> Converter:
+    def _convert(value: Any) -> Any:
+        if (
+            type(value) is int  # pylint: disable=unidiomatic-typecheck
+            and (type_.gt is None or value > type_.gt)
+            and (type_.ge is None or value >= type_.ge)
+            and (type_.lt is None or value < type_.lt)
+            and (type_.le is None or value <= type_.le)
+            and type_.multiple_of is None
+        ):
+            return value
+        return validate(value)
+
+    return _convert
+
+
+def _make_str_converter(type_: Type[ConstrainedStr], validate: Converter) -> Converter:
+    if type_.strip_whitespace or type_.to_upper or type_.to_lower or type_.regex:
+        return validate
+
+    def _convert(value: Any) -> Any:
+        if (
+            type(value) is str  # pylint: disable=unidiomatic-typecheck
+            and (type_.min_length is None or len(value) >= type_.min_length)
+            and (type_.max_length is None or len(value) <= type_.max_length)
+        ):
+            return value
+        return validate(value)
+
+    return _convert
+
+
+_PARSERS: dict[tuple[type, bool], ObjectParser[Any]] = {}
+
+
+def get_parser(cls: Type[Obj], strict: bool = False) -> ObjectParser[Obj]:
+    """Returns shared parser for class of objects."""
+    key = (cls, strict)
+    if key not in _PARSERS:
+        _PARSERS[key] = ObjectParser(cls=cls, strict=strict)
+    return _PARSERS[key]
+
+
+def parse_objects(
+    cls: Type[Obj], payload: Collection[dict[str, Any]], strict: bool = False
+) -> list[Obj]:
+    """Parses objects by shared parser.
+
+    Args:
+        cls: Class of objects.
+        payload: Data of objects.
+        strict: Validate each object by full schema.
+
+    Returns:
+        Parsed objects.
+    """
+    return get_parser(cls=cls, strict=strict).parse_many(payload=payload)
+
+
+def parse_payload(
+    cls: Type[Obj], payload: Collection[dict[str, Any]], strict: bool = False
+) -> list[tuple[Obj, str]]:
+    """Parses objects and calculates content hashes of their data.
+
+    Top-level function, so it can be called in worker process. Shared `property_list`
+    models are pickled once per result.
+
+    Args:
+        cls: Class of objects.
+        payload: Data of objects.
+        strict: Validate each object by full schema.
+
+    Returns:
+        Parsed objects with content hashes of their data.
+    """
+    parser = get_parser(cls=cls, strict=strict)
+    return [(parser.parse(data=data), content_hash(data)) for data in payload]
+
+
+def warm_up() -> None:
+    """Prepares worker process: imports schemas and compiles parsers."""
+    get_parser(cls=BACnetObj)
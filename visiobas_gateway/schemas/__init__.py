@@ -16,6 +16,7 @@ from .bacnet.obj_type import (
 from .bacnet.priority import Priority
 from .bacnet.reliability import Reliability
 from .bacnet.status_flags import StatusFlag, StatusFlags
+from .compression import Compression
 from .modbus.baudrate import BaudRate
 from .modbus.bytesize import Bytesize
 from .modbus.data_type import ModbusDataType
@@ -42,6 +43,7 @@ from .serial_port import SerialPort
 
 __all__ = [
     "Protocol",
+    "Compression",
     # BACnet
     "DeviceObj",
     "TcpDevicePropertyList",
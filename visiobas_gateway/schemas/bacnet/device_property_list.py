@@ -38,11 +38,24 @@ class BaseDevicePropertyList(BaseBACnetObjPropertyList, ABC):
         this property is greater than zero, a non-zero value shall be placed in the Device
         object APDU_Timeout property.""",
     )
-    # fixme: add usage
     send_period: float = Field(
-        default=300, ge=0, alias="sendPeriod", description="Period to internal object poll."
+        default=0,
+        ge=0,
+        alias="sendPeriod",
+        description="""Period to send polled data to servers. Objects polled during the
+        period are aggregated and sent in one payload. `0` - send after each poll.
+        Statistics of window (count, min, max, mean) are published only to MQTT broker
+        (`<topic>/stats`), so they are not sent, if MQTT is disabled.""",
     )
     reconnect_period: int = Field(default=300, ge=0, alias="reconnectPeriod")
+    write_check_timeout: float = Field(
+        default=1,
+        ge=0,
+        alias="writeCheckTimeout",
+        description="""Maximum time (in seconds) to wait for written value to be read
+        back from device. Written objects are read at growing intervals until values
+        match or time is out.""",
+    )
 
     @property
     def timeout_seconds(self) -> float:
@@ -0,0 +1,9 @@
+from enum import Enum, unique
+
+
+@unique
+class Compression(str, Enum):
+    """Supported HTTP content encodings of sent data."""
+
+    GZIP = "gzip"
+    DEFLATE = "deflate"
@@ -1,7 +1,9 @@
+from .codec import Codec
 from .qos import Qos
 from .result_code import ResultCode
 
 __all__ = [
+    "Codec",
     "ResultCode",
     "Qos",
 ]
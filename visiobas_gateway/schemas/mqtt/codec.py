@@ -0,0 +1,14 @@
+from enum import Enum, unique
+
+
+@unique
+class Codec(str, Enum):
+    """Encodings of telemetry batched by device.
+
+    Value is appended to topic of binary encoded messages, to identify the codec.
+    """
+
+    TEXT = "text"
+    MSGPACK = "msgpack"
+    CBOR = "cbor"
+    STRUCT = "struct"
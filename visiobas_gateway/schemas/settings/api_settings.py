@@ -12,6 +12,13 @@ class ApiSettings(BaseSettings):
         default=Priority.CONTROL_LOOP_FLICK_WARN,
         description="BACnet priority of write through API.",
     )
+    STREAM_MAX_PENDING: int = Field(
+        default=10000,
+        gt=0,
+        description="""Maximum number of object values waiting for send to WebSocket
+        client. Only the latest value of object is kept. The oldest values are dropped,
+        when client is too slow.""",
+    )
 
     class Config:  # pylint: disable=missing-class-docstring
         allow_mutation = False
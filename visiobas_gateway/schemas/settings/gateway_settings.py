@@ -1,5 +1,9 @@
+from pathlib import Path
+
 from pydantic import BaseSettings, Field, PositiveInt, validator
 
+from visiobas_gateway import BASE_DIR
+
 from ..bacnet.priority import Priority
 from ..bacnet.status_flags import StatusFlags
 
@@ -7,7 +11,12 @@ from ..bacnet.status_flags import StatusFlags
 class GatewaySettings(BaseSettings):
     """Main settings of gateway."""
 
-    update_period: int = Field(default=3600, ge=1800)
+    update_period: int = Field(
+        default=3600,
+        ge=1800,
+        description="Period (in seconds) to sync configuration of devices with server. "
+        "Only changed devices and objects are reloaded.",
+    )
     unreachable_reset_period: int = Field(default=1800, ge=900)
     unreachable_threshold: int = Field(
         default=3,
@@ -15,6 +24,17 @@ class GatewaySettings(BaseSettings):
         description="Number of unsuccessful attempts to read object to "
         "mark it as unreachable.",
     )
+    reachability_ttl: float = Field(
+        default=30,
+        ge=0,
+        description="Period (in seconds) to keep result of host reachability check. "
+        "Devices behind the same host are checked once per period.",
+    )
+    reachability_timeout: float = Field(
+        default=1,
+        gt=0,
+        description="Timeout (in seconds) of host reachability check.",
+    )
     override_threshold: Priority = Field(
         default=Priority.MANUAL_OPERATOR,
         description=(
@@ -36,6 +56,47 @@ class GatewaySettings(BaseSettings):
         description=("Status flags to disable when send data to the servers."),
     )
 
+    strict_validation: bool = Field(
+        default=False,
+        description="Validate each downloaded object by full schema. Slower. "
+        "Use for debugging.",
+    )
+
+    parse_processes: int = Field(
+        default=0,
+        ge=-1,
+        description="Number of processes to parse downloaded objects. "
+        "`-1` - number of CPU cores, `0` - parse in threads of the gateway process.",
+    )
+
+    executor_workers: dict[str, PositiveInt] = Field(
+        default={},
+        description="Number of threads by executor: `cpu` - parsing and compression, "
+        "`files` - outbox and snapshots, `interface` - I/O of each TCP interface. "
+        "Serial interfaces use one thread.",
+    )
+
+    workers: int = Field(
+        default=0,
+        ge=-1,
+        description="Number of worker processes to poll devices. Devices are partitioned "
+        "by interfaces. `-1` - number of CPU cores, `0` - poll in the gateway process.",
+    )
+    ipc_socket: Path = Field(
+        default=BASE_DIR.parent / ".gtw_ipc.sock",
+        description="Unix socket to communicate with worker processes.",
+    )
+
+    snapshot_enabled: bool = Field(
+        default=True,
+        description="Store configuration of devices locally. On start devices are polled "
+        "by stored configuration until configuration is downloaded from server.",
+    )
+    snapshot_dir: Path = Field(
+        default=BASE_DIR.parent / ".gtw_snapshots",
+        description="Directory to store configuration of devices.",
+    )
+
     class Config:  # pylint: disable=missing-class-docstring
         allow_mutation = False
         env_prefix = "GTW_"
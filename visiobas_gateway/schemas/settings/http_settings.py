@@ -1,5 +1,11 @@
+from pathlib import Path
+from typing import Optional
+
 from pydantic import BaseSettings, Field
 
+from visiobas_gateway import BASE_DIR
+
+from ..compression import Compression
 from .http_server import HTTPServerConfig
 
 
@@ -12,6 +18,41 @@ class HTTPSettings(BaseSettings):
     server_get: HTTPServerConfig = Field(...)
     servers_post: list[HTTPServerConfig] = Field(..., min_items=1)
 
+    send_linger: float = Field(
+        default=1,
+        ge=0,
+        description="Seconds to wait for other data of device to send them in one request.",
+    )
+    send_batch_size: int = Field(
+        default=262_144,
+        gt=0,
+        description="Size of pending data of device (in bytes) to send without waiting.",
+    )
+
+    compression: Optional[Compression] = Field(
+        default=None, description="Compression of sent data. Disabled if not set."
+    )
+    compression_threshold: int = Field(
+        default=1024, ge=0, description="Min size of data (in bytes) to compress."
+    )
+    compression_level: int = Field(
+        default=6, ge=1, le=9, description="Compression level: 1 - fastest, 9 - smallest."
+    )
+
+    outbox_dir: Path = Field(
+        default=BASE_DIR.parent / ".gtw_outbox",
+        description="Directory to store data, which was not sent to the servers.",
+    )
+    outbox_max_size: int = Field(
+        default=104_857_600,
+        ge=0,
+        description="Max size of outbox (in bytes) per server. Oldest data is dropped "
+        "when exceeded. `0` disables outbox.",
+    )
+    outbox_segment_size: int = Field(
+        default=1_048_576, gt=0, description="Size of outbox segment file (in bytes)."
+    )
+
     class Config:  # pylint: disable=missing-class-docstring
         allow_mutation = False
         arbitrary_types_allowed = True
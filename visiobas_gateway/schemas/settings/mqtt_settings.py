@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import importlib.util
 import uuid
+from typing import Optional
 
-import paho.mqtt.client as mqtt  # type: ignore
 from pydantic import AnyUrl, BaseSettings, Field, validator
 
-from ..mqtt import Qos
+from ..mqtt import Codec, Qos
 
 
 class MQTTSettings(BaseSettings):
@@ -21,10 +22,43 @@ class MQTTSettings(BaseSettings):
     topics_sub: list[str] = Field(default=[])
     client_id: str = Field(default=None)
 
+    publish_window: int = Field(
+        default=32,
+        gt=0,
+        description="Maximum number of published messages waiting for delivery.",
+    )
+    publish_max_pending: int = Field(
+        default=10_000,
+        gt=0,
+        description="Maximum number of messages in queue. The oldest messages are dropped.",
+    )
+    device_topic: Optional[str] = Field(
+        default=None,
+        description="""Template of topic to publish data of objects batched by device.
+        Formatted with `device_id`. Each object is published to its own topic, if not
+        set.""",
+    )
+    codec: Codec = Field(
+        default=Codec.TEXT,
+        description="""Encoding of data batched by device. Binary codec name is appended
+        to `device_topic` as the last level. `msgpack` requires `msgpack` package.""",
+    )
+
+    @validator("codec")
+    def check_codec_installed(cls, value: Codec) -> Codec:
+        """Package of msgpack codec is optional, so it is checked at startup."""
+        # pylint: disable=no-self-argument
+        if value is Codec.MSGPACK and importlib.util.find_spec("msgpack") is None:
+            raise ValueError(
+                "Codec `msgpack` requires `msgpack` package. Install it or choose "
+                "another codec"
+            )
+        return value
+
     @validator("client_id", pre=True)
     def create_client_id(cls, value: str | None) -> str:
         # pylint: disable=no-self-argument
-        return value or mqtt.base62(uuid.uuid4().int, padding=22)
+        return value or uuid.uuid4().hex[:23]  # Length allowed by MQTT 3.1.1 brokers.
 
     # todo: add security
 
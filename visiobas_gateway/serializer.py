@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Any, Collection
+
+from .schemas import OUTPUT_TYPES, BACnetObj, Reliability, StatusFlags
+
+ObjectKey = tuple[int, int, int]  # device_id, obj_id, obj_type_id
+
+
+class LightSerializer:
+    """Serializer of objects into light protocol of `/vbas/gate/light`.
+
+    Produces the same result as `BACnetObj.to_http_str()`, but caches encoded fragment
+    of each object until the state of object changes. So unchanged objects are not
+    encoded again.
+    """
+
+    def __init__(self, disabled_flags: StatusFlags):
+        """
+        Args:
+            disabled_flags: Status flags to disable when send data to the servers.
+        """
+        self._enabled_flags_mask = ~disabled_flags.flags
+        self._cache: dict[ObjectKey, tuple[tuple[Any, ...], bytes]] = {}
+        self._buffer = bytearray()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    def __len__(self) -> int:
+        """Number of cached fragments."""
+        return len(self._cache)
+
+    def serialize(self, objs: Collection[BACnetObj]) -> bytes:
+        """Serializes objects into one payload.
+
+        Args:
+            objs: Objects to serialize.
+
+        Returns:
+            Payload.
+        """
+        buffer = self._buffer
+        buffer.clear()
+        for obj in objs:
+            buffer += self.fragment(obj=obj)
+        return bytes(buffer)
+
+    def fragment(self, obj: BACnetObj) -> bytes:
+        """Serializes object. Returns cached fragment if object state is not changed.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            Serialized object. Example: `75 1 22.5 ,,,,,,,,40.5,,,,,,, 0 0;`
+        """
+        key = (obj.device_id, obj.object_id, obj.object_type.value)
+        state = self._state(obj=obj)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == state:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        fragment = self._encode(obj=obj, flags=state[2]).encode()
+        self._cache[key] = (state, fragment)
+        return fragment
+
+    def forget(self, keys: Collection[ObjectKey]) -> None:
+        """Removes cached fragments of objects. Use it when objects are removed.
+
+        Args:
+            keys: Keys (device_id, obj_id, obj_type_id) of objects.
+        """
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def _state(self, obj: BACnetObj) -> tuple[Any, ...]:
+        """Values of object, which are included into fragment.
+
+        Type of `present_value` is included, because `1 == 1.0 == True`, but they are
+        serialized differently.
+        """
+        present_value = obj.present_value
+        priority_array = (
+            tuple(obj.priority_array)
+            if obj.object_type in OUTPUT_TYPES and obj.priority_array
+            else None
+        )
+        return (
+            type(present_value),
+            present_value,
+            obj.status_flags.flags & self._enabled_flags_mask,
+            obj.reliability,
+            priority_array,
+        )
+
+    @staticmethod
+    def _encode(obj: BACnetObj, flags: int) -> str:
+        reliability = obj.reliability
+        if isinstance(reliability, Reliability):
+            reliability = str(reliability.value)
+        if not isinstance(reliability, str):
+            raise ValueError(f"Unexpected reliability type: {type(reliability)}")
+
+        parts = [str(obj.object_id), str(obj.object_type.value), str(obj.present_value)]
+        if obj.object_type in OUTPUT_TYPES and obj.priority_array:
+            parts.append(obj.priority_array_to_http_str(priority_array=obj.priority_array))
+        parts.append(str(flags))
+        if reliability and not reliability.isspace():
+            parts.append(reliability)
+        return " ".join(parts) + ";"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Union
+
+from .schemas import BACnetObj, DeviceObj
+from .schemas.modbus.obj import ModbusObj
+from .sync import content_hash
+from .utils import get_file_logger
+
+_LOG = get_file_logger(name=__name__)
+
+Object = Union[BACnetObj, ModbusObj]
+ObjectKey = tuple[int, int]  # obj_id, obj_type_id
+
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b"VGTWSNAP"
+# Header: magic, version, sha256 of payload.
+_HEADER = struct.Struct("!8sH32s")
+_SUFFIX = ".snapshot"
+
+# Pickled models are not compatible with other set of fields.
+_SCHEMA_HASH = content_hash(
+    [sorted(cls.__fields__) for cls in (DeviceObj, BACnetObj, ModbusObj)]
+)
+
+
+class SnapshotError(ValueError):
+    """Snapshot is corrupted or incompatible."""
+
+
+@dataclass
+class DeviceSnapshot:
+    """Validated configuration of device with content hashes of source data."""
+
+    device_obj: DeviceObj
+    device_hash: str
+    objects: dict[ObjectKey, tuple[Object, str]] = field(default_factory=dict)
+
+    def dumps(self) -> bytes:
+        """Serializes snapshot with header."""
+        payload = pickle.dumps((_SCHEMA_HASH, self), protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.sha256(payload).digest()
+        return _HEADER.pack(_MAGIC, SNAPSHOT_VERSION, digest) + payload
+
+    @classmethod
+    def loads(cls, data: bytes) -> DeviceSnapshot:
+        """Deserializes snapshot.
+
+        Raises:
+            SnapshotError: If snapshot is corrupted or incompatible.
+        """
+        header_size = _HEADER.size
+        if len(data) < header_size:
+            raise SnapshotError("Snapshot is truncated")
+        magic, version, digest = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise SnapshotError("Not a snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version: {version}")
+        payload = memoryview(data)[header_size:]
+        if hashlib.sha256(payload).digest() != digest:
+            raise SnapshotError("Snapshot is corrupted")
+
+        schema_hash, snapshot = pickle.loads(payload)
+        if schema_hash != _SCHEMA_HASH:
+            raise SnapshotError("Snapshot was created with other schemas")
+        if not isinstance(snapshot, cls):
+            raise SnapshotError(f"Unexpected snapshot type: {type(snapshot)}")
+        return snapshot
+
+
+class SnapshotStore:
+    """Stores snapshots of devices in directory. One file per device.
+
+    Note: All methods perform blocking file operations. Call them in executor.
+    """
+
+    def __init__(self, directory: Path):
+        self._dir = directory
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self._dir}]"
+
+    def _path(self, dev_id: int) -> Path:
+        return self._dir / f"{dev_id}{_SUFFIX}"
+
+    def save(self, dev_id: int, data: bytes) -> None:
+        """Writes serialized snapshot of device. Previous snapshot is replaced
+        atomically.
+        """
+        self._dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(dev_id=dev_id)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def load(self, dev_id: int) -> DeviceSnapshot | None:
+        """Reads snapshot of device.
+
+        Returns:
+            Snapshot. None if there is no snapshot or it is invalid.
+        """
+        path = self._path(dev_id=dev_id)
+        try:
+            return DeviceSnapshot.loads(data=path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOG.warning("Invalid snapshot. Ignored", extra={"path": path, "exc": exc})
+            return None
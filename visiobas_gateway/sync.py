@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Generic, Hashable, Mapping, TypeVar
+
+Key = TypeVar("Key", bound=Hashable)
+
+
+def content_hash(data: Any) -> str:
+    """Hash of JSON data. Does not depend on the order of keys.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        Hex digest.
+    """
+    dumped = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(dumped.encode()).hexdigest()
+
+
+@dataclass
+class Diff(Generic[Key]):
+    """Difference between loaded and downloaded configuration."""
+
+    added: set[Key] = field(default_factory=set)
+    removed: set[Key] = field(default_factory=set)
+    changed: set[Key] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff_hashes(old: Mapping[Key, str], new: Mapping[Key, str]) -> Diff[Key]:
+    """Compares content hashes by keys.
+
+    Args:
+        old: Hashes of loaded items.
+        new: Hashes of downloaded items.
+
+    Returns:
+        Keys of added, removed and changed items.
+    """
+    return Diff(
+        added=new.keys() - old.keys(),
+        removed=old.keys() - new.keys(),
+        changed={key for key in old.keys() & new.keys() if old[key] != new[key]},
+    )
@@ -1,6 +1,11 @@
 from .identifier import camel_case, kebab_case, pascal_case, snake_case
 from .log import ExtraFormatter, get_file_logger, log_exceptions
-from .network import get_subnet_interface, ping, serial_port_connected
+from .network import (
+    ReachabilityChecker,
+    get_subnet_interface,
+    ping,
+    serial_port_connected,
+)
 from .number import round_with_resolution
 
 __all__ = [
@@ -14,5 +19,6 @@ __all__ = [
     "round_with_resolution",
     "get_subnet_interface",
     "ping",
+    "ReachabilityChecker",
     "serial_port_connected",
 ]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import gzip
+import time
+import zlib
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable
+
+from ..schemas.compression import Compression
+
+# Compressors accept data and level.
+_COMPRESSORS: dict[Compression, Callable[[bytes, int], bytes]] = {
+    Compression.GZIP: partial(gzip.compress, mtime=0),
+    Compression.DEFLATE: zlib.compress,
+}
+_DECOMPRESSORS: dict[Compression, Callable[[bytes], bytes]] = {
+    Compression.GZIP: gzip.decompress,
+    Compression.DEFLATE: zlib.decompress,
+}
+
+
+@dataclass
+class CompressionStats:
+    """Accumulated statistics of compression."""
+
+    payloads: int = 0
+    raw_bytes: int = 0
+    compressed_bytes: int = 0
+    cpu_time: float = 0.0  # Seconds.
+
+    @property
+    def ratio(self) -> float:
+        """Compression ratio (raw size / compressed size)."""
+        if not self.compressed_bytes:
+            return 1.0
+        return self.raw_bytes / self.compressed_bytes
+
+    def add(self, raw_size: int, compressed_size: int, cpu_time: float) -> None:
+        self.payloads += 1
+        self.raw_bytes += raw_size
+        self.compressed_bytes += compressed_size
+        self.cpu_time += cpu_time
+
+
+def compress(data: bytes, method: Compression, level: int) -> tuple[bytes, float]:
+    """Compresses data.
+
+    Args:
+        data: Data to compress.
+        method: Compression method. Result is suitable for `Content-Encoding` header
+            with the same value.
+        level: Compression level from 1 (fastest) to 9 (smallest).
+
+    Returns:
+        Compressed data and CPU time (in seconds) spent by the calling thread.
+
+    Raises:
+        ValueError: if `method` is not a valid compression method.
+    """
+    compressor = _COMPRESSORS[Compression(method)]
+    _t0 = time.thread_time()
+    compressed = compressor(data, level)
+    return compressed, time.thread_time() - _t0
+
+
+def decompress(data: bytes, method: Compression) -> bytes:
+    """Decompresses data, compressed by `compress()`.
+
+    Raises:
+        ValueError: if `method` is not a valid compression method.
+    """
+    return _DECOMPRESSORS[Compression(method)](data)
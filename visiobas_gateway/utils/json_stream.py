@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONArrayStream:
+    """Incremental decoder of JSON object with array field, received by chunks.
+
+    Items of array field are decoded as soon as they are received completely. Other
+    fields of top-level object are available by `fields` when decoded.
+
+    Example:
+        >>> stream = JSONArrayStream(field="data")
+        >>> stream.feed(b'{"success": true, "data": [{"75": 1}, {"75"')
+        [{'75': 1}]
+        >>> stream.feed(b': 2}]}')
+        [{'75': 2}]
+        >>> stream.close()
+        []
+        >>> stream.fields
+        {'success': True}
+    """
+
+    def __init__(self, field: str):
+        """
+        Args:
+            field: Name of array field, which items are decoded incrementally.
+        """
+        self._field = field
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+        self._buf = ""
+        self._pos = 0
+        # States: `start`, `key`, `value`, `next_field`, `item`, `next_item`, `end`.
+        self._state = "start"
+        self._key = ""
+        self._eof = False
+
+        self.fields: dict[str, Any] = {}
+        self.items_quantity = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self._field}]"
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Decodes chunk of data.
+
+        Returns:
+            Items of array, completed by this chunk.
+
+        Raises:
+            json.JSONDecodeError: If data is not valid JSON object.
+        """
+        pos = self._pos
+        self._buf = self._buf[pos:] + self._text_decoder.decode(chunk)
+        self._pos = 0
+        return self._decode()
+
+    def close(self) -> list[Any]:
+        """Decodes rest of data. Call it when all chunks are received.
+
+        Raises:
+            json.JSONDecodeError: If data is incomplete or invalid.
+        """
+        pos = self._pos
+        self._buf = self._buf[pos:] + self._text_decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        items = self._decode()
+        self._skip_whitespace()
+        if self._state != "end" or self._pos < len(self._buf):
+            raise json.JSONDecodeError("Incomplete or extra data", self._buf, self._pos)
+        return items
+
+    def _decode(self) -> list[Any]:
+        # pylint: disable=too-many-branches
+        items: list[Any] = []
+        while True:
+            self._skip_whitespace()
+            if self._pos >= len(self._buf):
+                return items
+            char = self._buf[self._pos]
+
+            if self._state == "start":
+                self._expect(char, "{")
+                self._state = "key"
+            elif self._state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                    continue
+                key_pos = self._pos
+                key = self._raw_decode()
+                if key is _INCOMPLETE:
+                    return items
+                self._skip_whitespace()
+                if self._pos >= len(self._buf):
+                    self._pos = key_pos  # Wait for `:`. Key is decoded again.
+                    return items
+                self._expect(self._buf[self._pos], ":")
+                self._key = key
+                self._state = "value"
+            elif self._state == "value":
+                if self._key == self._field and char == "[":
+                    self._pos += 1
+                    self._state = "item"
+                    continue
+                value = self._raw_decode()
+                if value is _INCOMPLETE:
+                    return items
+                self.fields[self._key] = value
+                self._state = "next_field"
+            elif self._state == "next_field":
+                self._expect(char, ",}")
+                self._state = "key" if char == "," else "end"
+            elif self._state == "item":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "next_field"
+                    continue
+                item = self._raw_decode()
+                if item is _INCOMPLETE:
+                    return items
+                items.append(item)
+                self.items_quantity += 1
+                self._state = "next_item"
+            elif self._state == "next_item":
+                self._expect(char, ",]")
+                self._state = "item" if char == "," else "next_field"
+            else:  # end
+                raise json.JSONDecodeError("Extra data", self._buf, self._pos)
+
+    def _raw_decode(self) -> Any:
+        """Decodes value at current position.
+
+        Returns:
+            Value or `_INCOMPLETE`, if more data required.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            return _INCOMPLETE
+        if end >= len(self._buf) and not self._eof:
+            # Number may continue in the next chunk.
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char not in expected:
+            raise json.JSONDecodeError(
+                f"Expected one of `{expected}`", self._buf, self._pos
+            )
+        self._pos += 1
+
+    def _skip_whitespace(self) -> None:
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+
+_INCOMPLETE = object()
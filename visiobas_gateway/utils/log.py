@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
 import typing
 from functools import wraps
 from logging.handlers import RotatingFileHandler
@@ -58,6 +59,9 @@ class ExtraFormatter(logging.Formatter):
 def get_file_logger(name: str) -> logging.Logger:
     """Gets Logger with RotatingFileHandler.
 
+    Loggers of child processes (parse processes, cluster workers) write to own files,
+    suffixed by name of process.
+
     Args:
         name: name of logger (module). Should provide `__name__`.
 
@@ -73,7 +77,12 @@ def get_file_logger(name: str) -> logging.Logger:
     except FileExistsError:
         pass
 
-    filename = log_settings.log_dir / f"{name.removeprefix('visiobas_gateway.')}.log"
+    stem = name.removeprefix("visiobas_gateway.")
+    is_child = multiprocessing.parent_process() is not None
+    if is_child:
+        # Child processes must not rotate files of the parent.
+        stem = f"{stem}.{multiprocessing.current_process().name}"
+    filename = log_settings.log_dir / f"{stem}.log"
     size = log_settings.file_size + _MEGABYTE
 
     file_handler = RotatingFileHandler(
@@ -82,6 +91,7 @@ def get_file_logger(name: str) -> logging.Logger:
         maxBytes=size,
         backupCount=1,
         encoding="utf-8",
+        delay=is_child,  # Most loggers of child processes are never used.
     )
     formatter = ExtraFormatter(fmt=log_settings.format)
     file_handler.setFormatter(fmt=formatter)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import platform
+import socket
+import struct
+import time
 from ipaddress import IPv4Address, IPv4Interface
 
 import serial.tools.list_ports  # type: ignore
@@ -76,13 +80,223 @@ async def ping(host: str, attempts: int) -> bool:
     """
     current_os = platform.system().lower()
     parameter = "n" if current_os == "windows" else "c"
-    ping_process = await asyncio.create_subprocess_shell(
-        f"ping -{parameter} {attempts} {host}"
-    )
-    await ping_process.wait()
+    try:
+        ping_process = await asyncio.create_subprocess_exec(
+            "ping",
+            f"-{parameter}",
+            str(attempts),
+            host,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return False  # `ping` is not installed.
+    try:
+        await ping_process.wait()
+    except asyncio.CancelledError:
+        # Cancellation (e.g. by timeout) does not stop the process.
+        ping_process.kill()
+        await ping_process.wait()
+        raise
     return ping_process.returncode == 0
 
 
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_HEADER = struct.Struct("!BBHHH")  # type, code, checksum, identifier, sequence
+
+
+def _checksum(data: bytes) -> int:
+    """Internet checksum (RFC 1071)."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _open_icmp_socket() -> socket.socket:
+    """Opens unprivileged ICMP socket (Linux, macOS). Raw socket is used otherwise.
+
+    Raises:
+        PermissionError: If ICMP sockets are not permitted.
+    """
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+    sock.setblocking(False)
+    return sock
+
+
+async def icmp_ping(host: str, timeout: float) -> bool:
+    """Sends one ICMP echo request without subprocess.
+
+    Args:
+        host: IPv4 address of host.
+        timeout: Seconds to wait for reply.
+
+    Returns:
+        Echo reply is received.
+
+    Raises:
+        PermissionError: If ICMP sockets are not permitted.
+        NotImplementedError: If event loop does not support readers (Windows).
+    """
+    loop = asyncio.get_running_loop()
+    identifier = os.getpid() & 0xFFFF
+    sequence = int.from_bytes(os.urandom(2), "big")
+    payload = struct.pack("!d", time.time())
+    header = _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+    checksum = _checksum(header + payload)
+    packet = _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, checksum, identifier, sequence)
+
+    with _open_icmp_socket() as sock:
+        is_raw = sock.type == socket.SOCK_RAW
+        replied = loop.create_future()
+
+        def _on_readable() -> None:
+            try:
+                data, (address, _) = sock.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return None
+            if is_raw:
+                ip_header_size = (data[0] & 0x0F) * 4
+                data = data[ip_header_size:]
+            if address != host or len(data) < _ICMP_HEADER.size:
+                return None
+            type_, _, _, reply_id, reply_seq = _ICMP_HEADER.unpack_from(data)
+            # Kernel replaces identifier of unprivileged socket.
+            if (
+                type_ == _ICMP_ECHO_REPLY
+                and reply_seq == sequence
+                and (not is_raw or reply_id == identifier)
+                and not replied.done()
+            ):
+                replied.set_result(True)
+            return None
+
+        loop.add_reader(sock.fileno(), _on_readable)
+        try:
+            sock.sendto(packet + payload, (host, 0))
+            return await asyncio.wait_for(replied, timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        except OSError as exc:  # Network is unreachable etc.
+            if isinstance(exc, PermissionError):
+                raise
+            return False
+        finally:
+            loop.remove_reader(sock.fileno())
+
+
+async def tcp_probe(host: str, port: int, timeout: float) -> bool:
+    """Checks host by TCP connection. Refused connection means that host is up.
+
+    Args:
+        host: Host to probe.
+        port: TCP port.
+        timeout: Seconds to wait for connection.
+
+    Returns:
+        Host is reachable.
+    """
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host=host, port=port), timeout=timeout
+        )
+    except ConnectionRefusedError:
+        return True
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+class ReachabilityChecker:
+    """Checks reachability of hosts. Shared by all devices.
+
+    - Results are cached per host and port for `ttl` seconds, so devices behind the
+      same host are probed once.
+    - Concurrent checks of the same host wait for one probe.
+    - Hosts with TCP port are probed by TCP connection. Other hosts are probed by
+      ICMP echo, or by `ping` subprocess, if ICMP sockets are not permitted.
+    """
+
+    def __init__(self, ttl: float, timeout: float):
+        """
+        Args:
+            ttl: Seconds to keep result of probe.
+            timeout: Seconds to wait for reply of host.
+        """
+        self._ttl = ttl
+        self._timeout = timeout
+        self._results: dict[tuple[str, int | None], tuple[bool, float]] = {}
+        self._probes: dict[tuple[str, int | None], asyncio.Future[bool]] = {}
+        self._icmp_permitted = True
+        self.probes_quantity = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[ttl={self._ttl}]"
+
+    async def is_reachable(self, host: str, port: int | None = None) -> bool:
+        """
+        Args:
+            host: Host to check.
+            port: TCP port. If not provided, host is checked by ICMP.
+
+        Returns:
+            Host is reachable.
+        """
+        key = (host, port)
+        cached = self._results.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        probe = self._probes.get(key)
+        if probe is None:
+            probe = self._probes[key] = asyncio.ensure_future(self._probe(host, port))
+            probe.add_done_callback(lambda _: self._probes.pop(key, None))
+        # Shielded, so cancellation of one waiter does not cancel probe for others.
+        return await asyncio.shield(probe)
+
+    def forget(self, host: str, port: int | None = None) -> None:
+        """Drops cached result. Next check probes host again."""
+        self._results.pop((host, port), None)
+
+    async def _probe(self, host: str, port: int | None) -> bool:
+        self.probes_quantity += 1
+        if port is not None:
+            result = await tcp_probe(host=host, port=port, timeout=self._timeout)
+        else:
+            result = await self._ping(host=host)
+        self._results[(host, port)] = result, time.monotonic() + self._ttl
+        _LOG.debug("Host probed", extra={"host": host, "port": port, "reachable": result})
+        return result
+
+    async def _ping(self, host: str) -> bool:
+        if self._icmp_permitted:
+            try:
+                return await icmp_ping(host=host, timeout=self._timeout)
+            except (PermissionError, NotImplementedError) as exc:
+                self._icmp_permitted = False
+                _LOG.info(
+                    "ICMP sockets not available. Using `ping` subprocess",
+                    extra={"exc": exc},
+                )
+        try:
+            return await asyncio.wait_for(
+                ping(host=host, attempts=1), timeout=self._timeout + 1
+            )
+        except asyncio.TimeoutError:
+            return False
+
+
 def serial_port_connected(serial_port: SerialPort) -> bool:
 
     serial_ports = [
@@ -0,0 +1,225 @@
+"""Binary encodings of telemetry, published to MQTT broker in per-device batches.
+
+Consumers decode payload by `decode()`. Codec is identified by the last level of
+topic (see `codec_from_topic()`).
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import TYPE_CHECKING, Any, NamedTuple, Sequence
+
+from ..schemas.mqtt import Codec
+
+if TYPE_CHECKING:
+    from ..schemas import BACnetObj
+
+try:
+    import msgpack  # type: ignore
+
+    _MSGPACK_ENABLE = True
+except ImportError:
+    _MSGPACK_ENABLE = False
+
+# object id, object type, status flags, value, timestamp (seconds since epoch).
+_STRUCT_RECORD = struct.Struct("!IBBdI")
+
+
+class TelemetryRecord(NamedTuple):
+    """Polled value of object."""
+
+    object_id: int
+    object_type: int
+    value: Any
+    status_flags: int
+    timestamp: float  # Seconds since epoch.
+
+    @classmethod
+    def from_obj(cls, obj: BACnetObj) -> TelemetryRecord:
+        return cls(
+            object_id=obj.object_id,
+            object_type=obj.object_type.value,
+            value=obj.present_value,
+            status_flags=obj.status_flags.flags,
+            timestamp=obj.updated.timestamp() if obj.updated else 0.0,
+        )
+
+
+def codec_available(codec: Codec) -> bool:
+    """Checks that dependencies of codec are installed."""
+    return codec is not Codec.MSGPACK or _MSGPACK_ENABLE
+
+
+def codec_from_topic(topic: str) -> Codec:
+    """
+    Returns:
+        Codec, identified by the last level of topic. Text codec, if not identified.
+    """
+    try:
+        return Codec(topic.rpartition("/")[2])
+    except ValueError:
+        return Codec.TEXT
+
+
+def encode(records: Sequence[TelemetryRecord], codec: Codec) -> bytes:
+    """Encodes records by binary codec.
+
+    Records are encoded as arrays `[object_id, object_type, value, status_flags,
+    timestamp]` by msgpack and CBOR. Struct codec packs value into double (non-numeric
+    values become NaN) and timestamp into whole seconds.
+    """
+    if codec is Codec.MSGPACK:
+        if not _MSGPACK_ENABLE:
+            raise NotImplementedError("Install `msgpack` to use msgpack codec")
+        return msgpack.packb([list(record) for record in records])
+    if codec is Codec.CBOR:
+        return cbor_dumps([list(record) for record in records])
+    if codec is Codec.STRUCT:
+        return b"".join(
+            _STRUCT_RECORD.pack(
+                record.object_id,
+                record.object_type,
+                record.status_flags,
+                _to_float(record.value),
+                int(record.timestamp),
+            )
+            for record in records
+        )
+    raise NotImplementedError(f"Codec {codec} is not binary")
+
+
+def decode(payload: bytes, codec: Codec) -> list[TelemetryRecord]:
+    """Decodes records, encoded by `encode()`."""
+    if codec is Codec.MSGPACK:
+        if not _MSGPACK_ENABLE:
+            raise NotImplementedError("Install `msgpack` to use msgpack codec")
+        return [TelemetryRecord(*item) for item in msgpack.unpackb(payload)]
+    if codec is Codec.CBOR:
+        return [TelemetryRecord(*item) for item in cbor_loads(payload)]
+    if codec is Codec.STRUCT:
+        return [
+            TelemetryRecord(
+                object_id=obj_id,
+                object_type=obj_type,
+                value=value,
+                status_flags=flags,
+                timestamp=float(timestamp),
+            )
+            for obj_id, obj_type, flags, value, timestamp in _STRUCT_RECORD.iter_unpack(
+                payload
+            )
+        ]
+    raise NotImplementedError(f"Codec {codec} is not binary")
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _cbor_head(major: int, argument: int) -> bytes:
+    if argument < 24:
+        return bytes((major << 5 | argument,))
+    if argument < 0x100:
+        return struct.pack("!BB", major << 5 | 24, argument)
+    if argument < 0x10000:
+        return struct.pack("!BH", major << 5 | 25, argument)
+    if argument < 0x100000000:
+        return struct.pack("!BI", major << 5 | 26, argument)
+    return struct.pack("!BQ", major << 5 | 27, argument)
+
+
+def cbor_dumps(value: Any) -> bytes:
+    """Encodes value to CBOR (RFC 8949).
+
+    Supported types: None, bool, int (64 bit), float, str, bytes, list, tuple, dict.
+    """
+    # pylint: disable=too-many-return-statements
+    if value is None:
+        return b"\xf6"
+    if value is True:
+        return b"\xf5"
+    if value is False:
+        return b"\xf4"
+    if isinstance(value, int):
+        if value >= 0:
+            return _cbor_head(0, value)
+        return _cbor_head(1, -1 - value)
+    if isinstance(value, float):
+        return b"\xfb" + struct.pack("!d", value)
+    if isinstance(value, str):
+        encoded = value.encode()
+        return _cbor_head(3, len(encoded)) + encoded
+    if isinstance(value, bytes):
+        return _cbor_head(2, len(value)) + value
+    if isinstance(value, (list, tuple)):
+        return _cbor_head(4, len(value)) + b"".join(cbor_dumps(item) for item in value)
+    if isinstance(value, dict):
+        return _cbor_head(5, len(value)) + b"".join(
+            cbor_dumps(key) + cbor_dumps(item) for key, item in value.items()
+        )
+    raise TypeError(f"Type {type(value)} is not supported by CBOR encoder")
+
+
+def cbor_loads(data: bytes) -> Any:
+    """Decodes CBOR, encoded by `cbor_dumps()`."""
+    value, offset = _cbor_item(data=data, offset=0)
+    if offset != len(data):
+        raise ValueError("Extra data after CBOR item")
+    return value
+
+
+def _cbor_item(data: bytes, offset: int) -> tuple[Any, int]:
+    # pylint: disable=too-many-return-statements
+    initial = data[offset]
+    major, info = initial >> 5, initial & 0x1F
+    offset += 1
+
+    if major == 7:
+        if info == 20:
+            return False, offset
+        if info == 21:
+            return True, offset
+        if info == 22:
+            return None, offset
+        if info == 25:
+            return struct.unpack_from("!e", data, offset)[0], offset + 2
+        if info == 26:
+            return struct.unpack_from("!f", data, offset)[0], offset + 4
+        if info == 27:
+            return struct.unpack_from("!d", data, offset)[0], offset + 8
+        raise ValueError(f"Unsupported CBOR simple value: {info}")
+
+    if info < 24:
+        argument = info
+    elif 24 <= info <= 27:
+        end = offset + (1 << (info - 24))
+        argument = int.from_bytes(data[offset:end], "big")
+        offset = end
+    else:
+        raise ValueError(f"Unsupported CBOR additional information: {info}")
+
+    if major == 0:
+        return argument, offset
+    if major == 1:
+        return -1 - argument, offset
+    if major in {2, 3}:
+        end = offset + argument
+        raw = data[offset:end]
+        return (raw if major == 2 else raw.decode()), end
+    if major == 4:
+        items = []
+        for _ in range(argument):
+            item, offset = _cbor_item(data=data, offset=offset)
+            items.append(item)
+        return items, offset
+    if major == 5:
+        mapping = {}
+        for _ in range(argument):
+            key, offset = _cbor_item(data=data, offset=offset)
+            mapping[key], offset = _cbor_item(data=data, offset=offset)
+        return mapping, offset
+    raise ValueError(f"Unsupported CBOR major type: {major}")